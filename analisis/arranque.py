@@ -0,0 +1,123 @@
+# Medición del tiempo de arranque de la aplicación
+# analisis/arranque.py
+#
+# Uso:
+#   python -m analisis.arranque                  # tiempos por fase, mediana de 5 arranques
+#   python -m analisis.arranque --importtime     # además, los imports más costosos de main
+#   python -m analisis.arranque --json informe.json
+#
+# Cada arranque se mide en un proceso nuevo (sin módulos ya importados). Las fases son:
+# importar main, crear y dibujar la ventana (solo si hay pantalla) y obtener el primer
+# resultado de un ciclo, que incluye importar CoolProp si la ventana no lo ha precalentado.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from ciclos.registro import parametros_por_defecto
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Ciclo y parámetros del primer cálculo medido (los valores por defecto de su formulario)
+CICLO_PRUEBA = "Rankine Simple"
+PARAMETROS_PRUEBA = parametros_por_defecto(CICLO_PRUEBA)
+
+# Programa que se ejecuta en cada proceso medido; escribe las fases como JSON
+_PROGRAMA = """
+import json, sys, time
+inicio = time.perf_counter()
+import main
+fases = {'importar_main_s': time.perf_counter() - inicio, 'coolprop_al_importar': 'CoolProp' in sys.modules}
+ciclo, parametros = sys.argv[1], json.loads(sys.argv[2])
+try:
+    import tkinter as tk
+    raiz = tk.Tk()
+except Exception:
+    raiz = None
+if raiz is not None:
+    app = main.SimuladorCiclosApp(raiz)
+    raiz.update()
+    fases['ventana_s'] = time.perf_counter() - inicio
+    calculo = time.perf_counter()
+    app.ejecutor.submit(app.calcular_ciclo, ciclo, parametros).result()
+    fases['primer_calculo_s'] = time.perf_counter() - calculo
+    raiz.destroy()
+else:
+    from ciclos.registro import CICLOS_DISPONIBLES
+    calculo = time.perf_counter()
+    CICLOS_DISPONIBLES[ciclo]['clase']().calcular(parametros)
+    fases['primer_calculo_s'] = time.perf_counter() - calculo
+fases['total_s'] = time.perf_counter() - inicio
+print(json.dumps(fases))
+"""
+
+def medir_proceso(ciclo=CICLO_PRUEBA, parametros=PARAMETROS_PRUEBA):
+    """
+    Arrancar un proceso nuevo y medir sus fases
+    Returns:
+        {'importar_main_s', 'coolprop_al_importar', 'ventana_s' (si hay pantalla),
+         'primer_calculo_s', 'total_s', 'proceso_s'}; proceso_s incluye el arranque del intérprete
+    """
+    inicio = time.perf_counter()
+    salida = subprocess.run([sys.executable, "-c", _PROGRAMA, ciclo, json.dumps(parametros)],
+                            cwd=RAIZ, capture_output=True, text=True)
+    duracion = time.perf_counter() - inicio
+    if salida.returncode != 0:
+        raise RuntimeError(f"El proceso de arranque falló:\n{salida.stderr.strip()}")
+    fases = json.loads(salida.stdout.strip().splitlines()[-1])
+    fases['proceso_s'] = duracion
+    return fases
+
+def medir(repeticiones=5, ciclo=CICLO_PRUEBA, parametros=PARAMETROS_PRUEBA):
+    """Mediana de cada fase en varios arranques"""
+    muestras = [medir_proceso(ciclo, parametros) for _ in range(repeticiones)]
+    resumen = {'repeticiones': repeticiones, 'coolprop_al_importar': muestras[0]['coolprop_al_importar']}
+    for fase in muestras[0]:
+        if fase.endswith("_s"):
+            resumen[fase] = statistics.median(m[fase] for m in muestras)
+    return resumen
+
+def informe_importtime(modulo="main", n=15):
+    """
+    Imports más costosos de un módulo según python -X importtime
+    Returns:
+        Lista de {'modulo', 'propio_ms', 'acumulado_ms'} de mayor a menor tiempo acumulado
+    """
+    salida = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+                            cwd=RAIZ, capture_output=True, text=True)
+    filas = []
+    for linea in salida.stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, acumulado, nombre = (parte.strip() for parte in linea[len("import time:"):].split("|"))
+        filas.append({'modulo': nombre, 'propio_ms': int(propio) / 1000, 'acumulado_ms': int(acumulado) / 1000})
+    filas.sort(key=lambda fila: fila['acumulado_ms'], reverse=True)
+    return filas[:n]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m analisis.arranque",
+                                     description="Medir el tiempo de arranque de la aplicación")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Arranques medidos")
+    parser.add_argument("--importtime", action="store_true", help="Mostrar los imports más costosos de main")
+    parser.add_argument("--json", help="Guardar el informe en este fichero")
+    args = parser.parse_args(argv)
+
+    informe = {'fases': medir(args.repeticiones)}
+    for fase, valor in informe['fases'].items():
+        texto = f"{valor * 1000:10.1f} ms" if fase.endswith("_s") else f"{valor!s:>13}"
+        print(f"{fase:<22} {texto}")
+    if args.importtime:
+        informe['importtime'] = informe_importtime()
+        print(f"\n{'módulo':<40} {'propio ms':>10} {'acumulado ms':>13}")
+        for fila in informe['importtime']:
+            print(f"{fila['modulo'][:40]:<40} {fila['propio_ms']:>10.1f} {fila['acumulado_ms']:>13.1f}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(informe, f, ensure_ascii=False, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# Barridos paramétricos de ciclos en paralelo
+# analisis/barrido.py
+import itertools
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from ciclos.registro import obtener_funcion
+
+def expandir_malla(rangos, metodo="cartesiano", n_muestras=None, semilla=None):
+    """
+    Generar los puntos del barrido
+    Args:
+        rangos: Con metodo "cartesiano", {parametro: lista de valores};
+                con metodo "lhs", {parametro: (minimo, maximo)}
+        metodo: "cartesiano" (producto de todos los valores) o "lhs" (hipercubo latino)
+        n_muestras: Número de puntos para "lhs"
+        semilla: Semilla del generador aleatorio para "lhs"
+    Returns:
+        Lista de diccionarios {parametro: valor}
+    """
+    nombres = list(rangos)
+    if metodo == "cartesiano":
+        return [dict(zip(nombres, valores))
+                for valores in itertools.product(*(list(rangos[n]) for n in nombres))]
+    if metodo == "lhs":
+        if not n_muestras or n_muestras < 1:
+            raise ValueError("El hipercubo latino necesita n_muestras >= 1")
+        generador = random.Random(semilla)
+        columnas = {}
+        for nombre in nombres:
+            minimo, maximo = rangos[nombre]
+            # Un punto aleatorio en cada uno de los n estratos, con los estratos barajados
+            estratos = list(range(n_muestras))
+            generador.shuffle(estratos)
+            columnas[nombre] = [minimo + (maximo - minimo) * (k + generador.random()) / n_muestras
+                                for k in estratos]
+        return [{nombre: columnas[nombre][i] for nombre in nombres} for i in range(n_muestras)]
+    raise ValueError(f"Método de muestreo '{metodo}' no soportado. Opciones: cartesiano, lhs")
+
+def inicializar_trabajador():
+    """Calentar en cada proceso los AbstractState de los fluidos usados por los ciclos"""
+    from util.propiedades import PropiedadesTermodinamicas
+
+    for fluido in ("Water", "Air"):
+        PropiedadesTermodinamicas(fluido).propiedades_estado(p_bar=1.01325, t_c=25)
+
+def evaluar_bloque(ciclo, parametros_base, puntos):
+    """Evaluar una lista de puntos; devuelve [(resultados numéricos, error)] en el mismo orden"""
+    funcion = obtener_funcion(ciclo)
+    salida = []
+    for punto in puntos:
+        try:
+            resultado = funcion({**parametros_base, **punto})
+            salida.append((resultado.a_dict(), None))
+        except Exception as e:
+            salida.append(({}, str(e)))
+    return salida
+
+def _bloques(puntos, tam_bloque):
+    return [puntos[i:i + tam_bloque] for i in range(0, len(puntos), tam_bloque)]
+
+def barrer(ciclo, parametros_base, rangos, metodo="cartesiano", n_muestras=None, semilla=None,
+           procesos=None, tam_bloque=None):
+    """
+    Ejecutar un barrido paramétrico de un ciclo
+    Args:
+        ciclo: Nombre registrado en CICLOS_DISPONIBLES o función calcular de un módulo de ciclos
+        parametros_base: Parámetros fijos del ciclo
+        rangos, metodo, n_muestras, semilla: Ver expandir_malla
+        procesos: Procesos de trabajo (por defecto os.cpu_count(); 1 = en este proceso)
+        tam_bloque: Puntos por tarea enviada a cada proceso (por defecto ~4 bloques por proceso)
+    Returns:
+        Tabla columnar {columna: lista} con los parámetros barridos, los resultados numéricos
+        y una columna 'error' (None si el punto se calculó bien); admite pandas.DataFrame(tabla)
+    """
+    puntos = expandir_malla(rangos, metodo, n_muestras, semilla)
+    procesos = procesos or os.cpu_count() or 1
+    if not puntos:
+        return {nombre: [] for nombre in list(rangos) + ['error']}
+    tam_bloque = tam_bloque or max(1, math.ceil(len(puntos) / (procesos * 4)))
+    bloques = _bloques(puntos, tam_bloque)
+
+    if procesos == 1:
+        inicializar_trabajador()
+        evaluados = [evaluar_bloque(ciclo, parametros_base, bloque) for bloque in bloques]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=inicializar_trabajador) as ejecutor:
+            evaluados = list(ejecutor.map(evaluar_bloque, itertools.repeat(ciclo),
+                                          itertools.repeat(parametros_base), bloques))
+
+    filas = [fila for bloque in evaluados for fila in bloque]
+    columnas_resultado = []
+    for resultados, _ in filas:
+        for clave in resultados:
+            if clave not in columnas_resultado:
+                columnas_resultado.append(clave)
+
+    tabla = {nombre: [punto[nombre] for punto in puntos] for nombre in rangos}
+    for clave in columnas_resultado:
+        tabla[clave] = [resultados.get(clave) for resultados, _ in filas]
+    tabla['error'] = [error for _, error in filas]
+    return tabla
@@ -0,0 +1,236 @@
+# Medición de rendimiento de propiedades y ciclos con comparación contra una referencia
+# analisis/benchmark.py
+#
+# Uso:
+#   python -m analisis.benchmark --guardar referencia.json
+#   python -m analisis.benchmark --comparar referencia.json --umbral 0.25
+#
+# Con --comparar el proceso termina con código 1 si alguna métrica es más lenta que la
+# referencia en más del umbral (fracción relativa sobre la mediana de latencia).
+import argparse
+import json
+import platform
+import sys
+import time
+
+from util.propiedades import PropiedadesTermodinamicas, cache_propiedades
+from ciclos.registro import CICLOS_DISPONIBLES, parametros_por_defecto
+
+VERSION_INFORME = 1
+
+# Estados representativos por fluido y par de entrada (argumentos de propiedades_estado)
+ESTADOS_PRUEBA = {
+    "Water": {
+        "pt": {'p_bar': 80, 't_c': 500},
+        "ph": {'p_bar': 0.08, 'h_kjkg': 2300},
+        "ps": {'p_bar': 0.08, 's_kjkgK': 6.7},
+        "px": {'p_bar': 0.08, 'x': 0.0},
+        "tx": {'t_c': 100, 'x': 1.0},
+    },
+    "Air": {
+        "pt": {'p_bar': 1.01325, 't_c': 25},
+        "ph": {'p_bar': 10, 'h_kjkg': 700},
+        "ps": {'p_bar': 10, 's_kjkgK': 3.88},
+    },
+}
+
+# Cada ciclo registrado con los valores por defecto de su esquema (los del formulario)
+CASOS_CICLOS = {nombre: parametros_por_defecto(nombre) for nombre in CICLOS_DISPONIBLES}
+
+# Barridos en pasos pequeños de presión para comparar flashes inversos en frío y en caliente:
+# fluido -> (presiones inicial y final [bar], puntos, {par: argumentos fijos})
+BARRIDOS_ARRANQUE = {
+    "Water": ((60, 100), 32, {"ps": {'s_kjkgK': 6.7}, "ph": {'h_kjkg': 3300}}),
+    "Air": ((5, 15), 32, {"ps": {'s_kjkgK': 3.9}, "ph": {'h_kjkg': 700}}),
+}
+
+# Malla del barrido de referencia (Rankine Simple)
+MALLA_BARRIDO = {'p_alta': [20, 40, 60, 80, 100, 120], 't_max': [400, 450, 500, 550, 600]}
+
+def _percentil(ordenados, q):
+    indice = min(len(ordenados) - 1, max(0, round(q * (len(ordenados) - 1))))
+    return ordenados[indice]
+
+def medir(funcion, repeticiones, preparar=None):
+    """
+    Medir la latencia de funcion() llamada repeticiones veces
+    Args:
+        preparar: Función opcional ejecutada antes de cada llamada, fuera de la medición
+    Returns:
+        {'llamadas_s', 'p50_us', 'p99_us', 'repeticiones'}
+    """
+    latencias = []
+    reloj = time.perf_counter_ns
+    for _ in range(repeticiones):
+        if preparar is not None:
+            preparar()
+        inicio = reloj()
+        funcion()
+        latencias.append(reloj() - inicio)
+    latencias.sort()
+    total = sum(latencias) or 1
+    return {
+        'llamadas_s': repeticiones * 1e9 / total,
+        'p50_us': _percentil(latencias, 0.50) / 1000,
+        'p99_us': _percentil(latencias, 0.99) / 1000,
+        'repeticiones': repeticiones,
+    }
+
+def medir_propiedades(repeticiones=200):
+    """
+    Por fluido y par: llamadas frías (caché vacía, flash de CoolProp desde cero, sin tabla de
+    saturación ni arranque en caliente), calientes (acierto de caché) y, en los pares que la
+    usan, servidas por la tabla de saturación sin caché
+    """
+    metricas = {}
+    for fluido, pares in ESTADOS_PRUEBA.items():
+        frio = PropiedadesTermodinamicas(fluido, arranque_caliente=False, tabla_saturacion=False)
+        pt = PropiedadesTermodinamicas(fluido)
+        tabla = PropiedadesTermodinamicas(fluido, cache=None, arranque_caliente=False)
+        for par, argumentos in pares.items():
+            llamada = lambda: frio.propiedades_estado(**argumentos)
+            metricas[f"propiedades/{fluido}/{par}/frio"] = medir(llamada, repeticiones,
+                                                                 preparar=cache_propiedades.limpiar)
+            llamada = lambda: pt.propiedades_estado(**argumentos)
+            llamada()
+            metricas[f"propiedades/{fluido}/{par}/caliente"] = medir(llamada, repeticiones)
+            llamada = lambda: tabla.propiedades_estado(**argumentos)
+            llamada()  # La tabla se construye en la primera llamada
+            if tabla.origen == "tabla_saturacion":
+                metricas[f"propiedades/{fluido}/{par}/tabla_saturacion"] = medir(llamada, repeticiones)
+    return metricas
+
+def medir_arranque(repeticiones=20):
+    """
+    Barridos de flashes (p, s) y (p, h) en pasos pequeños de presión, sin caché, en frío
+    (cada flash empieza de cero) y en caliente (desde la solución del punto anterior)
+    """
+    metricas = {}
+    for fluido, ((p_ini, p_fin), n, pares) in BARRIDOS_ARRANQUE.items():
+        presiones = [p_ini + (p_fin - p_ini) * k / (n - 1) for k in range(n)]
+        for par, fijos in pares.items():
+            for modo, caliente in (("frio", False), ("caliente", True)):
+                pt = PropiedadesTermodinamicas(fluido, cache=None, arranque_caliente=caliente)
+                barrido = lambda: [pt.propiedades_estado(p_bar=p, **fijos) for p in presiones]
+                barrido()
+                # set_fluido descarta las soluciones recordadas: cada barrido empieza en frío
+                metrica = medir(barrido, repeticiones, preparar=lambda: pt.set_fluido(fluido))
+                metrica['puntos_s'] = metrica['llamadas_s'] * n
+                metricas[f"arranque/{fluido}/{par}/{modo}"] = metrica
+    return metricas
+
+def medir_ciclos(repeticiones=50):
+    """
+    Resolución completa de cada ciclo con los valores por defecto de la interfaz y, en los
+    ciclos de aire, también con el modelo de gas ideal (sin reutilizar los estados del grafo)
+    """
+    metricas = {}
+    for nombre, parametros in CASOS_CICLOS.items():
+        funcion = CICLOS_DISPONIBLES[nombre]["funcion"]
+        llamada = lambda: funcion(dict(parametros))
+        metricas[f"ciclo/{nombre}/frio"] = medir(llamada, repeticiones, preparar=cache_propiedades.limpiar)
+        metricas[f"ciclo/{nombre}/caliente"] = medir(llamada, repeticiones)
+        clase = CICLOS_DISPONIBLES[nombre]["clase"]
+        if getattr(clase, "FLUIDO", None) == "Air":
+            instancia = clase(PropiedadesTermodinamicas("Air", "gas_ideal"))
+            metricas[f"ciclo/{nombre}/gas_ideal"] = medir(lambda: instancia.calcular(dict(parametros)),
+                                                          repeticiones, preparar=instancia.grafo.olvidar)
+    return metricas
+
+def medir_barrido(repeticiones=3):
+    """Barrido de Rankine Simple punto a punto y con el solver por lotes"""
+    from analisis.barrido import barrer
+    from ciclos import rankine
+
+    base = dict(CASOS_CICLOS["Rankine Simple"])
+    for nombre in MALLA_BARRIDO:
+        base.pop(nombre)
+    n_puntos = len(MALLA_BARRIDO['p_alta']) * len(MALLA_BARRIDO['t_max'])
+
+    metricas = {}
+    punto_a_punto = medir(lambda: barrer("Rankine Simple", base, MALLA_BARRIDO, procesos=1),
+                          repeticiones, preparar=cache_propiedades.limpiar)
+    metricas["barrido/Rankine Simple/punto_a_punto"] = punto_a_punto
+
+    import numpy as np
+    p_alta = np.array(MALLA_BARRIDO['p_alta'], dtype=float)[:, None]
+    t_max = np.array(MALLA_BARRIDO['t_max'], dtype=float)[None, :]
+    metricas["barrido/Rankine Simple/lote"] = medir(
+        lambda: rankine.calcular_lote(p_alta, base['p_baja'], t_max), repeticiones)
+
+    for metrica in metricas.values():
+        metrica['puntos_s'] = metrica['llamadas_s'] * n_puntos
+    return metricas
+
+def ejecutar(repeticiones_propiedades=200, repeticiones_ciclos=50, repeticiones_barrido=3,
+             repeticiones_arranque=20):
+    """Ejecutar todas las mediciones y devolver el informe"""
+    import CoolProp
+
+    metricas = {}
+    metricas.update(medir_propiedades(repeticiones_propiedades))
+    metricas.update(medir_arranque(repeticiones_arranque))
+    metricas.update(medir_ciclos(repeticiones_ciclos))
+    metricas.update(medir_barrido(repeticiones_barrido))
+    return {
+        'version': VERSION_INFORME,
+        'entorno': {
+            'python': platform.python_version(),
+            'coolprop': CoolProp.__version__,
+            'plataforma': platform.platform(),
+        },
+        'metricas': metricas,
+    }
+
+def comparar(informe, referencia, umbral=0.25):
+    """
+    Comparar un informe con la referencia
+    Returns:
+        Lista de (métrica, p50 de referencia, p50 actual, variación relativa) de las regresiones
+    """
+    regresiones = []
+    for nombre, actual in informe['metricas'].items():
+        base = referencia.get('metricas', {}).get(nombre)
+        if base is None:
+            continue
+        variacion = actual['p50_us'] / base['p50_us'] - 1 if base['p50_us'] else 0.0
+        if variacion > umbral:
+            regresiones.append((nombre, base['p50_us'], actual['p50_us'], variacion))
+    return regresiones
+
+def _imprimir(informe, salida):
+    print(f"{'métrica':<55} {'llamadas/s':>12} {'p50 µs':>10} {'p99 µs':>10}", file=salida)
+    for nombre, m in informe['metricas'].items():
+        print(f"{nombre:<55} {m['llamadas_s']:>12.1f} {m['p50_us']:>10.1f} {m['p99_us']:>10.1f}", file=salida)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m analisis.benchmark",
+                                     description="Medir el rendimiento de propiedades y ciclos")
+    parser.add_argument("--guardar", help="Guardar el informe como referencia JSON")
+    parser.add_argument("--comparar", help="Referencia JSON contra la que comparar")
+    parser.add_argument("--umbral", type=float, default=0.25,
+                        help="Empeoramiento relativo tolerado de la mediana (0.25 = 25%%)")
+    parser.add_argument("--repeticiones", type=int, default=200,
+                        help="Repeticiones por métrica de propiedades (los ciclos usan 1/4)")
+    args = parser.parse_args(argv)
+
+    informe = ejecutar(args.repeticiones, max(1, args.repeticiones // 4))
+    _imprimir(informe, sys.stdout)
+
+    if args.guardar:
+        with open(args.guardar, "w", encoding="utf-8") as f:
+            json.dump(informe, f, indent=2, ensure_ascii=False)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            referencia = json.load(f)
+        regresiones = comparar(informe, referencia, args.umbral)
+        for nombre, base, actual, variacion in regresiones:
+            print(f"REGRESIÓN {nombre}: p50 {base:.1f} µs -> {actual:.1f} µs (+{variacion:.0%})",
+                  file=sys.stderr)
+        if regresiones:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,472 @@
+# Propagación de incertidumbre por Monte Carlo
+# analisis/incertidumbre.py
+#
+# Uso:
+#   python -m analisis.incertidumbre --ciclo "Rankine Simple" --base p_alta=80 p_baja=0.08 t_max=500 \
+#       --incierto rendimiento_turbina=normal:0.85:0.02:0:1 rendimiento_bomba=uniforme:0.7:0.8 \
+#       --tolerancia 0.002 --vectorizado
+#   python -m analisis.incertidumbre --ciclo "Brayton con Recalentamiento" --base t_max=950 t_recal=950 \
+#       --incierto rendimiento_compresor=triangular:0.8:0.85:0.88 p_loss=uniforme:3:7 t1=normal:15:8
+#
+# Los parámetros inciertos se muestrean por lotes (NumPy) y cada lote se evalúa de una vez,
+# con la función vectorizada del ciclo si la tiene (calcular_lote) o repartido entre
+# procesos. Media, varianza y percentiles de cada resultado se actualizan en línea tras
+# cada lote, sin guardar las muestras, y el muestreo se detiene cuando la media y los
+# percentiles se han estabilizado dentro de la tolerancia pedida.
+import argparse
+import inspect
+import json
+import math
+import os
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+from analisis.barrido import inicializar_trabajador, evaluar_bloque
+from ciclos.registro import CICLOS_DISPONIBLES
+
+DISTRIBUCIONES = ("normal", "uniforme", "triangular", "lognormal")
+PERCENTILES = (5, 50, 95)
+
+class Distribucion:
+    """
+    Distribución de un parámetro incierto
+    Args:
+        tipo: "normal" (media, desviación[, mínimo, máximo]), "uniforme" (mínimo, máximo),
+              "triangular" (mínimo, moda, máximo) o "lognormal" (media, desviación de la
+              variable, no de su logaritmo)
+        argumentos: Valores de la distribución en ese orden. La normal con límites se trunca
+                    (p. ej. un rendimiento entre 0 y 1)
+    """
+
+    def __init__(self, tipo, *argumentos):
+        numeros = {"normal": (2, 4), "uniforme": (2,), "triangular": (3,), "lognormal": (2,)}
+        if tipo not in numeros:
+            raise ValueError(f"Distribución '{tipo}' no soportada. Opciones: {', '.join(DISTRIBUCIONES)}")
+        if len(argumentos) not in numeros[tipo]:
+            raise ValueError(f"La distribución {tipo} necesita {' o '.join(map(str, numeros[tipo]))} valores")
+        self.tipo = tipo
+        self.argumentos = tuple(float(a) for a in argumentos)
+        if tipo in ("normal", "lognormal") and self.argumentos[1] < 0:
+            raise ValueError(f"Desviación negativa en la distribución {tipo}")
+        if tipo == "normal" and len(self.argumentos) == 4 and not self.argumentos[2] < self.argumentos[3]:
+            raise ValueError("Límites inválidos: el mínimo debe ser menor que el máximo")
+        if tipo == "uniforme" and not self.argumentos[0] < self.argumentos[1]:
+            raise ValueError("Límites inválidos: el mínimo debe ser menor que el máximo")
+        if tipo == "triangular" and not self.argumentos[0] <= self.argumentos[1] <= self.argumentos[2]:
+            raise ValueError("La distribución triangular necesita mínimo <= moda <= máximo")
+        if tipo == "lognormal" and self.argumentos[0] <= 0:
+            raise ValueError("La distribución lognormal necesita una media positiva")
+
+    @classmethod
+    def desde_texto(cls, texto):
+        """Distribución a partir de "tipo:valor:valor..." (p. ej. "normal:0.85:0.02:0:1")"""
+        tipo, *valores = texto.split(":")
+        try:
+            return cls(tipo.strip().lower(), *(float(v) for v in valores))
+        except ValueError as e:
+            raise ValueError(f"Distribución inválida '{texto}': {str(e)}")
+
+    def muestrear(self, generador, n):
+        """n muestras como array de NumPy"""
+        a = self.argumentos
+        if self.tipo == "uniforme":
+            return generador.uniform(a[0], a[1], n)
+        if self.tipo == "triangular":
+            if a[0] == a[2]:
+                return generador.uniform(a[0], a[0], n)
+            return generador.triangular(a[0], a[1], a[2], n)
+        if self.tipo == "lognormal":
+            sigma2 = math.log1p((a[1] / a[0]) ** 2)
+            return generador.lognormal(math.log(a[0]) - sigma2 / 2, math.sqrt(sigma2), n)
+        muestras = generador.normal(a[0], a[1], n)
+        if len(a) == 4:
+            # Truncada: se vuelven a muestrear los valores fuera de los límites
+            fuera = (muestras < a[2]) | (muestras > a[3])
+            for _ in range(1000):
+                if not fuera.any():
+                    break
+                muestras[fuera] = generador.normal(a[0], a[1], int(fuera.sum()))
+                fuera = (muestras < a[2]) | (muestras > a[3])
+            else:
+                raise ValueError("La normal truncada apenas tiene probabilidad dentro de sus límites")
+        return muestras
+
+    def __repr__(self):
+        return f"{self.tipo}:{':'.join(f'{v:g}' for v in self.argumentos)}"
+
+class Momentos:
+    """Media y varianza en línea (Welford), actualizadas con lotes completos (fórmula de Chan)"""
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self._m2 = 0.0
+
+    def agregar(self, valores):
+        n_lote = len(valores)
+        if n_lote == 0:
+            return
+        media_lote = float(valores.mean())
+        m2_lote = float(((valores - media_lote) ** 2).sum())
+        n = self.n + n_lote
+        delta = media_lote - self.media
+        self.media += delta * n_lote / n
+        self._m2 += m2_lote + delta * delta * self.n * n_lote / n
+        self.n = n
+
+    @property
+    def varianza(self):
+        """Varianza muestral (n - 1)"""
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def desviacion(self):
+        return math.sqrt(self.varianza)
+
+class CuantilP2:
+    """
+    Estimación en línea de un cuantil con el algoritmo P² (Jain y Chlamtac, 1985):
+    cinco marcadores cuyas alturas se ajustan por interpolación parabólica, con memoria
+    constante e independiente del número de muestras.
+    Args:
+        p: Cuantil (0-1)
+    """
+
+    def __init__(self, p):
+        self.p = p
+        self.n = 0
+        self._alturas = []
+        self._posiciones = [0, 1, 2, 3, 4]
+        self._deseadas = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self._incrementos = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def agregar(self, x):
+        self.n += 1
+        q = self._alturas
+        if self.n <= 5:
+            q.append(x)
+            q.sort()
+            return
+        n = self._posiciones
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            n[i] += 1
+        deseadas = self._deseadas
+        for i in range(5):
+            deseadas[i] += self._incrementos[i]
+
+        for i in (1, 2, 3):
+            d = deseadas[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                parabolica = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if q[i - 1] < parabolica < q[i + 1]:
+                    q[i] = parabolica
+                else:
+                    q[i] = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    @property
+    def valor(self):
+        if self.n == 0:
+            return math.nan
+        if self.n <= 5:
+            # Con pocas muestras, cuantil exacto por interpolación lineal
+            posicion = self.p * (self.n - 1)
+            i = min(int(posicion), self.n - 2) if self.n > 1 else 0
+            if self.n == 1:
+                return self._alturas[0]
+            return self._alturas[i] + (posicion - i) * (self._alturas[i + 1] - self._alturas[i])
+        return self._alturas[2]
+
+class Estadistica:
+    """Momentos y percentiles en línea de un resultado"""
+
+    def __init__(self, percentiles=PERCENTILES):
+        self.momentos = Momentos()
+        self.cuantiles = {p: CuantilP2(p / 100) for p in percentiles}
+
+    def agregar(self, valores):
+        self.momentos.agregar(valores)
+        for cuantil in self.cuantiles.values():
+            agregar = cuantil.agregar
+            for valor in valores.tolist():
+                agregar(valor)
+
+    def resumen(self, z):
+        momentos = self.momentos
+        fila = {
+            'media': momentos.media,
+            'desviacion': momentos.desviacion,
+            'semiancho_media': z * momentos.desviacion / math.sqrt(momentos.n) if momentos.n else math.inf,
+        }
+        for p, cuantil in self.cuantiles.items():
+            fila[f'P{p}'] = cuantil.valor
+        return fila
+
+# Parámetros del esquema que calcular_lote recibe con otro nombre
+NOMBRES_LOTE = {'tipos_calentadores': 'tipos'}
+
+def _columna_lista(valor):
+    """
+    Valor de un parámetro con un elemento por calentador (p. ej. p_extraccion) en la forma de
+    calcular_lote, con los calentadores en el último eje: una columna de muestras es un solo
+    calentador y un texto separado por comas, uno por elemento
+    """
+    import numpy as np
+
+    if isinstance(valor, str):
+        return [parte.strip() for parte in valor.split(",") if parte.strip()]
+    if isinstance(valor, np.ndarray):
+        return valor[..., None]
+    return valor if isinstance(valor, (list, tuple)) else [valor]
+
+def funcion_lote_ciclo(ciclo, parametros=None):
+    """
+    Función vectorizada {parametro: array} -> {resultado: array} a partir del calcular_lote
+    registrado para el ciclo, o None si el ciclo no tiene versión por lotes. Los nombres del
+    esquema se traducen a los de calcular_lote (NOMBRES_LOTE) y los parámetros con un valor
+    por calentador se pasan con los calentadores en el último eje.
+    Args:
+        parametros: Nombres de los parámetros que se van a pasar (fijos e inciertos). Si
+                    calcular_lote no admite alguno (p. ej. potencia en Rankine Simple) se
+                    devuelve None con un aviso: omitirlo cambiaría los resultados
+    La función devuelta lanza ValueError ante un parámetro que calcular_lote no admite, de
+    modo que el evaluador recurre al cálculo punto a punto en lugar de ignorarlo.
+    """
+    lote = CICLOS_DISPONIBLES.get(ciclo, {}).get("lote") if isinstance(ciclo, str) else None
+    if lote is None:
+        return None
+    aceptados = set(inspect.signature(lote).parameters)
+    listas = {parametro.nombre for parametro in CICLOS_DISPONIBLES[ciclo]["parametros"] if parametro.lista}
+    rechazados = sorted(nombre for nombre in parametros or ()
+                        if NOMBRES_LOTE.get(nombre, nombre) not in aceptados)
+    if rechazados:
+        warnings.warn(f"La versión por lotes de '{ciclo}' no admite {', '.join(rechazados)}; "
+                      f"se evalúa punto a punto")
+        return None
+
+    def funcion(columnas):
+        argumentos = {NOMBRES_LOTE.get(nombre, nombre): _columna_lista(valor) if nombre in listas else valor
+                      for nombre, valor in columnas.items()}
+        sobrantes = sorted(set(argumentos) - aceptados)
+        if sobrantes:
+            raise ValueError(f"calcular_lote no admite {', '.join(sobrantes)}")
+        return lote(**argumentos)
+    return funcion
+
+class _EvaluadorLotes:
+    """Evalúa lotes de muestras con la función vectorizada o repartidos entre procesos"""
+
+    def __init__(self, ciclo, parametros_base, salidas, procesos, funcion_lote):
+        self.ciclo = ciclo
+        self.parametros_base = parametros_base
+        self.salidas = salidas
+        self.procesos = procesos
+        self.funcion_lote = funcion_lote
+        self._ejecutor = None
+
+    def __enter__(self):
+        if self.procesos > 1 and self.funcion_lote is None:
+            self._ejecutor = ProcessPoolExecutor(max_workers=self.procesos, initializer=inicializar_trabajador)
+        else:
+            inicializar_trabajador()
+        return self
+
+    def __exit__(self, *_):
+        if self._ejecutor is not None:
+            self._ejecutor.shutdown()
+            self._ejecutor = None
+
+    def evaluar(self, muestras, n):
+        """
+        Args:
+            muestras: {parametro: array de n valores}
+        Returns:
+            {salida: array de n valores, NaN donde el punto no se pudo calcular}
+        """
+        import numpy as np
+
+        if self.funcion_lote is not None:
+            columnas = {**{nombre: np.full(n, valor) if isinstance(valor, (int, float)) else valor
+                           for nombre, valor in self.parametros_base.items()}, **muestras}
+            try:
+                resultado = self.funcion_lote(columnas)
+                return {salida: np.broadcast_to(np.asarray(resultado[salida], dtype=float), (n,)).copy()
+                        for salida in self.salidas}
+            except (ValueError, KeyError):
+                # Algún punto inválido hace fallar el lote entero: se evalúa punto a punto
+                pass
+
+        puntos = [{nombre: float(valores[i]) for nombre, valores in muestras.items()} for i in range(n)]
+        if self._ejecutor is None:
+            filas = evaluar_bloque(self.ciclo, self.parametros_base, puntos)
+        else:
+            tam_bloque = max(1, math.ceil(n / (self.procesos * 2)))
+            bloques = [puntos[i:i + tam_bloque] for i in range(0, n, tam_bloque)]
+            filas = [fila for bloque in self._ejecutor.map(
+                evaluar_bloque, [self.ciclo] * len(bloques), [self.parametros_base] * len(bloques), bloques)
+                for fila in bloque]
+        return {salida: np.array([resultados.get(salida, math.nan) if error is None else math.nan
+                                  for resultados, error in filas], dtype=float)
+                for salida in self.salidas}
+
+def muestrear(ciclo, parametros_base, inciertos, salidas=("Eficiencia térmica", "Potencia neta"),
+              tolerancia=1e-3, confianza=0.95, tam_lote=1000, min_muestras=2000, max_muestras=200000,
+              semilla=None, procesos=None, funcion_lote=None):
+    """
+    Propagar la incertidumbre de los parámetros a los resultados de un ciclo, lote a lote
+    Args:
+        ciclo: Nombre registrado en CICLOS_DISPONIBLES o función calcular de un módulo de ciclos
+        parametros_base: Parámetros fijos del ciclo
+        inciertos: {parametro: Distribucion}
+        salidas: Resultados de los que se calculan las estadísticas
+        tolerancia: Precisión relativa pedida: el semiancho del intervalo de confianza de la
+                    media y la variación de los percentiles en el último lote deben quedar por
+                    debajo de tolerancia * |media| en todas las salidas
+        confianza: Nivel del intervalo de confianza de la media
+        tam_lote: Muestras por lote
+        min_muestras, max_muestras: Límites del número de muestras
+        semilla: Semilla del generador aleatorio
+        procesos: Procesos de trabajo (por defecto os.cpu_count(); 1 = en este proceso)
+        funcion_lote: Alternativa vectorizada al ciclo (ver funcion_lote_ciclo); se evalúa
+                      en este proceso
+    Yields:
+        Tras cada lote, {'muestras', 'errores', 'convergido', 'salidas': {salida: {'media',
+        'desviacion', 'semiancho_media', 'P5', 'P50', 'P95'}}}
+    """
+    import numpy as np
+
+    if not inciertos:
+        raise ValueError("No hay parámetros inciertos que muestrear")
+    if tolerancia <= 0 or not 0 < confianza < 1:
+        raise ValueError("La tolerancia debe ser positiva y la confianza estar entre 0 y 1")
+    solapados = set(inciertos) & set(parametros_base or {})
+    if solapados:
+        raise ValueError(f"Parámetros a la vez fijos e inciertos: {', '.join(sorted(solapados))}")
+
+    z = NormalDist().inv_cdf(0.5 + confianza / 2)
+    generador = np.random.default_rng(semilla)
+    estadisticas = {salida: Estadistica() for salida in salidas}
+    anteriores = None
+    muestras_totales = 0
+    errores = 0
+    procesos = procesos or os.cpu_count() or 1
+
+    with _EvaluadorLotes(ciclo, dict(parametros_base or {}), list(salidas), procesos, funcion_lote) as evaluador:
+        while muestras_totales < max_muestras:
+            n = min(tam_lote, max_muestras - muestras_totales)
+            muestras = {nombre: distribucion.muestrear(generador, n) for nombre, distribucion in inciertos.items()}
+            valores = evaluador.evaluar(muestras, n)
+
+            # Un punto cuenta si todas las salidas son finitas
+            validos = np.ones(n, dtype=bool)
+            for columna in valores.values():
+                validos &= np.isfinite(columna)
+            errores += n - int(validos.sum())
+            muestras_totales += n
+            for salida, estadistica in estadisticas.items():
+                estadistica.agregar(valores[salida][validos])
+
+            resumen = {salida: estadistica.resumen(z) for salida, estadistica in estadisticas.items()}
+            convergido = muestras_totales >= min_muestras and anteriores is not None and all(
+                _estable(resumen[salida], anteriores[salida], tolerancia) for salida in salidas)
+            anteriores = resumen
+            yield {'muestras': muestras_totales, 'errores': errores, 'convergido': convergido, 'salidas': resumen}
+            if convergido:
+                return
+
+def _estable(actual, anterior, tolerancia):
+    escala = tolerancia * abs(actual['media'])
+    if not math.isfinite(actual['media']) or actual['semiancho_media'] > escala:
+        return False
+    return all(abs(actual[f'P{p}'] - anterior[f'P{p}']) <= escala for p in PERCENTILES)
+
+def propagar(*argumentos, progreso=None, **opciones):
+    """
+    Ejecutar muestrear hasta la convergencia o el máximo de muestras
+    Args:
+        argumentos, opciones: Ver muestrear
+        progreso: Función opcional llamada con el estado tras cada lote
+    Returns:
+        Estado tras el último lote (ver muestrear)
+    """
+    estado = None
+    for estado in muestrear(*argumentos, **opciones):
+        if progreso is not None:
+            progreso(estado)
+    return estado
+
+def _asignacion(texto):
+    nombre, _, valor = texto.partition("=")
+    if not nombre or not valor:
+        raise argparse.ArgumentTypeError(f"Se esperaba nombre=valor: '{texto}'")
+    try:
+        return nombre, float(valor)
+    except ValueError:
+        return nombre, valor
+
+def _incierto(texto):
+    nombre, _, especificacion = texto.partition("=")
+    if not nombre or not especificacion:
+        raise argparse.ArgumentTypeError(f"Se esperaba nombre=tipo:valores: '{texto}'")
+    try:
+        return nombre, Distribucion.desde_texto(especificacion)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m analisis.incertidumbre",
+                                     description="Propagar la incertidumbre de los parámetros de un ciclo")
+    parser.add_argument("--ciclo", required=True, help="Nombre del ciclo (CICLOS_DISPONIBLES)")
+    parser.add_argument("--base", nargs="*", type=_asignacion, default=[],
+                        help="Parámetros fijos como nombre=valor")
+    parser.add_argument("--incierto", nargs="+", action="extend", type=_incierto, required=True,
+                        help="Parámetros inciertos como nombre=tipo:valores (" + ", ".join(DISTRIBUCIONES) + ")")
+    parser.add_argument("--salida", action="append",
+                        help="Resultado a estudiar (repetible; por defecto eficiencia y potencia neta)")
+    parser.add_argument("--tolerancia", type=float, default=1e-3, help="Precisión relativa para detenerse")
+    parser.add_argument("--confianza", type=float, default=0.95, help="Nivel del intervalo de la media")
+    parser.add_argument("--lote", type=int, default=1000, help="Muestras por lote")
+    parser.add_argument("--min", type=int, default=2000, help="Mínimo de muestras")
+    parser.add_argument("--max", type=int, default=200000, help="Máximo de muestras")
+    parser.add_argument("--vectorizado", action="store_true",
+                        help="Usar la versión por lotes del ciclo (calcular_lote) si la tiene")
+    parser.add_argument("--jobs", type=int, help="Procesos de cálculo (por defecto todos los núcleos)")
+    parser.add_argument("--semilla", type=int, help="Semilla del generador aleatorio")
+    args = parser.parse_args(argv)
+
+    funcion_lote = None
+    if args.vectorizado:
+        funcion_lote = funcion_lote_ciclo(args.ciclo, [nombre for nombre, _ in args.base + args.incierto])
+        if funcion_lote is None and CICLOS_DISPONIBLES.get(args.ciclo, {}).get("lote") is None:
+            print(f"'{args.ciclo}' no tiene versión por lotes; se evalúa punto a punto", file=sys.stderr)
+
+    def progreso(estado):
+        medias = ", ".join(f"{salida} {fila['media']:.6g} ± {fila['semiancho_media']:.2g}"
+                           for salida, fila in estado['salidas'].items())
+        print(f"{estado['muestras']:>8} muestras ({estado['errores']} con error): {medias}", file=sys.stderr)
+
+    estado = propagar(args.ciclo, dict(args.base), dict(args.incierto),
+                      tuple(args.salida or ("Eficiencia térmica", "Potencia neta")),
+                      tolerancia=args.tolerancia, confianza=args.confianza, tam_lote=args.lote,
+                      min_muestras=args.min, max_muestras=args.max, semilla=args.semilla,
+                      procesos=args.jobs, funcion_lote=funcion_lote, progreso=progreso)
+    print(json.dumps(estado, ensure_ascii=False, indent=2))
+    return 0 if estado['convergido'] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
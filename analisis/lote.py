@@ -0,0 +1,210 @@
+# Ejecución de casos por lotes sin interfaz gráfica
+# analisis/lote.py
+#
+# Uso:
+#   python -m analisis.lote casos.jsonl > resultados.jsonl
+#   cat casos.csv | python -m analisis.lote --formato csv --jobs 8
+#
+# Cada caso indica el ciclo (nombre de CICLOS_DISPONIBLES) y sus parámetros:
+#   JSONL: {"id": "a1", "ciclo": "Rankine Simple", "parametros": {"p_alta": 80, ...}}
+#          (o los parámetros directamente en el objeto, junto a "ciclo")
+#   CSV:   cabecera con una columna "ciclo" y una columna por parámetro
+# Los resultados se escriben como JSONL, una línea por caso, según van terminando.
+# Los parámetros se validan con el esquema del ciclo antes de repartir los casos: un caso
+# inválido no llega a calcularse y su registro lleva en "errores" la lista de problemas
+# ({'parametro', 'valor', 'mensaje'}).
+import argparse
+import csv
+import json
+import math
+import sys
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from analisis.barrido import inicializar_trabajador
+from ciclos.esquema import ErrorParametros
+from ciclos.registro import CICLOS_DISPONIBLES, obtener_funcion, obtener_validador
+
+# Columnas de un caso que no son parámetros del ciclo
+_CAMPOS_CASO = ('id', 'ciclo', 'parametros')
+
+def _convertir(valor):
+    """Convertir un campo de texto CSV a float cuando es un número finito ('nan' queda como texto)"""
+    try:
+        numero = float(valor)
+    except (TypeError, ValueError):
+        return valor
+    return numero if math.isfinite(numero) else valor
+
+def leer_casos(flujo, formato="jsonl"):
+    """
+    Leer casos de un flujo de texto de forma incremental
+    Yields:
+        (número de línea, id, ciclo, parámetros)
+    """
+    if formato == "csv":
+        for numero, fila in enumerate(csv.DictReader(flujo), start=2):
+            if None in fila:
+                # DictReader guarda los campos sobrantes en una lista bajo la clave None
+                yield numero, fila.get('id'), fila.get('ciclo'), {'__error__': "fila con más campos que la cabecera"}
+                continue
+            parametros = {clave: _convertir(valor) for clave, valor in fila.items()
+                          if clave not in _CAMPOS_CASO and valor not in (None, '')}
+            yield numero, fila.get('id'), fila.get('ciclo'), parametros
+    elif formato == "jsonl":
+        for numero, linea in enumerate(flujo, start=1):
+            if not linea.strip():
+                continue
+            try:
+                caso = json.loads(linea)
+            except ValueError as e:
+                yield numero, None, None, {'__error__': f"JSON inválido: {e}"}
+                continue
+            if not isinstance(caso, dict):
+                yield numero, None, None, {'__error__': "El caso debe ser un objeto JSON"}
+                continue
+            parametros = caso.get('parametros')
+            if parametros is None:
+                parametros = {k: v for k, v in caso.items() if k not in _CAMPOS_CASO}
+            elif not isinstance(parametros, dict):
+                parametros = {'__error__': "'parametros' debe ser un objeto JSON"}
+            yield numero, caso.get('id'), caso.get('ciclo'), parametros
+    else:
+        raise ValueError(f"Formato '{formato}' no soportado. Opciones: csv, jsonl")
+
+def _registro(numero, identificador, ciclo):
+    return {'linea': numero, 'id': identificador, 'ciclo': ciclo,
+            'resultados': None, 'estados': None, 'error': None, 'errores': None}
+
+def validar_casos(casos, rechazados):
+    """
+    Convertir y comprobar los parámetros de cada caso con el esquema de su ciclo
+    Args:
+        casos: Iterador de (número de línea, id, ciclo, parámetros)
+        rechazados: Función llamada con el registro de error de cada caso inválido
+    Yields:
+        Los casos válidos, con los parámetros ya tipados
+    """
+    for numero, identificador, ciclo, parametros in casos:
+        try:
+            if '__error__' in parametros:
+                raise ValueError(parametros['__error__'])
+            if not isinstance(ciclo, str) or ciclo not in CICLOS_DISPONIBLES:
+                mensaje = "es obligatorio" if ciclo is None else "no es un ciclo registrado"
+                raise ErrorParametros([{'parametro': 'ciclo', 'valor': ciclo, 'mensaje': mensaje}])
+            yield numero, identificador, ciclo, obtener_validador(ciclo).validar(parametros)
+        except ValueError as e:
+            registro = _registro(numero, identificador, ciclo)
+            registro['error'] = str(e)
+            registro['errores'] = getattr(e, 'errores', None)
+            rechazados(registro)
+
+def evaluar_casos(casos):
+    """Calcular una lista de casos; devuelve un registro de resultado por caso"""
+    registros = []
+    for numero, identificador, ciclo, parametros in casos:
+        registro = _registro(numero, identificador, ciclo)
+        try:
+            if '__error__' in parametros:
+                raise ValueError(parametros['__error__'])
+            resultado = obtener_funcion(ciclo)(parametros)
+            registro['resultados'] = resultado.valores
+            registro['estados'] = resultado.estados
+        except Exception as e:
+            registro['error'] = str(e)
+        registros.append(registro)
+    return registros
+
+def _finitos(valor):
+    """Copia de un registro con None en lugar de NaN/inf (JSON no los admite)"""
+    if isinstance(valor, float):
+        return valor if math.isfinite(valor) else None
+    if isinstance(valor, dict):
+        return {clave: _finitos(v) for clave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_finitos(v) for v in valor]
+    return valor
+
+def _json(registro):
+    """Línea JSON estricta de un registro"""
+    try:
+        return json.dumps(registro, ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        return json.dumps(_finitos(registro), ensure_ascii=False, allow_nan=False)
+
+def _bloques(casos, tam_bloque):
+    """Agrupar un iterador de casos en listas de tam_bloque sin materializarlo entero"""
+    bloque = []
+    for caso in casos:
+        bloque.append(caso)
+        if len(bloque) >= tam_bloque:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
+
+def ejecutar(casos, salida, jobs=1, tam_bloque=64):
+    """
+    Calcular los casos y escribir cada resultado como una línea JSON en salida.
+    Con jobs > 1 se mantienen como máximo 2 * jobs bloques en vuelo, de modo que la
+    memoria no crece con el número de casos; las líneas salen en orden de finalización.
+    Los casos inválidos se escriben al leerlos, sin enviarlos a calcular.
+    Returns:
+        (casos calculados, casos con error)
+    """
+    totales = [0, 0]
+
+    def escribir(registros):
+        for registro in registros:
+            salida.write(_json(registro) + "\n")
+            totales[0] += 1
+            totales[1] += registro['error'] is not None
+        salida.flush()
+
+    casos = validar_casos(casos, lambda registro: escribir([registro]))
+    if jobs <= 1:
+        inicializar_trabajador()
+        for bloque in _bloques(casos, tam_bloque):
+            escribir(evaluar_casos(bloque))
+        return tuple(totales)
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=inicializar_trabajador) as ejecutor:
+        pendientes = set()
+        for bloque in _bloques(casos, tam_bloque):
+            if len(pendientes) >= 2 * jobs:
+                terminados, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in terminados:
+                    escribir(futuro.result())
+            pendientes.add(ejecutor.submit(evaluar_casos, bloque))
+        for futuro in pendientes:
+            escribir(futuro.result())
+    return tuple(totales)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m analisis.lote",
+        description="Calcular casos de ciclos termodinámicos leídos de CSV o JSONL")
+    parser.add_argument("entrada", nargs="?", default="-",
+                        help="Fichero de casos (por defecto la entrada estándar)")
+    parser.add_argument("--formato", choices=("csv", "jsonl"),
+                        help="Formato de entrada (por defecto según la extensión, jsonl para stdin)")
+    parser.add_argument("--salida", default="-", help="Fichero JSONL de resultados (por defecto stdout)")
+    parser.add_argument("--jobs", type=int, default=1, help="Procesos de cálculo en paralelo")
+    parser.add_argument("--bloque", type=int, default=64, help="Casos por tarea enviada a cada proceso")
+    args = parser.parse_args(argv)
+
+    formato = args.formato or ("csv" if args.entrada.lower().endswith(".csv") else "jsonl")
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, newline='', encoding="utf-8")
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    try:
+        calculados, errores = ejecutar(leer_casos(entrada, formato), salida, args.jobs, max(1, args.bloque))
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+    print(f"{calculados} casos calculados, {errores} con error", file=sys.stderr)
+    return 1 if errores else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+# Optimización de parámetros de diseño de los ciclos
+# analisis/optimizacion.py
+#
+# Uso:
+#   python -m analisis.optimizacion --ciclo "Rankine con Recalentamiento" \
+#       --base p_alta=80 p_baja=0.08 t_max=500 t_recal=500 --variable p_media=2:60
+#   python -m analisis.optimizacion --ciclo "Brayton con Recalentamiento" \
+#       --base t_max=950 t_recal=950 --variable relacion_compresion=2:40 --metodo evolucion
+#
+# Métodos: "aurea" (sección áurea, una variable), "nelder-mead" (varias variables) y
+# "evolucion" (evolución diferencial, para objetivos con varios máximos locales). Todos
+# trabajan dentro de los límites dados y cada punto evaluado se guarda y nunca se calcula
+# dos veces. Nelder–Mead y la evolución diferencial evalúan los candidatos de cada paso
+# como un lote, repartido entre procesos; la sección áurea necesita un punto nuevo por
+# iteración, que depende del anterior, y se ejecuta en este proceso.
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from analisis.barrido import inicializar_trabajador, evaluar_bloque
+
+METODOS = ("aurea", "nelder-mead", "evolucion")
+
+class Evaluador:
+    """
+    Función objetivo de una optimización con caché de puntos y evaluación por lotes
+    Args:
+        ciclo: Nombre registrado en CICLOS_DISPONIBLES o función calcular de un módulo de ciclos
+        parametros_base: Parámetros fijos del ciclo
+        variables: Nombres de los parámetros que se optimizan, en el orden de los puntos
+        objetivo: Resultado que se optimiza (clave de ResultadoCiclo.a_dict)
+        maximizar: True para buscar el máximo del objetivo
+        procesos: Procesos de trabajo (por defecto os.cpu_count(); 1 = en este proceso)
+        funcion_lote: Alternativa vectorizada al ciclo: recibe {variable: array} con todos
+                      los puntos del lote y devuelve un array con el objetivo de cada uno
+                      (p. ej. sobre rankine.calcular_lote); se evalúa en este proceso
+    Usar como contexto para que el conjunto de procesos se cree una sola vez.
+    """
+
+    def __init__(self, ciclo, parametros_base, variables, objetivo="Eficiencia térmica", maximizar=True,
+                 procesos=None, funcion_lote=None):
+        self.ciclo = ciclo
+        self.parametros_base = dict(parametros_base or {})
+        self.variables = list(variables)
+        self.objetivo = objetivo
+        self.maximizar = maximizar
+        self.procesos = procesos or os.cpu_count() or 1
+        self.funcion_lote = funcion_lote
+        self.cache = {}
+        self.evaluaciones = 0
+        self.aciertos = 0
+        self._ejecutor = None
+
+    def __enter__(self):
+        if self.procesos > 1 and self.funcion_lote is None:
+            self._ejecutor = ProcessPoolExecutor(max_workers=self.procesos, initializer=inicializar_trabajador)
+        return self
+
+    def __exit__(self, *_):
+        if self._ejecutor is not None:
+            self._ejecutor.shutdown()
+            self._ejecutor = None
+
+    @staticmethod
+    def clave(punto):
+        """Clave de caché de un punto (12 cifras significativas)"""
+        return tuple(float(f"{v:.12g}") for v in punto)
+
+    def coste(self, valor):
+        """Valor del objetivo como coste a minimizar (inf si el punto no se pudo calcular)"""
+        if valor is None or not math.isfinite(valor):
+            return math.inf
+        return -valor if self.maximizar else valor
+
+    def _calcular(self, puntos):
+        """Valores del objetivo (None si falla) para puntos que no están en caché"""
+        if self.funcion_lote is not None:
+            import numpy as np
+            columnas = {nombre: np.array([p[i] for p in puntos], dtype=float)
+                        for i, nombre in enumerate(self.variables)}
+            try:
+                valores = np.asarray(self.funcion_lote(columnas), dtype=float)
+                return [float(v) if np.isfinite(v) else None for v in valores]
+            except ValueError:
+                return [None] * len(puntos)
+
+        diccionarios = [dict(zip(self.variables, punto)) for punto in puntos]
+        if self._ejecutor is None or len(puntos) == 1:
+            filas = evaluar_bloque(self.ciclo, self.parametros_base, diccionarios)
+        else:
+            tam_bloque = max(1, math.ceil(len(diccionarios) / self.procesos))
+            bloques = [diccionarios[i:i + tam_bloque] for i in range(0, len(diccionarios), tam_bloque)]
+            filas = [fila for bloque in self._ejecutor.map(
+                evaluar_bloque, [self.ciclo] * len(bloques), [self.parametros_base] * len(bloques), bloques)
+                for fila in bloque]
+        return [None if error is not None else resultados.get(self.objetivo) for resultados, error in filas]
+
+    def evaluar(self, puntos):
+        """
+        Coste de cada punto, calculando en un solo lote los que no están en caché
+        Args:
+            puntos: Lista de secuencias con un valor por variable
+        Returns:
+            Lista de costes en el mismo orden
+        """
+        claves = [self.clave(punto) for punto in puntos]
+        pendientes = []
+        for clave in claves:
+            if clave in self.cache or clave in pendientes:
+                self.aciertos += 1
+            else:
+                pendientes.append(clave)
+        if pendientes:
+            for clave, valor in zip(pendientes, self._calcular(pendientes)):
+                self.cache[clave] = valor
+            self.evaluaciones += len(pendientes)
+        return [self.coste(self.cache[clave]) for clave in claves]
+
+    def valor(self, punto):
+        """Valor del objetivo ya calculado para un punto"""
+        return self.cache.get(self.clave(punto))
+
+def _acotar(punto, limites):
+    return [min(max(v, minimo), maximo) for v, (minimo, maximo) in zip(punto, limites)]
+
+def seccion_aurea(evaluador, limites, tolerancia=1e-4, max_iteraciones=200):
+    """
+    Búsqueda por sección áurea de una variable en [minimo, maximo] (objetivo unimodal)
+    Args:
+        limites: [(minimo, maximo)]
+        tolerancia: Anchura final del intervalo relativa a la inicial
+    Returns:
+        (punto, coste, iteraciones, convergido)
+    """
+    if len(limites) != 1:
+        raise ValueError("La sección áurea optimiza una sola variable")
+    a, b = limites[0]
+    razon = (math.sqrt(5) - 1) / 2
+    c, d = b - razon * (b - a), a + razon * (b - a)
+    fc, fd = evaluador.evaluar([[c], [d]])
+    anchura = (b - a) * tolerancia
+    iteraciones = 0
+    while b - a > anchura and iteraciones < max_iteraciones:
+        iteraciones += 1
+        if fc <= fd:
+            b, d, fd = d, c, fc
+            c = b - razon * (b - a)
+            fc, = evaluador.evaluar([[c]])
+        else:
+            a, c, fc = c, d, fd
+            d = a + razon * (b - a)
+            fd, = evaluador.evaluar([[d]])
+    punto, coste = ([c], fc) if fc <= fd else ([d], fd)
+    return punto, coste, iteraciones, b - a <= anchura
+
+def nelder_mead(evaluador, limites, x0=None, tolerancia=1e-4, max_iteraciones=200):
+    """
+    Simplex de Nelder–Mead con los vértices acotados a los límites
+    Args:
+        limites: [(minimo, maximo)] por variable
+        x0: Punto inicial (por defecto el centro de los límites)
+        tolerancia: Tamaño del simplex relativo a los límites y dispersión relativa del coste
+                    por debajo de los cuales se da por convergido
+    Returns:
+        (punto, coste, iteraciones, convergido)
+    """
+    n = len(limites)
+    rangos = [maximo - minimo for minimo, maximo in limites]
+    x0 = list(x0) if x0 is not None else [(minimo + maximo) / 2 for minimo, maximo in limites]
+    simplex = [_acotar(x0, limites)]
+    for i in range(n):
+        vertice = list(simplex[0])
+        paso = 0.1 * rangos[i]
+        vertice[i] = vertice[i] + paso if vertice[i] + paso <= limites[i][1] else vertice[i] - paso
+        simplex.append(vertice)
+    costes = evaluador.evaluar(simplex)
+
+    iteraciones = 0
+    convergido = False
+    while iteraciones < max_iteraciones:
+        orden = sorted(range(n + 1), key=lambda k: costes[k])
+        simplex = [simplex[k] for k in orden]
+        costes = [costes[k] for k in orden]
+        tamano = max(abs(v[i] - simplex[0][i]) / (rangos[i] or 1) for v in simplex[1:] for i in range(n))
+        dispersion = abs(costes[-1] - costes[0]) / max(abs(costes[0]), 1e-12) if math.isfinite(costes[-1]) else math.inf
+        if tamano <= tolerancia and dispersion <= tolerancia:
+            convergido = True
+            break
+        iteraciones += 1
+
+        centro = [sum(v[i] for v in simplex[:-1]) / n for i in range(n)]
+        peor = simplex[-1]
+        reflejado = _acotar([c + (c - p) for c, p in zip(centro, peor)], limites)
+        expandido = _acotar([c + 2 * (c - p) for c, p in zip(centro, peor)], limites)
+        # Reflexión y expansión se piden juntas: una ida y vuelta al conjunto de procesos
+        f_reflejado, f_expandido = evaluador.evaluar([reflejado, expandido])
+
+        if f_reflejado < costes[0]:
+            if f_expandido < f_reflejado:
+                simplex[-1], costes[-1] = expandido, f_expandido
+            else:
+                simplex[-1], costes[-1] = reflejado, f_reflejado
+        elif f_reflejado < costes[-2]:
+            simplex[-1], costes[-1] = reflejado, f_reflejado
+        else:
+            if f_reflejado < costes[-1]:
+                contraido = [c + 0.5 * (r - c) for c, r in zip(centro, reflejado)]
+            else:
+                contraido = [c + 0.5 * (p - c) for c, p in zip(centro, peor)]
+            f_contraido, = evaluador.evaluar([contraido])
+            if f_contraido < min(f_reflejado, costes[-1]):
+                simplex[-1], costes[-1] = contraido, f_contraido
+            else:
+                # Reducción hacia el mejor vértice: n puntos en un solo lote
+                mejor = simplex[0]
+                simplex = [mejor] + [[m + 0.5 * (v - m) for m, v in zip(mejor, vertice)] for vertice in simplex[1:]]
+                costes = costes[:1] + evaluador.evaluar(simplex[1:])
+
+    k = min(range(n + 1), key=lambda k: costes[k])
+    return simplex[k], costes[k], iteraciones, convergido
+
+def evolucion_diferencial(evaluador, limites, poblacion=None, generaciones=60, mutacion=0.7, cruce=0.9,
+                          tolerancia=1e-5, semilla=None):
+    """
+    Evolución diferencial (DE/rand/1/bin) para objetivos con varios óptimos locales.
+    Cada generación evalúa todos los candidatos como un solo lote.
+    Args:
+        limites: [(minimo, maximo)] por variable
+        poblacion: Tamaño de la población (por defecto max(8, 10 * variables))
+        mutacion, cruce: Factor diferencial y probabilidad de cruce
+        tolerancia: Dispersión relativa del coste de la población para darla por convergida
+        semilla: Semilla del generador aleatorio
+    Returns:
+        (punto, coste, generaciones, convergido)
+    """
+    n = len(limites)
+    poblacion = poblacion or max(8, 10 * n)
+    generador = random.Random(semilla)
+    individuos = [[minimo + (maximo - minimo) * generador.random() for minimo, maximo in limites]
+                  for _ in range(poblacion)]
+    costes = evaluador.evaluar(individuos)
+
+    generacion = 0
+    convergido = False
+    while generacion < generaciones:
+        finitos = [c for c in costes if math.isfinite(c)]
+        if len(finitos) == poblacion and (max(finitos) - min(finitos)) <= tolerancia * max(abs(min(finitos)), 1e-12):
+            convergido = True
+            break
+        generacion += 1
+
+        candidatos = []
+        for i in range(poblacion):
+            a, b, c = generador.sample([k for k in range(poblacion) if k != i], 3)
+            obligado = generador.randrange(n)
+            candidato = [individuos[a][d] + mutacion * (individuos[b][d] - individuos[c][d])
+                         if d == obligado or generador.random() < cruce else individuos[i][d]
+                         for d in range(n)]
+            candidatos.append(_acotar(candidato, limites))
+        for i, coste in enumerate(evaluador.evaluar(candidatos)):
+            if coste <= costes[i]:
+                individuos[i], costes[i] = candidatos[i], coste
+
+    k = min(range(poblacion), key=lambda k: costes[k])
+    return individuos[k], costes[k], generacion, convergido
+
+def optimizar(ciclo, parametros_base, limites, metodo="nelder-mead", objetivo="Eficiencia térmica",
+              maximizar=True, procesos=None, funcion_lote=None, **opciones):
+    """
+    Optimizar parámetros de un ciclo dentro de sus límites
+    Args:
+        ciclo, parametros_base, objetivo, maximizar, procesos, funcion_lote: Ver Evaluador
+                  (con "aurea" siempre se calcula en este proceso)
+        limites: {parametro: (minimo, maximo)}
+        metodo: "aurea", "nelder-mead" o "evolucion"
+        opciones: Argumentos adicionales del método (tolerancia, x0, semilla, ...)
+    Returns:
+        {'metodo', 'optimo': {parametro: valor}, 'valor', 'iteraciones', 'convergido',
+         'evaluaciones', 'aciertos_cache'}
+    """
+    funciones = {"aurea": seccion_aurea, "nelder-mead": nelder_mead, "evolucion": evolucion_diferencial}
+    if metodo not in funciones:
+        raise ValueError(f"Método '{metodo}' no soportado. Opciones: {', '.join(METODOS)}")
+    if metodo == "aurea":
+        procesos = 1  # Un punto por iteración: el conjunto de procesos no se usaría
+    variables = list(limites)
+    cotas = [tuple(map(float, limites[nombre])) for nombre in variables]
+    for nombre, (minimo, maximo) in zip(variables, cotas):
+        if not minimo < maximo:
+            raise ValueError(f"Límites inválidos para {nombre}: el mínimo debe ser menor que el máximo")
+
+    with Evaluador(ciclo, parametros_base, variables, objetivo, maximizar, procesos, funcion_lote) as evaluador:
+        punto, coste, iteraciones, convergido = funciones[metodo](evaluador, cotas, **opciones)
+        return {
+            'metodo': metodo,
+            'optimo': dict(zip(variables, punto)),
+            'valor': evaluador.valor(punto) if math.isfinite(coste) else None,
+            'iteraciones': iteraciones,
+            'convergido': convergido,
+            'evaluaciones': evaluador.evaluaciones,
+            'aciertos_cache': evaluador.aciertos,
+        }
+
+def _asignacion(texto):
+    nombre, _, valor = texto.partition("=")
+    if not nombre or not valor:
+        raise argparse.ArgumentTypeError(f"Se esperaba nombre=valor: '{texto}'")
+    try:
+        return nombre, float(valor)
+    except ValueError:
+        return nombre, valor
+
+def _variable(texto):
+    nombre, _, rango = texto.partition("=")
+    try:
+        minimo, maximo = (float(v) for v in rango.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Se esperaba nombre=minimo:maximo: '{texto}'")
+    return nombre, (minimo, maximo)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m analisis.optimizacion",
+                                     description="Optimizar parámetros de diseño de un ciclo")
+    parser.add_argument("--ciclo", required=True, help="Nombre del ciclo (CICLOS_DISPONIBLES)")
+    parser.add_argument("--base", nargs="*", type=_asignacion, default=[],
+                        help="Parámetros fijos como nombre=valor")
+    parser.add_argument("--variable", action="append", type=_variable, required=True,
+                        help="Parámetro a optimizar como nombre=minimo:maximo (repetible)")
+    parser.add_argument("--metodo", choices=METODOS, help="Por defecto aurea con una variable, si no nelder-mead")
+    parser.add_argument("--objetivo", default="Eficiencia térmica", help="Resultado a optimizar")
+    parser.add_argument("--minimizar", action="store_true", help="Minimizar el objetivo en lugar de maximizarlo")
+    parser.add_argument("--jobs", type=int, help="Procesos de cálculo (por defecto todos los núcleos)")
+    parser.add_argument("--semilla", type=int, help="Semilla para el método evolucion")
+    args = parser.parse_args(argv)
+
+    limites = dict(args.variable)
+    metodo = args.metodo or ("aurea" if len(limites) == 1 else "nelder-mead")
+    opciones = {'semilla': args.semilla} if metodo == "evolucion" else {}
+    resultado = optimizar(args.ciclo, dict(args.base), limites, metodo, args.objetivo, not args.minimizar,
+                          args.jobs, **opciones)
+    print(json.dumps(resultado, ensure_ascii=False, indent=2))
+    return 0 if resultado['valor'] is not None else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
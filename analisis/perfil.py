@@ -0,0 +1,44 @@
+# Informe de llamadas a propiedades por ciclo y etapa
+# analisis/perfil.py
+#
+# Uso:
+#   python -m analisis.perfil
+#   python -m analisis.perfil --ciclo "Rankine Simple" --json perfil.json --flamegraph perfil.folded
+import argparse
+import sys
+
+from analisis.benchmark import CASOS_CICLOS
+from ciclos.registro import CICLOS_DISPONIBLES
+from util.instrumentacion import instrumentacion
+from util.propiedades import cache_propiedades
+
+def perfilar(ciclos=None, limpiar_cache=True):
+    """Resolver los ciclos con sus parámetros por defecto registrando las llamadas a propiedades"""
+    with instrumentacion.registrar():
+        for nombre in ciclos or CASOS_CICLOS:
+            if limpiar_cache:
+                cache_propiedades.limpiar()
+            CICLOS_DISPONIBLES[nombre]["funcion"](dict(CASOS_CICLOS[nombre]))
+    return instrumentacion
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m analisis.perfil",
+                                     description="Perfil de llamadas a propiedades por ciclo y etapa")
+    parser.add_argument("--ciclo", action="append", choices=list(CASOS_CICLOS),
+                        help="Ciclo a perfilar (repetible; por defecto todos)")
+    parser.add_argument("--json", help="Guardar el resumen en JSON")
+    parser.add_argument("--flamegraph", help="Guardar las pilas colapsadas para flamegraph")
+    args = parser.parse_args(argv)
+
+    perfil = perfilar(args.ciclo)
+    perfil.imprimir_resumen(sys.stdout)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            f.write(perfil.a_json())
+    if args.flamegraph:
+        with open(args.flamegraph, "w", encoding="utf-8") as f:
+            f.write(perfil.a_flamegraph() + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+# Simulación de un ciclo a lo largo de una serie temporal de puntos de operación
+# analisis/serie.py
+#
+# Uso:
+#   python -m analisis.serie perfil.csv --ciclo "Brayton Simple" \
+#       --base relacion_compresion=10 t_max=950 > resultados.csv
+#   python -m analisis.serie perfil.csv --ciclo "Rankine Simple" --base p_alta=80 t_max=500 \
+#       --backend tabular --salida resultados.csv
+#
+# El perfil es un CSV con una fila por paso (p. ej. 8760 horas) y una columna por parámetro
+# que varía (t1, p_baja, potencia...). Cada punto se valida con el esquema del ciclo, de
+# modo que también valen columnas de texto como p_extraccion="12,5"; las columnas que no
+# son parámetros del ciclo, como la fecha, se copian a la salida sin usarse en el cálculo
+# y los pasos rechazados llevan el motivo en la columna "error". Los puntos se leen y los resultados se escriben fila a
+# fila, sin cargar la serie en memoria. Todos los pasos usan la misma instancia del ciclo:
+# los estados cuyos parámetros no cambian entre pasos consecutivos se reutilizan del grafo
+# del ciclo y los AbstractState y la caché de propiedades siguen calientes.
+import argparse
+import csv
+import sys
+import time
+import warnings
+
+from analisis.lote import _convertir
+from ciclos.registro import CICLOS_DISPONIBLES, obtener_validador
+from util.propiedades import PropiedadesTermodinamicas
+
+def leer_perfil(flujo):
+    """
+    Leer un perfil CSV de forma incremental
+    Yields:
+        {columna: valor} por fila, con los campos numéricos finitos como float
+    """
+    for fila in csv.DictReader(flujo):
+        yield {clave: _convertir(valor) for clave, valor in fila.items() if valor not in (None, '')}
+
+def crear_instancia(ciclo, backend=None):
+    """Instancia persistente del ciclo, opcionalmente con otro backend de propiedades"""
+    if ciclo not in CICLOS_DISPONIBLES:
+        raise ValueError(f"Ciclo '{ciclo}' no registrado. Opciones: {', '.join(CICLOS_DISPONIBLES)}")
+    clase = CICLOS_DISPONIBLES[ciclo]["clase"]
+    if backend is None:
+        return clase()
+    return clase(PropiedadesTermodinamicas(clase.FLUIDO, backend))
+
+def simular(ciclo, puntos, parametros_base=None, backend=None, estados=False):
+    """
+    Calcular el ciclo en cada punto de operación, en orden
+    Args:
+        ciclo: Nombre registrado en CICLOS_DISPONIBLES
+        puntos: Iterable (p. ej. un generador) de diccionarios {columna: valor}; las columnas
+                que no son parámetros del ciclo no intervienen en el cálculo
+        parametros_base: Parámetros fijos que completan cada punto
+        backend: Backend de propiedades (None = el del ciclo; "tabular" o, en ciclos de aire,
+                 "gas_ideal" para series largas)
+        estados: Incluir también las propiedades de los estados en los resultados
+    Yields:
+        (índice, punto, resultados {nombre: valor} o None, error o None)
+    """
+    instancia = crear_instancia(ciclo, backend)
+    validador = obtener_validador(ciclo)
+    nombres = validador.convertidores
+    parametros_base = dict(parametros_base or {})
+    for indice, punto in enumerate(puntos):
+        try:
+            parametros = validador.validar(
+                {**parametros_base, **{clave: valor for clave, valor in punto.items() if clave in nombres}})
+            resultado = instancia.calcular(parametros)
+            yield indice, punto, resultado.a_dict() if estados else resultado.valores, None
+        except Exception as e:
+            yield indice, punto, None, str(e)
+
+def escribir_csv(pasos, salida, vaciar_cada=256):
+    """
+    Escribir los pasos de simular como CSV a medida que se calculan.
+    La cabecera se forma con las columnas del primer punto y del primer resultado correcto;
+    los pasos anteriores a ese resultado se guardan hasta conocerla. Las columnas que
+    aparecen después (p. ej. una extracción más en un Rankine regenerativo) no caben en la
+    cabecera: se avisa con un warning la primera vez que aparece cada una.
+    Returns:
+        (pasos escritos, pasos con error)
+    """
+    escritor = None
+    retenidos = []
+    totales = [0, 0]
+    omitidas = set()
+
+    def escribir(punto, resultados, error):
+        fila = {**punto, **(resultados or {}), 'error': error or ''}
+        nuevas = [str(columna) for columna in fila if columna not in escritor.fieldnames and columna not in omitidas]
+        if nuevas:
+            omitidas.update(columna for columna in fila if columna not in escritor.fieldnames)
+            warnings.warn(f"Paso {totales[0] + 1}: columnas que no están en la cabecera del CSV "
+                          f"y no se escriben: {', '.join(nuevas)}")
+        escritor.writerow(fila)
+        totales[0] += 1
+        totales[1] += error is not None
+        if totales[0] % vaciar_cada == 0:
+            salida.flush()
+
+    for _, punto, resultados, error in pasos:
+        if escritor is None:
+            if resultados is None:
+                retenidos.append((punto, resultados, error))
+                continue
+            columnas = list(punto) + [c for c in resultados if c not in punto] + ['error']
+            escritor = csv.DictWriter(salida, fieldnames=columnas, extrasaction='ignore', lineterminator='\n')
+            escritor.writeheader()
+            for retenido in retenidos:
+                escribir(*retenido)
+            retenidos = []
+        escribir(punto, resultados, error)
+
+    if escritor is None and retenidos:
+        # Ningún paso se pudo calcular: solo columnas del perfil y el error
+        columnas = list(retenidos[0][0]) + ['error']
+        escritor = csv.DictWriter(salida, fieldnames=columnas, extrasaction='ignore', lineterminator='\n')
+        escritor.writeheader()
+        for retenido in retenidos:
+            escribir(*retenido)
+    salida.flush()
+    return tuple(totales)
+
+def _asignacion(texto):
+    nombre, _, valor = texto.partition("=")
+    if not nombre or not valor:
+        raise argparse.ArgumentTypeError(f"Se esperaba nombre=valor: '{texto}'")
+    return nombre, _convertir(valor)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m analisis.serie",
+                                     description="Simular un ciclo sobre un perfil temporal de operación")
+    parser.add_argument("perfil", nargs="?", default="-", help="CSV del perfil (por defecto la entrada estándar)")
+    parser.add_argument("--ciclo", required=True, help="Nombre del ciclo (CICLOS_DISPONIBLES)")
+    parser.add_argument("--base", nargs="*", type=_asignacion, default=[],
+                        help="Parámetros fijos como nombre=valor")
+    parser.add_argument("--backend", help="Backend de propiedades (p. ej. tabular o gas_ideal)")
+    parser.add_argument("--estados", action="store_true", help="Incluir las propiedades de los estados")
+    parser.add_argument("--salida", default="-", help="CSV de resultados (por defecto stdout)")
+    args = parser.parse_args(argv)
+
+    entrada = sys.stdin if args.perfil == "-" else open(args.perfil, newline='', encoding="utf-8")
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", newline='', encoding="utf-8")
+    inicio = time.perf_counter()
+    try:
+        pasos = simular(args.ciclo, leer_perfil(entrada), dict(args.base), args.backend, args.estados)
+        calculados, errores = escribir_csv(pasos, salida)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+    duracion = time.perf_counter() - inicio
+    print(f"{calculados} pasos en {duracion:.2f} s ({calculados / max(duracion, 1e-9):.0f} pasos/s), "
+          f"{errores} con error", file=sys.stderr)
+    return 1 if errores else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
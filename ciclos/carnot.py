@@ -3,12 +3,15 @@
 
 from util.helpers import kelvin_to_celsius, celsius_to_kelvin
 from util.propiedades import PropiedadesTermodinamicas
+from ciclos.resultado import ResultadoCiclo
 
 
 
 class CicloCarnot:
-    def __init__(self):
-        self.pt = PropiedadesTermodinamicas("Water")
+    FLUIDO = "Water"
+
+    def __init__(self, pt=None):
+        self.pt = pt if pt is not None else PropiedadesTermodinamicas(self.FLUIDO)
     
     def calcular(self, parametros):
         try:
@@ -22,11 +25,15 @@ class CicloCarnot:
             # Cálculo de eficiencia teórica
             eficiencia = 1 - (t_fria_k / t_cal_k)
             
-            return {
-                'Eficiencia teórica': f"{eficiencia * 100:.2f}%",
-                'Temperatura caliente': f"{t_caliente:.2f} °C",
-                'Temperatura fría': f"{t_fria:.2f} °C"
-            }
+            return ResultadoCiclo(
+                ciclo="Ciclo Carnot",
+                valores={
+                    'Eficiencia teórica': eficiencia * 100,
+                    'Temperatura caliente': t_caliente,
+                    'Temperatura fría': t_fria
+                },
+                estados={}
+            )
             
         except Exception as e:
             raise ValueError(f"Error en cálculo Carnot: {str(e)}")
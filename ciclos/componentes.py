@@ -0,0 +1,147 @@
+# Componentes de ciclo como nodos de un GrafoCiclo
+# ciclos/componentes.py
+#
+# Cada componente calcula el estado a su salida a partir de los estados y parámetros de
+# los que depende (nombres de otros nodos o de parámetros del ciclo). Un ciclo se define
+# como la lista de sus componentes; GrafoCiclo los evalúa en orden topológico y memoriza
+# cada estado, de modo que los estados compartidos se calculan una sola vez y, al
+# repetir el cálculo, solo se rehacen los afectados por los parámetros modificados.
+#
+# Los estados son diccionarios con 'p' [bar], 'h' [kJ/kg] y, cuando se conocen sin un
+# flash adicional, 's' [kJ/kg-K], 'T' [°C] y 'x' (título, solo dentro de la campana).
+from ciclos.grafo import Nodo
+
+def estado_desde_flash(p, propiedades):
+    """Estado completo a partir del resultado de propiedades_estado"""
+    estado = {'p': p, 'T': propiedades['T'], 'h': propiedades['h'], 's': propiedades['s']}
+    if 0.0 <= propiedades['x'] <= 1.0:
+        estado['x'] = propiedades['x']
+    return estado
+
+class Componente(Nodo):
+    """
+    Nodo que usa un objeto de propiedades termodinámicas
+    Args:
+        nombre: Nombre del estado de salida
+        entradas: Nombres de los nodos o parámetros de los que depende
+        pt: PropiedadesTermodinamicas del fluido de trabajo
+    """
+    __slots__ = ('pt',)
+
+    def __init__(self, nombre, entradas, pt):
+        super().__init__(nombre, entradas, self.calcular)
+        self.pt = pt
+
+    def calcular(self, *valores):
+        raise NotImplementedError
+
+class EstadoPT(Componente):
+    """Estado fijado por presión y temperatura (p. ej. aire ambiente a la entrada)"""
+    __slots__ = ()
+
+    def __init__(self, nombre, p, t, pt):
+        super().__init__(nombre, (p, t), pt)
+
+    def calcular(self, p, t):
+        return estado_desde_flash(p, self.pt.propiedades_estado(p, t))
+
+class Caldera(EstadoPT):
+    """Aporte de calor isobárico hasta la temperatura t (la salida no depende de la entrada)"""
+    __slots__ = ()
+
+class Recalentador(Caldera):
+    """Recalentamiento isobárico entre etapas de turbina"""
+    __slots__ = ()
+
+class Combustor(Componente):
+    """
+    Aporte de calor hasta la temperatura t con una pérdida de presión relativa
+    Args:
+        p: Presión a la entrada
+        t: Temperatura de salida
+        perdida: Fracción de presión perdida (0-1); None si no hay pérdida
+    """
+    __slots__ = ()
+
+    def __init__(self, nombre, p, t, pt, perdida=None):
+        super().__init__(nombre, (p, t) if perdida is None else (p, t, perdida), pt)
+
+    def calcular(self, p, t, perdida=0.0):
+        p_salida = p * (1 - perdida)
+        return estado_desde_flash(p_salida, self.pt.propiedades_estado(p_salida, t))
+
+class Condensador(Componente):
+    """Salida como líquido saturado a la presión del condensador"""
+    __slots__ = ()
+
+    def __init__(self, nombre, p, pt):
+        super().__init__(nombre, (p,), pt)
+
+    def calcular(self, p):
+        return estado_desde_flash(p, self.pt.liquido_saturado(p))
+
+class _ProcesoIsentropico(Componente):
+    """
+    Compresión o expansión entre la entrada y p_salida con rendimiento isentrópico
+    Args:
+        entrada: Nodo del estado de entrada
+        p_salida: Presión de salida
+        rendimiento: Rendimiento isentrópico (0-1); None para el proceso ideal, cuya
+                     salida incluye todas las propiedades del mismo flash
+    """
+    __slots__ = ()
+    COMPRESION = True
+
+    def __init__(self, nombre, entrada, p_salida, pt, rendimiento=None):
+        entradas = (entrada, p_salida) if rendimiento is None else (entrada, p_salida, rendimiento)
+        super().__init__(nombre, entradas, pt)
+
+    def calcular(self, entrada, p_salida, rendimiento=None):
+        s_entrada = entrada.get('s')
+        if s_entrada is None:
+            s_entrada = self.pt.propiedades_estado(entrada['p'], h_kjkg=entrada['h'])['s']
+        isentropico = self.pt.propiedades_estado(p_salida, s_kjkgK=s_entrada)
+        if rendimiento is None:
+            return estado_desde_flash(p_salida, isentropico)
+        h_entrada = entrada['h']
+        if self.COMPRESION:
+            h = h_entrada + (isentropico['h'] - h_entrada) / rendimiento
+        else:
+            h = h_entrada - rendimiento * (h_entrada - isentropico['h'])
+        return {'p': p_salida, 'h': h}
+
+class Bomba(_ProcesoIsentropico):
+    """Bombeo de líquido hasta p_salida"""
+    __slots__ = ()
+
+class Compresor(_ProcesoIsentropico):
+    """Compresión de gas hasta p_salida"""
+    __slots__ = ()
+
+class Turbina(_ProcesoIsentropico):
+    """Etapa de expansión hasta p_salida"""
+    __slots__ = ()
+    COMPRESION = False
+
+class CalentadorAbierto(Componente):
+    """
+    Calentador abierto de agua de alimentación: la mezcla sale como líquido saturado a p.
+    El estado de salida incluye 'y', la fracción del caudal de salida extraída de la turbina.
+    Args:
+        extraccion: Nodo del vapor extraído
+        alimentacion: Nodo del agua de alimentación que entra al calentador
+        p: Presión del calentador
+    """
+    __slots__ = ()
+
+    def __init__(self, nombre, extraccion, alimentacion, p, pt):
+        super().__init__(nombre, (extraccion, alimentacion, p), pt)
+
+    def calcular(self, extraccion, alimentacion, p):
+        estado = estado_desde_flash(p, self.pt.liquido_saturado(p))
+        estado['y'] = (estado['h'] - alimentacion['h']) / (extraccion['h'] - alimentacion['h'])
+        return estado
+
+def copiar_estados(resultados):
+    """Copia de los estados evaluados por el grafo (sin los nodos de valores derivados)"""
+    return {nombre: dict(valor) for nombre, valor in resultados.items() if isinstance(valor, dict)}
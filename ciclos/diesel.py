@@ -1,12 +1,25 @@
 # Módulo para resolver el ciclo Diesel
 from util.propiedades import PropiedadesTermodinamicas
+from ciclos.resultado import ResultadoCiclo
+from ciclos.grafo import GrafoCiclo, Nodo
+from ciclos.componentes import Caldera, Compresor, EstadoPT, Turbina, copiar_estados
 from math import isclose
 
 class CicloDiesel:
-    def __init__(self):
-        self.pt_aire = PropiedadesTermodinamicas("Air")
+    FLUIDO = "Air"
+
+    def __init__(self, pt=None):
+        self.pt_aire = pt if pt is not None else PropiedadesTermodinamicas(self.FLUIDO)
         self.pt_comb = PropiedadesTermodinamicas("Propane")  # Aproximación para diesel
-        self.resultados = {}
+        self.resultados = None
+        self.grafo = GrafoCiclo([
+            EstadoPT('1', 'p1', 't1', self.pt_aire),
+            Nodo('p2', ('p1', 'relacion_compresion'), lambda p1, rc: p1 * (rc**1.4)),  # Aprox. para aire
+            Compresor('2', '1', 'p2', self.pt_aire),
+            Nodo('t3', ('2', 'relacion_corte'), lambda estado2, rcut: estado2['T'] * rcut),  # Simplificación
+            Caldera('3', 'p2', 't3', self.pt_aire),  # Combustión isobárica
+            Turbina('4', '3', 'p1', self.pt_aire),
+        ])
     
     def calcular(self, parametros):
         """
@@ -32,23 +45,14 @@ class CicloDiesel:
             flujo_masico = parametros.get('flujo_masico', 1.0)
             rendimiento_comb = parametros.get('rendimiento_combustion', 0.95)
             
-            # 1-2: Compresión isentrópica
-            h1 = self.pt_aire.entalpia(p1, t1)
-            s1 = self.pt_aire.entropia(p1, t1)
-            p2 = p1 * (rc**1.4)  # Aprox. para aire
-            h2 = self.pt_aire.propiedades_estado(p2, s_kjkgK=s1)['h']
-            t2 = self.pt_aire.temperatura(p2, h2)
+            estados = self.grafo.evaluar({'p1': p1, 't1': t1, 'relacion_compresion': rc, 'relacion_corte': rcut})
+            h1, h2, h3, h4 = (estados[n]['h'] for n in ('1', '2', '3', '4'))
+            p2, t3 = estados['p2'], estados['t3']
             
             # 2-3: Combustión isobárica
-            p3 = p2
-            t3 = t2 * rcut  # Simplificación
-            h3 = self.pt_aire.entalpia(p3, t3)
             q_in = h3 - h2
             
             # 3-4: Expansión isentrópica
-            s3 = self.pt_aire.entropia(p3, t3)
-            p4 = p1
-            h4 = self.pt_aire.propiedades_estado(p4, s_kjkgK=s3)['h']
             w_turbina = h3 - h4
             
             # 4-1: Rechazo de calor
@@ -61,25 +65,24 @@ class CicloDiesel:
             if 'potencia' in parametros:
                 flujo_masico = parametros['potencia'] / w_neto
             
-            self.resultados = {
-                'Eficiencia térmica': (w_neto / q_in) * 100,
-                'Trabajo neto': w_neto,
-                'Calor añadido': q_in,
-                'Presión máxima': p2,
-                'Temperatura máxima': t3,
-                'Flujo másico': flujo_masico,
-                'Potencia neta': w_neto * flujo_masico
-            }
+            self.resultados = ResultadoCiclo(
+                ciclo="Ciclo Diesel",
+                valores={
+                    'Eficiencia térmica': (w_neto / q_in) * 100,
+                    'Trabajo neto': w_neto,
+                    'Calor añadido': q_in,
+                    'Presión máxima': p2,
+                    'Temperatura máxima': t3,
+                    'Flujo másico': flujo_masico,
+                    'Potencia neta': w_neto * flujo_masico
+                },
+                estados=copiar_estados(estados)
+            )
             
-            return self.formatear_resultados()
+            return self.resultados
             
         except Exception as e:
             raise ValueError(f"Error en cálculo Diesel: {str(e)}")
-    
-    def formatear_resultados(self):
-        return {k: f"{v:.2f} {'kJ/kg' if 'Calor' in k or 'Trabajo' in k else ''}" 
-                if isinstance(v, float) else v 
-                for k, v in self.resultados.items()}
 
 def calcular(parametros):
     return CicloDiesel().calcular(parametros)
\ No newline at end of file
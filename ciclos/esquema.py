@@ -0,0 +1,231 @@
+# Esquema de los parámetros de entrada de un ciclo
+# ciclos/esquema.py
+#
+# Cada ciclo del registro declara sus parámetros (nombre, unidad, valor por defecto y
+# límites) con Parametro. La interfaz genera el formulario a partir del esquema y Validador
+# convierte y comprueba los valores antes de calcular, ambos sin importar el módulo del
+# ciclo. Este módulo no debe importar CoolProp ni los ciclos.
+import math
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class Parametro:
+    """
+    Parámetro de entrada de un ciclo
+    Atributos:
+        nombre: Clave en el diccionario de parámetros (p. ej. 'p_alta')
+        etiqueta: Texto del formulario, sin la unidad
+        unidad: Unidad en que se introduce el valor ('' si es adimensional)
+        defecto: Valor inicial del formulario (None: campo vacío)
+        minimo, maximo: Límites admisibles, inclusivos (None: sin límite)
+        minimo_excluido: El mínimo no es admisible (p. ej. rendimientos en (0, 1])
+        obligatorio: El ciclo no puede calcularse sin él
+        tipo: float o str
+        lista: Admite varios valores separados por comas
+        opciones: Valores admitidos para los de tipo str
+    """
+    nombre: str
+    etiqueta: str
+    unidad: str = ''
+    defecto: object = None
+    minimo: float = None
+    maximo: float = None
+    minimo_excluido: bool = False
+    obligatorio: bool = False
+    tipo: type = float
+    lista: bool = False
+    opciones: tuple = None
+
+    @property
+    def texto_etiqueta(self):
+        """Etiqueta del formulario con la unidad, p. ej. 'Presión alta (bar):'"""
+        detalles = [self.unidad] if self.unidad else []
+        if self.lista:
+            detalles.append("/".join(self.opciones) if self.opciones else "separadas por comas")
+        return f"{self.etiqueta} ({', '.join(detalles)}):" if detalles else f"{self.etiqueta}:"
+
+# Parámetros que aceptan todos los ciclos
+PARAMETROS_COMUNES = (
+    Parametro('flujo_masico', "Flujo másico", 'kg/s', defecto=1.0, minimo=0.0, minimo_excluido=True),
+    Parametro('potencia', "Potencia objetivo", 'kW', minimo=0.0, minimo_excluido=True),
+)
+
+def esquema(*parametros):
+    """Esquema de un ciclo: los parámetros comunes seguidos de los propios"""
+    return PARAMETROS_COMUNES + parametros
+
+# Relaciones entre parámetros: funciones valores -> lista de errores (ver ErrorParametros)
+
+def decreciente(*nombres):
+    """
+    Relación que exige nombres[0] > nombres[1] > ... (p. ej. p_alta > p_extraccion > p_baja).
+    Los parámetros con varios valores cuentan con todos ellos, en el orden dado; los que
+    faltan no intervienen.
+    """
+    def comprobar(valores):
+        anterior = None
+        for nombre in nombres:
+            valor = valores.get(nombre)
+            if valor is None:
+                continue
+            for v in (valor if isinstance(valor, list) else [valor]):
+                if anterior is not None and not v < anterior[1]:
+                    mensaje = ("los valores deben ir de mayor a menor" if anterior[0] == nombre
+                               else f"debe ser menor que {anterior[0]}")
+                    return [{'parametro': nombre, 'valor': valor,
+                             'mensaje': f"{mensaje} ({' > '.join(nombres)})"}]
+                anterior = (nombre, v)
+        return []
+    return comprobar
+
+def alguno(*nombres):
+    """Relación que exige al menos uno de los parámetros (ciclos con entradas alternativas)"""
+    def comprobar(valores):
+        if any(valores.get(nombre) is not None for nombre in nombres):
+            return []
+        return [{'parametro': nombres[0], 'valor': None,
+                 'mensaje': f"es obligatorio (o bien {', '.join(nombres[1:])})"}]
+    return comprobar
+
+def misma_longitud(nombre, referencia):
+    """Relación que exige a nombre (si está) un valor por cada valor de referencia"""
+    def comprobar(valores):
+        valor, otro = valores.get(nombre), valores.get(referencia)
+        if valor is None or otro is None:
+            return []
+        n, m = (len(v) if isinstance(v, list) else 1 for v in (valor, otro))
+        if n != m:
+            return [{'parametro': nombre, 'valor': valor,
+                     'mensaje': f"debe tener un valor por cada valor de {referencia} ({m})"}]
+        return []
+    return comprobar
+
+class ErrorParametros(ValueError):
+    """
+    Parámetros inválidos, detectados antes de calcular
+    Atributos:
+        errores: Lista de {'parametro', 'valor', 'mensaje'}, uno por problema encontrado
+    """
+
+    def __init__(self, errores):
+        self.errores = errores
+        super().__init__("; ".join(f"{e['parametro']}: {e['mensaje']}" for e in errores))
+
+def _numero(valor):
+    """float a partir de un número o de un texto ('-5', '1e-2'); None si no es un número finito"""
+    if isinstance(valor, bool):
+        return None
+    try:
+        numero = float(valor.strip() if isinstance(valor, str) else valor)
+    except (TypeError, ValueError):
+        return None
+    return numero if math.isfinite(numero) else None
+
+def _limites(parametro):
+    """Texto del intervalo admisible, p. ej. 'entre 0.01 y 1000 bar'"""
+    unidad = f" {parametro.unidad}" if parametro.unidad else ""
+    if parametro.minimo_excluido:
+        partes = [f"mayor que {parametro.minimo:g}"]
+    elif parametro.minimo is not None and parametro.maximo is not None:
+        return f"debe estar entre {parametro.minimo:g} y {parametro.maximo:g}{unidad}"
+    else:
+        partes = [] if parametro.minimo is None else [f"mayor o igual que {parametro.minimo:g}"]
+    if parametro.maximo is not None:
+        partes.append(f"menor o igual que {parametro.maximo:g}")
+    return f"debe ser {' y '.join(partes)}{unidad}"
+
+def _convertidor(parametro):
+    """
+    Función valor -> (valor tipado, mensaje de error o None) de un parámetro, con el tipo,
+    las opciones y los límites resueltos una sola vez
+    """
+    minimo = -math.inf if parametro.minimo is None else parametro.minimo
+    maximo = math.inf if parametro.maximo is None else parametro.maximo
+    acotado = parametro.minimo is not None or parametro.maximo is not None
+    excluido = parametro.minimo_excluido
+
+    if parametro.tipo is float:
+        def uno(valor):
+            numero = _numero(valor)
+            if numero is None:
+                return None, f"'{valor}' no es un número"
+            if acotado and not ((minimo < numero if excluido else minimo <= numero) and numero <= maximo):
+                return None, _limites(parametro)
+            return numero, None
+    else:
+        opciones = parametro.opciones
+        def uno(valor):
+            texto = str(valor).strip()
+            if opciones is not None:
+                texto = texto.lower()
+                if texto not in opciones:
+                    return None, f"'{valor}' no es una opción válida ({', '.join(opciones)})"
+            return texto, None
+
+    if not parametro.lista:
+        return uno
+
+    def varios(valor):
+        partes = valor.split(',') if isinstance(valor, str) else valor if isinstance(valor, (list, tuple)) else [valor]
+        resultado = []
+        for parte in partes:
+            if isinstance(parte, str) and not parte.strip():
+                continue
+            convertido, error = uno(parte)
+            if error is not None:
+                return None, error
+            resultado.append(convertido)
+        if not resultado:
+            return None, None
+        # Un solo valor se entrega como escalar, como lo escribiría el usuario
+        return (resultado[0] if len(resultado) == 1 else resultado), None
+    return varios
+
+class Validador:
+    """
+    Validador compilado a partir del esquema de un ciclo: convierte los valores (texto del
+    formulario, campos CSV o números JSON) al tipo de cada parámetro y comprueba obligatorios,
+    opciones, límites y relaciones entre parámetros sin llamar a CoolProp. Un parámetro que
+    no está en el esquema es un error: el ciclo lo ignoraría o fallaría al usarlo.
+    Args:
+        parametros: Tupla de Parametro
+        relaciones: Funciones valores -> lista de errores (p. ej. decreciente(...))
+    """
+
+    def __init__(self, parametros, relaciones=()):
+        self.convertidores = {p.nombre: _convertidor(p) for p in parametros}
+        self.obligatorios = tuple(p.nombre for p in parametros if p.obligatorio)
+        self.relaciones = tuple(relaciones)
+
+    def validar(self, valores):
+        """
+        Parámetros tipados listos para el cálculo. Los campos vacíos se omiten (p. ej. columnas
+        CSV de otros ciclos).
+        Returns:
+            Diccionario de parámetros
+        Raises:
+            ErrorParametros con todos los problemas encontrados
+        """
+        resultado = {}
+        errores = []
+        for nombre, valor in valores.items():
+            if valor is None or (isinstance(valor, str) and not valor.strip()):
+                continue
+            convertir = self.convertidores.get(nombre)
+            if convertir is None:
+                errores.append({'parametro': nombre, 'valor': valor, 'mensaje': "no es un parámetro de este ciclo"})
+                continue
+            convertido, error = convertir(valor)
+            if error is not None:
+                errores.append({'parametro': nombre, 'valor': valor, 'mensaje': error})
+            elif convertido is not None:
+                resultado[nombre] = convertido
+        for nombre in self.obligatorios:
+            if nombre not in resultado and not any(e['parametro'] == nombre for e in errores):
+                errores.append({'parametro': nombre, 'valor': None, 'mensaje': "es obligatorio"})
+        if not errores:
+            for relacion in self.relaciones:
+                errores.extend(relacion(resultado))
+        if errores:
+            raise ErrorParametros(errores)
+        return resultado
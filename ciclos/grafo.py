@@ -0,0 +1,96 @@
+# Grafo de dependencias entre estados de un ciclo con recálculo incremental
+# ciclos/grafo.py
+
+class Nodo:
+    """
+    Estado (o etapa) de un ciclo
+    Args:
+        nombre: Identificador del nodo (p. ej. '2' o 'bomba')
+        entradas: Nombres de parámetros del ciclo o de otros nodos de los que depende
+        funcion: Función que recibe los valores de las entradas, en el mismo orden,
+                 y devuelve el resultado del nodo (normalmente un dict de propiedades)
+    """
+    __slots__ = ('nombre', 'entradas', 'funcion')
+
+    def __init__(self, nombre, entradas, funcion):
+        self.nombre = nombre
+        self.entradas = tuple(entradas)
+        self.funcion = funcion
+
+class GrafoCiclo:
+    """
+    Evalúa los nodos en orden topológico y memoriza el resultado de cada uno junto con
+    los valores de entrada que lo produjeron. En evaluaciones posteriores solo se
+    recalculan los nodos cuyas entradas cambiaron, es decir, los que quedan aguas abajo
+    de los parámetros modificados.
+    """
+
+    def __init__(self, nodos):
+        self.nodos = {nodo.nombre: nodo for nodo in nodos}
+        if len(self.nodos) != len(nodos):
+            raise ValueError("Nombres de nodo duplicados en el grafo del ciclo")
+        self.orden = self._ordenar()
+        self._memo = {}
+        self.recalculados = []
+
+    def _ordenar(self):
+        """Orden topológico (Kahn); las entradas que no son nodos se tratan como parámetros"""
+        pendientes = {nombre: {e for e in nodo.entradas if e in self.nodos}
+                      for nombre, nodo in self.nodos.items()}
+        orden = []
+        listos = [nombre for nombre, deps in pendientes.items() if not deps]
+        while listos:
+            nombre = listos.pop(0)
+            orden.append(nombre)
+            for otro, deps in pendientes.items():
+                if nombre in deps:
+                    deps.discard(nombre)
+                    if not deps and otro not in orden and otro not in listos:
+                        listos.append(otro)
+        if len(orden) != len(self.nodos):
+            ciclicos = sorted(set(self.nodos) - set(orden))
+            raise ValueError(f"Dependencia circular entre los nodos: {', '.join(ciclicos)}")
+        return orden
+
+    def parametros(self):
+        """Parámetros del ciclo usados por algún nodo"""
+        return {e for nodo in self.nodos.values() for e in nodo.entradas if e not in self.nodos}
+
+    def dependientes(self, parametro):
+        """Nodos que deben recalcularse si cambia un parámetro (o un nodo)"""
+        afectados = set()
+        for nombre in self.orden:
+            entradas = self.nodos[nombre].entradas
+            if parametro in entradas or afectados.intersection(entradas):
+                afectados.add(nombre)
+        return afectados
+
+    def evaluar(self, parametros):
+        """
+        Evaluar el grafo reutilizando los nodos cuyas entradas no han cambiado
+        Args:
+            parametros: Diccionario con todos los parámetros que usan los nodos
+        Returns:
+            Diccionario {nombre de nodo: resultado}
+        """
+        resultados = {}
+        self.recalculados = []
+        for nombre in self.orden:
+            nodo = self.nodos[nombre]
+            try:
+                valores = tuple(resultados[e] if e in resultados else parametros[e] for e in nodo.entradas)
+            except KeyError as e:
+                raise ValueError(f"Falta el parámetro {e} requerido por el estado {nombre}")
+            previo = self._memo.get(nombre)
+            if previo is not None and previo[0] == valores:
+                resultados[nombre] = previo[1]
+                continue
+            resultado = nodo.funcion(*valores)
+            self._memo[nombre] = (valores, resultado)
+            resultados[nombre] = resultado
+            self.recalculados.append(nombre)
+        return resultados
+
+    def olvidar(self):
+        """Descartar los resultados memorizados"""
+        self._memo.clear()
@@ -1,10 +1,22 @@
 # Módulo para resolver el ciclo Otto
 from util.propiedades import PropiedadesTermodinamicas
+from ciclos.resultado import ResultadoCiclo
+from ciclos.grafo import GrafoCiclo, Nodo
+from ciclos.componentes import Caldera, Compresor, EstadoPT, Turbina, copiar_estados
 
 class CicloOtto:
-    def __init__(self):
-        self.pt = PropiedadesTermodinamicas("Air")
-        self.resultados = {}
+    FLUIDO = "Air"
+
+    def __init__(self, pt=None):
+        self.pt = pt if pt is not None else PropiedadesTermodinamicas(self.FLUIDO)
+        self.resultados = None
+        self.grafo = GrafoCiclo([
+            EstadoPT('1', 'p1', 't1', self.pt),
+            Nodo('p2', ('p1', 'relacion_compresion'), lambda p1, rc: p1 * (rc**1.4)),
+            Compresor('2', '1', 'p2', self.pt),
+            Caldera('3', 'p2', 't3', self.pt),
+            Turbina('4', '3', 'p1', self.pt),
+        ])
     
     def calcular(self, parametros):
         """
@@ -26,21 +38,13 @@ class CicloOtto:
             
             flujo_masico = parametros.get('flujo_masico', 1.0)
             
-            # 1-2: Compresión isentrópica
-            h1 = self.pt.entalpia(p1, t1)
-            s1 = self.pt.entropia(p1, t1)
-            p2 = p1 * (rc**1.4)
-            h2 = self.pt.propiedades_estado(p2, s_kjkgK=s1)['h']
+            estados = self.grafo.evaluar({'p1': p1, 't1': t1, 't3': t3, 'relacion_compresion': rc})
+            h1, h2, h3, h4 = (estados[n]['h'] for n in ('1', '2', '3', '4'))
+            p2 = estados['p2']
             
             # 2-3: Adición de calor isocórica
-            h3 = self.pt.entalpia(p2, t3)
             q_in = h3 - h2
             
-            # 3-4: Expansión isentrópica
-            s3 = self.pt.entropia(p2, t3)
-            p4 = p1
-            h4 = self.pt.propiedades_estado(p4, s_kjkgK=s3)['h']
-            
             # 4-1: Rechazo de calor
             q_out = h4 - h1
             
@@ -49,24 +53,23 @@ class CicloOtto:
             if 'potencia' in parametros:
                 flujo_masico = parametros['potencia'] / w_neto
             
-            self.resultados = {
-                'Eficiencia térmica': (1 - (1/rc)**0.4) * 100,
-                'Trabajo neto': w_neto,
-                'Calor añadido': q_in,
-                'Presión máxima': p2,
-                'Flujo másico': flujo_masico,
-                'Potencia neta': w_neto * flujo_masico
-            }
+            self.resultados = ResultadoCiclo(
+                ciclo="Ciclo Otto",
+                valores={
+                    'Eficiencia térmica': (1 - (1/rc)**0.4) * 100,
+                    'Trabajo neto': w_neto,
+                    'Calor añadido': q_in,
+                    'Presión máxima': p2,
+                    'Flujo másico': flujo_masico,
+                    'Potencia neta': w_neto * flujo_masico
+                },
+                estados=copiar_estados(estados)
+            )
             
-            return self.formatear_resultados()
+            return self.resultados
             
         except Exception as e:
             raise ValueError(f"Error en cálculo Otto: {str(e)}")
-    
-    def formatear_resultados(self):
-        return {k: f"{v:.2f} {'kJ/kg' if k in ['Trabajo neto', 'Calor añadido'] else ''}" 
-                if isinstance(v, float) else v 
-                for k, v in self.resultados.items()}
 
 def calcular(parametros):
     return CicloOtto().calcular(parametros)
\ No newline at end of file
@@ -1,12 +1,24 @@
 
 from util.propiedades import PropiedadesTermodinamicas
 from util.helpers import balance_energia
+from ciclos.resultado import ResultadoCiclo
+from ciclos.grafo import GrafoCiclo
+from ciclos.componentes import Bomba, Caldera, Condensador, Turbina, copiar_estados
 from math import isclose
 
 class CicloRankine:
-    def __init__(self):
-        self.pt = PropiedadesTermodinamicas("Water")
-        self.resultados = {}
+    FLUIDO = "Water"
+
+    def __init__(self, pt=None):
+        # pt permite usar otro backend de propiedades (p. ej. tabular para barridos)
+        self.pt = pt if pt is not None else PropiedadesTermodinamicas(self.FLUIDO)
+        self.resultados = None
+        self.grafo = GrafoCiclo([
+            Condensador('4', 'p_baja', self.pt),
+            Bomba('1', '4', 'p_alta', self.pt, 'rendimiento_bomba'),
+            Caldera('2', 'p_alta', 't_max', self.pt),
+            Turbina('3', '2', 'p_baja', self.pt, 'rendimiento_turbina'),
+        ])
     
     def calcular(self, parametros):
         """
@@ -30,30 +42,27 @@ class CicloRankine:
             
             # Parámetros opcionales con defaults
             flujo_masico = parametros.get('flujo_masico', 1.0)
-            rendimiento_turbina = parametros.get('rendimiento_turbina', 1.0)
-            rendimiento_bomba = parametros.get('rendimiento_bomba', 1.0)
+            
+            estados = self.grafo.evaluar({
+                'p_alta': p_alta,
+                'p_baja': p_baja,
+                't_max': t_max,
+                'rendimiento_turbina': parametros.get('rendimiento_turbina', 1.0),
+                'rendimiento_bomba': parametros.get('rendimiento_bomba', 1.0),
+            })
+            h1, h2, h3, h4 = (estados[n]['h'] for n in ('1', '2', '3', '4'))
             
             # 1. Calentamiento en caldera (1-2)
-            h1 = self.pt.entalpia(p_alta, 0.01)  # Líquido saturado a p_alta
-            h2 = self.pt.entalpia(p_alta, t_max)  # Vapor sobrecalentado
-            q_in = h2 - h1
+            q_in = h2 - h1  # La caldera recibe el agua a la salida de la bomba
             
             # 2. Expansión en turbina (2-3)
-            s2 = self.pt.entropia(p_alta, t_max)
-            h3s = self.pt.propiedades_estado(p_baja, s_kjkgK=s2)['h']  # Isentrópico
-            h3 = h2 - rendimiento_turbina * (h2 - h3s)
             w_turbina = h2 - h3
             
             # 3. Condensación (3-4)
-            h4 = self.pt.entalpia(p_baja, 0.01)  # Líquido saturado a p_baja
             q_out = h3 - h4
             
             # 4. Compresión en bomba (4-1)
-            s4 = self.pt.entropia(p_baja, 0.01)
-            h1s = self.pt.propiedades_estado(p_alta, s_kjkgK=s4)['h']
-            w_bomba_s = h1s - h4
-            w_bomba = w_bomba_s / rendimiento_bomba
-            h1_real = h4 + w_bomba
+            w_bomba = h1 - h4
             
             # Si se especificó potencia, recalcular flujo másico
             if 'potencia' in parametros:
@@ -62,36 +71,81 @@ class CicloRankine:
                 flujo_masico = potencia / w_neto
             
             # Resultados
-            self.resultados = {
-                'Eficiencia térmica': (w_turbina - w_bomba) / q_in * 100,
+            estados = copiar_estados(estados)
+            estados['1']['T'] = self.pt.temperatura(p_alta, h1)
+            
+            self.resultados = ResultadoCiclo(
+                ciclo="Rankine Simple",
+                valores={
+                    'Eficiencia térmica': (w_turbina - w_bomba) / q_in * 100,
+                    'Trabajo turbina': w_turbina,
+                    'Trabajo bomba': w_bomba,
+                    'Calor añadido': q_in,
+                    'Calor rechazado': q_out,
+                    'Flujo másico': flujo_masico,
+                    'Potencia neta': (w_turbina - w_bomba) * flujo_masico
+                },
+                estados=estados
+            )
+            
+            return self.resultados
+            
+        except Exception as e:
+            raise ValueError(f"Error en cálculo Rankine: {str(e)}")
+    
+    def calcular_lote(self, p_alta, p_baja, t_max, rendimiento_turbina=1.0, rendimiento_bomba=1.0,
+                      flujo_masico=1.0):
+        """
+        Calcula el ciclo Rankine simple para lotes de parámetros
+        Todos los argumentos aceptan escalares o arrays de NumPy que se combinan por
+        broadcasting (p. ej. p_alta[:, None] y t_max[None, :] para una malla).
+        Las propiedades se evalúan por array, una llamada vectorizada por estado.
+        
+        Returns:
+            Diccionario columnar de arrays con las mismas claves numéricas que calcular
+        """
+        import numpy as np
+        
+        p_alta, p_baja, t_max, rendimiento_turbina, rendimiento_bomba, flujo_masico = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in
+              (p_alta, p_baja, t_max, rendimiento_turbina, rendimiento_bomba, flujo_masico)))
+        
+        try:
+            # 1. Calentamiento en caldera (1-2)
+            estado2 = self.pt.propiedades_estado_v(p_alta, t_c=t_max)
+            h2 = estado2['h']
+            
+            # 2. Expansión en turbina (2-3)
+            h3s = self.pt.propiedades_estado_v(p_baja, s_kjkgK=estado2['s'])['h']
+            h3 = h2 - rendimiento_turbina * (h2 - h3s)
+            w_turbina = h2 - h3
+            
+            # 3. Condensación (3-4)
+            estado4 = self.pt.propiedades_estado_v(p_baja, x=0.0)
+            h4 = estado4['h']
+            q_out = h3 - h4
+            
+            # 4. Compresión en bomba (4-1)
+            h1s = self.pt.propiedades_estado_v(p_alta, s_kjkgK=estado4['s'])['h']
+            w_bomba = (h1s - h4) / rendimiento_bomba
+            q_in = h2 - (h4 + w_bomba)
+            
+            w_neto = w_turbina - w_bomba
+            return {
+                'Eficiencia térmica': w_neto / q_in * 100,
                 'Trabajo turbina': w_turbina,
                 'Trabajo bomba': w_bomba,
                 'Calor añadido': q_in,
                 'Calor rechazado': q_out,
                 'Flujo másico': flujo_masico,
-                'Potencia neta': (w_turbina - w_bomba) * flujo_masico,
-                'Estado 1': {'h': h1_real, 's': s4, 'p': p_alta, 'T': self.pt.temperatura(p_alta, h1_real)},
-                'Estado 2': {'h': h2, 's': s2, 'p': p_alta, 'T': t_max},
-                'Estado 3': {'h': h3, 'p': p_baja},
-                'Estado 4': {'h': h4, 's': s4, 'p': p_baja, 'T': self.pt.temperatura(p_baja, h4)}
+                'Potencia neta': w_neto * flujo_masico
             }
             
-            return self.formatear_resultados()
-            
         except Exception as e:
             raise ValueError(f"Error en cálculo Rankine: {str(e)}")
-    
-    def formatear_resultados(self):
-        return {
-            'Eficiencia térmica': f"{self.resultados['Eficiencia térmica']:.2f}%",
-            'Trabajo turbina': f"{self.resultados['Trabajo turbina']:.2f} kJ/kg",
-            'Trabajo bomba': f"{self.resultados['Trabajo bomba']:.2f} kJ/kg",
-            'Calor añadido': f"{self.resultados['Calor añadido']:.2f} kJ/kg",
-            'Calor rechazado': f"{self.resultados['Calor rechazado']:.2f} kJ/kg",
-            'Flujo másico': f"{self.resultados['Flujo másico']:.3f} kg/s",
-            'Potencia neta': f"{self.resultados['Potencia neta']:.3f} kW",
-            'Estados termodinámicos': self.resultados['Estado 1'] | self.resultados['Estado 2'] | self.resultados['Estado 3'] | self.resultados['Estado 4']
-        }
 
 def calcular(parametros):
-    return CicloRankine().calcular(parametros)
\ No newline at end of file
+    return CicloRankine().calcular(parametros)
+
+def calcular_lote(p_alta, p_baja, t_max, rendimiento_turbina=1.0, rendimiento_bomba=1.0, flujo_masico=1.0):
+    return CicloRankine().calcular_lote(p_alta, p_baja, t_max, rendimiento_turbina, rendimiento_bomba, flujo_masico)
\ No newline at end of file
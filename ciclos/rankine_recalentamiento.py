@@ -1,9 +1,25 @@
 from util.propiedades import PropiedadesTermodinamicas
+from ciclos.resultado import ResultadoCiclo
+from ciclos.grafo import GrafoCiclo
+from ciclos.componentes import Bomba, Caldera, Condensador, Recalentador, Turbina, copiar_estados
 
 class CicloRankineRecalentamiento:
-    def __init__(self):
-        self.pt = PropiedadesTermodinamicas("Water")
-        self.resultados = {}
+    FLUIDO = "Water"
+
+    def __init__(self, pt=None):
+        self.pt = pt if pt is not None else PropiedadesTermodinamicas(self.FLUIDO)
+        self.resultados = None
+        # Los estados se evalúan sobre un grafo de dependencias: al repetir el cálculo
+        # con la misma instancia solo se recalculan los estados afectados por los
+        # parámetros que cambiaron (p. ej. t_recal no rehace la bomba 1-2)
+        self.grafo = GrafoCiclo([
+            Condensador('1', 'p_baja', self.pt),
+            Bomba('2', '1', 'p_alta', self.pt, 'rendimiento_bomba'),
+            Caldera('3', 'p_alta', 't_max', self.pt),
+            Turbina('4', '3', 'p_media', self.pt, 'rendimiento_turbina_HP'),
+            Recalentador('5', 'p_media', 't_recal', self.pt),
+            Turbina('6', '5', 'p_baja', self.pt, 'rendimiento_turbina_LP'),
+        ])
 
     def calcular(self, parametros):
         """
@@ -22,40 +38,21 @@ class CicloRankineRecalentamiento:
         - rendimiento_bomba: (0-1)
         """
         try:
-            # Parámetros obligatorios
-            p_alta = parametros['p_alta']
-            p_media = parametros['p_media']
-            p_baja = parametros['p_baja']
-            t_max = parametros['t_max']
-            t_recal = parametros['t_recal']
-            
-            # Parámetros opcionales
+            # Parámetros del grafo de estados (opcionales con defaults)
+            entradas = {
+                'p_alta': parametros['p_alta'],
+                'p_media': parametros['p_media'],
+                'p_baja': parametros['p_baja'],
+                't_max': parametros['t_max'],
+                't_recal': parametros['t_recal'],
+                'rendimiento_turbina_HP': parametros.get('rendimiento_turbina_HP', 0.85),
+                'rendimiento_turbina_LP': parametros.get('rendimiento_turbina_LP', 0.85),
+                'rendimiento_bomba': parametros.get('rendimiento_bomba', 0.8),
+            }
             flujo_masico = parametros.get('flujo_masico', 1.0)
-            rend_turb_HP = parametros.get('rendimiento_turbina_HP', 0.85)
-            rend_turb_LP = parametros.get('rendimiento_turbina_LP', 0.85)
-            rend_bomba = parametros.get('rendimiento_bomba', 0.8)
-
-            # 1-2: Bomba
-            h1 = self.pt.entalpia(p_baja, 0.01)
-            s1 = self.pt.entropia(p_baja, 0.01)
-            h2s = self.pt.propiedades_estado(p_alta, s_kjkgK=s1)['h']
-            h2 = h1 + (h2s - h1)/rend_bomba
-
-            # 2-3: Calentamiento en caldera
-            h3 = self.pt.entalpia(p_alta, t_max)
-            s3 = self.pt.entropia(p_alta, t_max)
-
-            # 3-4: Expansión HP
-            h4s = self.pt.propiedades_estado(p_media, s_kjkgK=s3)['h']
-            h4 = h3 - rend_turb_HP*(h3 - h4s)
-
-            # 4-5: Recalentamiento
-            h5 = self.pt.entalpia(p_media, t_recal)
-            s5 = self.pt.entropia(p_media, t_recal)
 
-            # 5-6: Expansión LP
-            h6s = self.pt.propiedades_estado(p_baja, s_kjkgK=s5)['h']
-            h6 = h5 - rend_turb_LP*(h5 - h6s)
+            estados = self.grafo.evaluar(entradas)
+            h1, h2, h3, h4, h5, h6 = (estados[n]['h'] for n in ('1', '2', '3', '4', '5', '6'))
 
             # 6-1: Condensación
             q_out = h6 - h1
@@ -70,46 +67,25 @@ class CicloRankineRecalentamiento:
             if 'potencia' in parametros:
                 flujo_masico = parametros['potencia'] / w_neto
 
-            self.resultados = {
-                'Eficiencia térmica': (w_neto / q_in) * 100,
-                'Trabajo turbina HP': w_turb_HP,
-                'Trabajo turbina LP': w_turb_LP,
-                'Trabajo bomba': w_bomba,
-                'Calor añadido': q_in,
-                'Calor recalentamiento': h5 - h4,
-                'Flujo másico': flujo_masico,
-                'Potencia neta': w_neto * flujo_masico,
-                'Estados': {
-                    '1': {'p': p_baja, 'h': h1},
-                    '2': {'p': p_alta, 'h': h2},
-                    '3': {'p': p_alta, 'h': h3, 'T': t_max},
-                    '4': {'p': p_media, 'h': h4},
-                    '5': {'p': p_media, 'h': h5, 'T': t_recal},
-                    '6': {'p': p_baja, 'h': h6}
-                }
-            }
-
-            return self.formatear_resultados()
+            self.resultados = ResultadoCiclo(
+                ciclo="Rankine con Recalentamiento",
+                valores={
+                    'Eficiencia térmica': (w_neto / q_in) * 100,
+                    'Trabajo turbina HP': w_turb_HP,
+                    'Trabajo turbina LP': w_turb_LP,
+                    'Trabajo bomba': w_bomba,
+                    'Calor añadido': q_in,
+                    'Calor recalentamiento': h5 - h4,
+                    'Flujo másico': flujo_masico,
+                    'Potencia neta': w_neto * flujo_masico
+                },
+                estados=copiar_estados(estados)
+            )
+
+            return self.resultados
 
         except Exception as e:
             raise ValueError(f"Error en cálculo Rankine Recalentamiento: {str(e)}")
 
-    def formatear_resultados(self):
-        formatted = {k: f"{v:.2f} {self.get_unidad(k)}" 
-                    if isinstance(v, (float, int)) else v 
-                    for k, v in self.resultados.items()}
-        return formatted
-
-    def get_unidad(self, key):
-        if 'Eficiencia' in key:
-            return '%'
-        elif 'Trabajo' in key or 'Calor' in key:
-            return 'kJ/kg'
-        elif 'Flujo' in key:
-            return 'kg/s'
-        elif 'Potencia' in key:
-            return 'kW'
-        return ''
-
 def calcular(parametros):
     return CicloRankineRecalentamiento().calcular(parametros)
\ No newline at end of file
@@ -1,10 +1,31 @@
 # Módulo para resolver el ciclo Rankine regenerativo
+#
+# Con una presión de extracción se resuelve el ciclo de un calentador abierto sobre el
+# grafo de componentes. Con varias (lista o texto separado por comas) se usa el modo de
+# N calentadores abiertos y cerrados de calcular_lote, que plantea los balances de todos
+# los calentadores como un único sistema lineal en las fracciones de extracción.
 from util.propiedades import PropiedadesTermodinamicas
+from ciclos.resultado import ResultadoCiclo
+from ciclos.grafo import GrafoCiclo
+from ciclos.componentes import Bomba, Caldera, CalentadorAbierto, Condensador, Turbina, copiar_estados
 
 class CicloRankineRegenerativo:
-    def __init__(self):
-        self.pt = PropiedadesTermodinamicas("Water")
-        self.resultados = {}
+    FLUIDO = "Water"
+
+    def __init__(self, pt=None):
+        self.pt = pt if pt is not None else PropiedadesTermodinamicas(self.FLUIDO)
+        self.resultados = None
+        # 2: salida de caldera, 3: extracción, 5: salida de turbina al condensador,
+        # 4/4b: condensador y bomba de baja, 1/1b: calentador abierto y bomba de alta
+        self.grafo = GrafoCiclo([
+            Caldera('2', 'p_alta', 't_max', self.pt),
+            Turbina('3', '2', 'p_extraccion', self.pt, 'rendimiento_turbina'),
+            Turbina('5', '3', 'p_baja', self.pt, 'rendimiento_turbina'),
+            Condensador('4', 'p_baja', self.pt),
+            Bomba('4b', '4', 'p_extraccion', self.pt),
+            CalentadorAbierto('1', '3', '4b', 'p_extraccion', self.pt),
+            Bomba('1b', '1', 'p_alta', self.pt),
+        ])
     
     def calcular(self, parametros):
         """
@@ -12,66 +33,284 @@ class CicloRankineRegenerativo:
         - p_alta: [bar]
         - p_baja: [bar]
         - t_max: [°C]
-        - p_extraccion: [bar]
+        - p_extraccion: [bar] (una o varias, de mayor a menor)
         
         Opcionales:
         - flujo_masico: [kg/s]
         - potencia: [kW]
         - rendimiento_turbina: (0-1)
+        - tipos_calentadores: 'abierto'/'cerrado' por extracción (default: todos abiertos)
+        - rendimiento_bomba: (0-1), solo con varias extracciones (default: 1)
         """
+        p_extraccion = _lista(parametros.get('p_extraccion'), float)
+        if p_extraccion is not None and (len(p_extraccion) > 1 or 'tipos_calentadores' in parametros):
+            return self._calcular_calentadores(parametros, p_extraccion)
         try:
             p_alta = parametros['p_alta']
             p_baja = parametros['p_baja']
             t_max = parametros['t_max']
-            p_extra = parametros['p_extraccion']
+            p_extra = p_extraccion[0] if p_extraccion is not None else parametros['p_extraccion']
             
             flujo_masico = parametros.get('flujo_masico', 1.0)
             rend_turbina = parametros.get('rendimiento_turbina', 0.85)
             
-            # Calcular estados principales
-            h1 = self.pt.entalpia(p_alta, 0.01)
-            h2 = self.pt.entalpia(p_alta, t_max)
-            s2 = self.pt.entropia(p_alta, t_max)
-            
-            # Extracción (punto 3)
-            h3s = self.pt.propiedades_estado(p_extra, s_kjkgK=s2)['h']
-            h3 = h2 - rend_turbina*(h2 - h3s)
-            
-            # Condensación (punto 4)
-            h4 = self.pt.entalpia(p_baja, 0.01)
+            estados = self.grafo.evaluar({
+                'p_alta': p_alta,
+                'p_baja': p_baja,
+                't_max': t_max,
+                'p_extraccion': p_extra,
+                'rendimiento_turbina': rend_turbina,
+            })
+            h1, h1b, h2, h3, h_salida, h4, h4b = (
+                estados[n]['h'] for n in ('1', '1b', '2', '3', '5', '4', '4b'))
             
-            # Calentador abierto
-            y = (h1 - h4)/(h3 - h4)  # Fracción de extracción
+            y = estados['1']['y']  # Fracción de extracción
             
             # Balances de energía
-            q_in = h2 - h1
-            w_turbina = (h2 - h3) + (1-y)*(h3 - h4)
-            w_bomba = (1-y)*(h1 - h4)
+            q_in = h2 - h1b
+            w_turbina = (h2 - h3) + (1-y)*(h3 - h_salida)
+            w_bomba = (1-y)*(h4b - h4) + (h1b - h1)
             
             eficiencia = (w_turbina - w_bomba)/q_in
             
             if 'potencia' in parametros:
                 flujo_masico = parametros['potencia'] / (w_turbina - w_bomba)
             
-            self.resultados = {
-                'Eficiencia térmica': eficiencia * 100,
-                'Fracción extracción': y * 100,
+            # Resultados
+            estados = copiar_estados(estados)
+            estados['3']['s'] = self.pt.propiedades_estado(p_extra, h_kjkg=h3)['s']  # Ya en caché (turbina LP)
+            
+            self.resultados = ResultadoCiclo(
+                ciclo="Rankine Regenerativo",
+                valores={
+                    'Eficiencia térmica': eficiencia * 100,
+                    'Fracción extracción 1': y * 100,
+                    'Trabajo turbina': w_turbina,
+                    'Trabajo bomba': w_bomba,
+                    'Calor añadido': q_in,
+                    'Calor rechazado': q_in - (w_turbina - w_bomba),
+                    'Flujo másico': flujo_masico,
+                    'Potencia neta': (w_turbina - w_bomba) * flujo_masico
+                },
+                estados=estados
+            )
+            
+            return self.resultados
+            
+        except Exception as e:
+            raise ValueError(f"Error en cálculo Rankine Regenerativo: {str(e)}")
+
+    def _calcular_calentadores(self, parametros, p_extraccion):
+        """Ciclo con varios calentadores (un punto de calcular_lote) como ResultadoCiclo"""
+        try:
+            tipos = _lista(parametros.get('tipos_calentadores'), str)
+            lote = self.calcular_lote(
+                parametros['p_alta'], parametros['p_baja'], parametros['t_max'], p_extraccion, tipos,
+                parametros.get('rendimiento_turbina', 0.85), parametros.get('rendimiento_bomba', 1.0),
+                devolver_estados=True)
+            estados = lote.pop('estados')
+            
+            flujo_masico = parametros.get('flujo_masico', 1.0)
+            if 'potencia' in parametros:
+                flujo_masico = parametros['potencia'] / lote['Potencia neta']  # Potencia por kg/s
+            lote['Flujo másico'] = flujo_masico
+            lote['Potencia neta'] = lote['Potencia neta'] * flujo_masico
+
+            valores = {clave: float(valor) for clave, valor in lote.items()}
+
+            self.resultados = ResultadoCiclo(
+                ciclo="Rankine Regenerativo",
+                valores=valores,
+                estados={nombre: {propiedad: float(valor) for propiedad, valor in estado.items()}
+                         for nombre, estado in estados.items()}
+            )
+            return self.resultados
+
+        except Exception as e:
+            raise ValueError(f"Error en cálculo Rankine Regenerativo: {str(e)}")
+
+    def calcular_lote(self, p_alta, p_baja, t_max, p_extraccion, tipos=None, rendimiento_turbina=0.85,
+                      rendimiento_bomba=1.0, flujo_masico=1.0, devolver_estados=False):
+        """
+        Ciclo Rankine regenerativo con N calentadores de agua de alimentación, para lotes
+        de parámetros (escalares o arrays de NumPy combinados por broadcasting).
+        
+        Las fracciones extraídas se obtienen resolviendo a la vez los balances de masa y
+        energía de todos los calentadores como un sistema lineal de 2N ecuaciones por punto
+        (np.linalg.solve sobre todo el lote), sin iterar calentador a calentador.
+        - Calentador abierto: sale líquido saturado a su presión y una bomba lo lleva a la
+          presión del siguiente calentador abierto (o a p_alta).
+        - Calentador cerrado: el agua sale a la temperatura de saturación de la extracción
+          (diferencia terminal nula) y el condensado, líquido saturado, se lamina hacia el
+          calentador anterior (o al condensador si es el último).
+        
+        Args:
+            p_extraccion: Presiones de extracción [bar], de mayor a menor, en el último eje
+                          (forma (..., N); p. ej. un conjunto de presiones por fila)
+            tipos: 'abierto' o 'cerrado' por calentador (default: todos abiertos)
+            devolver_estados: Añadir 'estados' con las entalpías de extracción y del agua
+                              de alimentación
+        Returns:
+            Diccionario columnar de arrays con las mismas claves numéricas que calcular
+            ('Fracción extracción 1' a 'Fracción extracción N', en % del caudal de caldera)
+        """
+        import numpy as np
+        
+        p_extraccion = np.asarray(p_extraccion, dtype=float)
+        if p_extraccion.ndim == 0:
+            p_extraccion = p_extraccion[None]
+        n = p_extraccion.shape[-1]
+        tipos = tuple(tipos) if tipos else ('abierto',) * n
+        if len(tipos) != n or any(tipo not in ('abierto', 'cerrado') for tipo in tipos):
+            raise ValueError(f"Se necesita un tipo 'abierto' o 'cerrado' por cada una de las {n} extracciones")
+        
+        p_alta, p_baja, t_max, rendimiento_turbina, rendimiento_bomba, flujo_masico = (
+            np.asarray(v, dtype=float) for v in
+            (p_alta, p_baja, t_max, rendimiento_turbina, rendimiento_bomba, flujo_masico))
+        forma = np.broadcast_shapes(p_alta.shape, p_baja.shape, t_max.shape, rendimiento_turbina.shape,
+                                    rendimiento_bomba.shape, flujo_masico.shape, p_extraccion.shape[:-1])
+        p_alta, p_baja, t_max, rendimiento_turbina, rendimiento_bomba, flujo_masico = (
+            np.broadcast_to(v, forma) for v in
+            (p_alta, p_baja, t_max, rendimiento_turbina, rendimiento_bomba, flujo_masico))
+        p_ext = np.broadcast_to(p_extraccion, forma + (n,))
+        
+        presiones = np.concatenate([p_alta[..., None], p_ext, p_baja[..., None]], axis=-1)
+        if np.any(np.diff(presiones, axis=-1) >= 0):
+            raise ValueError("Las presiones de extracción deben ir de mayor a menor entre p_alta y p_baja")
+        
+        abiertos = [j for j in range(n) if tipos[j] == 'abierto']
+        cerrados = [j for j in range(n) if tipos[j] == 'cerrado']
+        
+        # Presión del agua de alimentación en cada calentador: la del calentador si es
+        # abierto; si es cerrado, la del siguiente abierto aguas arriba (o p_alta)
+        destino = []  # Índice del calentador abierto aguas arriba de j (None = caldera)
+        for j in range(n):
+            k = j - 1
+            while k >= 0 and tipos[k] != 'abierto':
+                k -= 1
+            destino.append(k if k >= 0 else None)
+        p_destino = np.stack([p_ext[..., k] if k is not None else p_alta for k in destino], axis=-1)
+        p_linea = np.where(np.array([tipo == 'abierto' for tipo in tipos]), p_ext, p_destino)
+        
+        def bomba(h, s, p_salida, rendimiento):
+            h_s = self.pt.propiedades_estado_v(p_salida, s_kjkgK=s)['h']
+            return h + (h_s - h) / rendimiento
+        
+        try:
+            # Caldera y expansión por etapas entre extracciones
+            estado2 = self.pt.propiedades_estado_v(p_alta, t_c=t_max)
+            h_etapas = [estado2['h']]
+            s_entrada = estado2['s']
+            for j in range(n + 1):
+                p_salida = p_ext[..., j] if j < n else p_baja
+                h_s = self.pt.propiedades_estado_v(p_salida, s_kjkgK=s_entrada)['h']
+                h = h_etapas[-1] - rendimiento_turbina * (h_etapas[-1] - h_s)
+                h_etapas.append(h)
+                if j < n:
+                    s_entrada = self.pt.propiedades_estado_v(p_salida, h_kjkg=h)['s']
+            h_ext = np.stack(h_etapas[1:n + 1], axis=-1)
+            
+            # Líquido saturado en cada calentador (salida de abiertos y condensado de cerrados)
+            saturado = self.pt.propiedades_estado_v(p_ext, x=0.0)
+            h_f = saturado['h']
+            condensador = self.pt.propiedades_estado_v(p_baja, x=0.0)
+            
+            # Agua de alimentación: entalpía de entrada y salida de cada calentador
+            h_salida = h_f.copy()
+            if cerrados:
+                h_salida[..., cerrados] = self.pt.propiedades_estado_v(
+                    p_linea[..., cerrados], t_c=saturado['T'][..., cerrados])['h']
+            h_bombas = None
+            if abiertos:
+                h_bombas = np.empty(forma + (n,))
+                h_bombas[..., abiertos] = bomba(h_f[..., abiertos], saturado['s'][..., abiertos],
+                                                p_destino[..., abiertos], rendimiento_bomba[..., None])
+            h_condensado = bomba(condensador['h'], condensador['s'], p_linea[..., n - 1], rendimiento_bomba)
+            h_entrada = np.empty(forma + (n,))
+            h_entrada[..., n - 1] = h_condensado
+            for j in range(n - 1, 0, -1):
+                h_entrada[..., j - 1] = h_bombas[..., j] if tipos[j] == 'abierto' else h_salida[..., j]
+            h_alimentacion = h_bombas[..., 0] if tipos[0] == 'abierto' else h_salida[..., 0]
+            
+            # Sistema lineal: incógnitas [y_0..y_N-1, F_0..F_N-1], con F_j el caudal de agua
+            # que entra al calentador j por unidad de caudal de caldera
+            A = np.zeros(forma + (2 * n, 2 * n))
+            b = np.zeros(forma + (2 * n,))
+            for j in range(n):
+                # Condensados laminados desde los cerrados inmediatamente aguas arriba
+                cadena = []
+                k = j - 1
+                while k >= 0 and tipos[k] == 'cerrado':
+                    cadena.append(k)
+                    k -= 1
+                signo = -1.0 if tipos[j] == 'abierto' else 1.0
+                # Masa: abierto F_sal = F_j + y_j + drenajes; cerrado F_j = F_sal
+                A[..., j, n + j] = signo
+                if tipos[j] == 'abierto':
+                    A[..., j, j] = -1.0
+                    for k in cadena:
+                        A[..., j, k] = -1.0
+                if j > 0:
+                    A[..., j, n + j - 1] = -signo
+                else:
+                    b[..., j] = signo
+                # Energía: y_j (h_ext - h_f) + drenajes (h_f anterior - h_f) = F_j (h_sal - h_ent)
+                A[..., n + j, j] = h_ext[..., j] - h_f[..., j]
+                for k in cadena:
+                    A[..., n + j, k] += h_f[..., j - 1] - h_f[..., j]
+                A[..., n + j, n + j] = h_entrada[..., j] - h_salida[..., j]
+            solucion = np.linalg.solve(A, b[..., None])[..., 0]
+            y = solucion[..., :n]
+            caudal = solucion[..., n:]
+            
+            # Balances de energía por unidad de caudal de caldera
+            caudal_turbina = np.concatenate([np.ones(forma + (1,)), 1 - np.cumsum(y, axis=-1)], axis=-1)
+            w_turbina = sum(caudal_turbina[..., j] * (h_etapas[j] - h_etapas[j + 1]) for j in range(n + 1))
+            w_bomba = caudal[..., n - 1] * (h_condensado - condensador['h'])
+            for j in abiertos:
+                caudal_salida = caudal[..., j - 1] if j > 0 else 1.0
+                w_bomba = w_bomba + caudal_salida * (h_bombas[..., j] - h_f[..., j])
+            q_in = estado2['h'] - h_alimentacion
+            w_neto = w_turbina - w_bomba
+            
+            lote = {'Eficiencia térmica': w_neto / q_in * 100}
+            for j in range(n):
+                lote[f'Fracción extracción {j + 1}'] = y[..., j] * 100
+            lote.update({
                 'Trabajo turbina': w_turbina,
                 'Trabajo bomba': w_bomba,
                 'Calor añadido': q_in,
+                'Calor rechazado': q_in - w_neto,
                 'Flujo másico': flujo_masico,
-                'Potencia neta': (w_turbina - w_bomba) * flujo_masico
-            }
-            
-            return self.formatear_resultados()
+                'Potencia neta': w_neto * flujo_masico
+            })
+            if devolver_estados:
+                estados = {'2': {'p': p_alta, 'h': estado2['h'], 's': estado2['s'], 'T': t_max}}
+                for j in range(n):
+                    estados[f'E{j + 1}'] = {'p': p_ext[..., j], 'h': h_ext[..., j]}
+                    estados[f'C{j + 1}'] = {'p': p_linea[..., j], 'h': h_salida[..., j]}
+                estados['5'] = {'p': p_baja, 'h': h_etapas[-1]}
+                estados['4'] = {'p': p_baja, 'h': condensador['h'], 's': condensador['s'], 'T': condensador['T']}
+                lote['estados'] = estados
+            return lote
             
-        except Exception as e:
-            raise ValueError(f"Error en cálculo Rankine Regenerativo: {str(e)}")
-    
-    def formatear_resultados(self):
-        return {k: f"{v:.2f} {'%' if 'Eficiencia' in k or 'Fracción' in k else 'kJ/kg' if 'Trabajo' in k or 'Calor' in k else ''}" 
-                if isinstance(v, float) else v 
-                for k, v in self.resultados.items()}
+        except np.linalg.LinAlgError as e:
+            raise ValueError(f"Balances de calentadores sin solución: {str(e)}")
+
+def _lista(valor, convertir):
+    """Lista de valores a partir de una secuencia o de un texto separado por comas"""
+    if valor is None or valor == '':
+        return None
+    if isinstance(valor, str):
+        return [convertir(parte.strip()) for parte in valor.split(',') if parte.strip()]
+    if isinstance(valor, (list, tuple)):
+        return [convertir(v) for v in valor]
+    return [convertir(valor)]
 
 def calcular(parametros):
-    return CicloRankineRegenerativo().calcular(parametros)
\ No newline at end of file
+    return CicloRankineRegenerativo().calcular(parametros)
+
+def calcular_lote(p_alta, p_baja, t_max, p_extraccion, tipos=None, rendimiento_turbina=0.85,
+                  rendimiento_bomba=1.0, flujo_masico=1.0):
+    return CicloRankineRegenerativo().calcular_lote(p_alta, p_baja, t_max, p_extraccion, tipos,
+                                                    rendimiento_turbina, rendimiento_bomba, flujo_masico)
\ No newline at end of file
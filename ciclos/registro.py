@@ -0,0 +1,301 @@
+# Registro de ciclos disponibles
+# ciclos/registro.py
+#
+# Los módulos de ciclos (y con ellos CoolProp) no se importan al importar el registro: cada
+# entrada guarda referencias "modulo:atributo", como los entry points de Python, y las
+# resuelve la primera vez que se pide la función o la clase. Así la interfaz puede mostrar
+# la lista de ciclos, sus descripciones y sus formularios sin pagar el arranque de CoolProp.
+#
+# Otros paquetes pueden añadir ciclos sin modificar este fichero declarando un entry point
+# en el grupo GRUPO_PLUGINS cuyo nombre es el nombre visible del ciclo y cuyo objeto es una
+# EntradaCiclo, p. ej. en su pyproject.toml:
+#   [project.entry-points."simulador_ciclos.ciclos"]
+#   "Ciclo Kalina" = "kalina.registro:ENTRADA"
+# Buscar los entry points cuesta decenas de ms, así que tampoco se hace al importar: los
+# plugins se cargan la primera vez que se consulta un nombre que no está en el registro
+# (ver RegistroCiclos) o cuando se llama a cargar_plugins (la interfaz lo hace después de
+# mostrar la ventana, para completar la lista de ciclos).
+import warnings
+from collections.abc import Mapping
+from importlib import import_module
+
+from ciclos.esquema import Parametro, Validador, alguno, decreciente, esquema, misma_longitud
+
+# Grupo de entry points en el que se buscan ciclos de otros paquetes
+GRUPO_PLUGINS = "simulador_ciclos.ciclos"
+
+def cargar_referencia(referencia):
+    """Objeto indicado por una referencia "paquete.modulo:atributo" """
+    modulo, _, atributo = referencia.partition(":")
+    objeto = import_module(modulo)
+    for parte in filter(None, atributo.split(".")):
+        objeto = getattr(objeto, parte)
+    return objeto
+
+class EntradaCiclo(Mapping):
+    """
+    Entrada del registro con carga diferida: se usa como un diccionario con las claves
+    "descripcion", "parametros", "relaciones" y, resueltas al primer acceso, "funcion",
+    "clase" y, si existe, "lote"
+    Args:
+        descripcion: Texto para la interfaz
+        parametros: Tupla de Parametro con el esquema de entrada del ciclo
+        relaciones: Comprobaciones entre parámetros (ver ciclos/esquema.py)
+        referencias: {clave: "modulo:atributo"}
+    """
+
+    def __init__(self, descripcion, parametros=(), relaciones=(), **referencias):
+        self.descripcion = descripcion
+        self.parametros = tuple(parametros)
+        self.relaciones = tuple(relaciones)
+        self.referencias = referencias
+        self._cargados = {}
+
+    def __getitem__(self, clave):
+        if clave == "descripcion":
+            return self.descripcion
+        if clave == "parametros":
+            return self.parametros
+        if clave == "relaciones":
+            return self.relaciones
+        if clave not in self._cargados:
+            self._cargados[clave] = cargar_referencia(self.referencias[clave])
+        return self._cargados[clave]
+
+    def __contains__(self, clave):
+        # Sin resolver la referencia (Mapping.__contains__ llamaría a __getitem__)
+        return clave in ("descripcion", "parametros", "relaciones") or clave in self.referencias
+
+    def __iter__(self):
+        yield "descripcion"
+        yield "parametros"
+        yield "relaciones"
+        yield from self.referencias
+
+    def __len__(self):
+        return 3 + len(self.referencias)
+
+    @property
+    def cargada(self):
+        """True si ya se importó el módulo del ciclo"""
+        return bool(self._cargados)
+
+class RegistroCiclos(dict):
+    """
+    Diccionario nombre -> EntradaCiclo que carga los plugins la primera vez que se consulta
+    un nombre que no contiene (indexando, con in o con get). Recorrerlo no los carga.
+    """
+
+    def __missing__(self, nombre):
+        if cargar_plugins() and dict.__contains__(self, nombre):
+            return dict.__getitem__(self, nombre)
+        raise KeyError(nombre)
+
+    def __contains__(self, nombre):
+        return dict.__contains__(self, nombre) or (cargar_plugins() and dict.__contains__(self, nombre))
+
+    def get(self, nombre, defecto=None):
+        return self[nombre] if nombre in self else defecto
+
+# Límites de los parámetros: presiones y temperaturas dentro del dominio de las ecuaciones
+# de estado de CoolProp para agua (IAPWS-95) y aire (Lemmon); rendimientos en (0, 1].
+# Los valores por defecto de los rendimientos son los que aplica cada ciclo si faltan.
+_P_AGUA = dict(unidad='bar', minimo=0.01, maximo=1000.0)
+_T_AGUA = dict(unidad='°C', minimo=0.01, maximo=1000.0)
+_P_AIRE = dict(unidad='bar', minimo=0.1, maximo=200.0)
+_T_AIRE = dict(unidad='°C', minimo=-50.0, maximo=1700.0)
+_RENDIMIENTO = dict(minimo=0.0, maximo=1.0, minimo_excluido=True)
+
+# Nombre visible -> función de cálculo, clase del ciclo, descripción y esquema de parámetros
+# (usado por la GUI y por los barridos); "lote", si existe, es la versión vectorizada del
+# cálculo (arrays de NumPy por parámetro).
+# Una instancia de la clase reutilizada entre cálculos conserva sus estados memorizados.
+CICLOS_DISPONIBLES = RegistroCiclos({
+    "Rankine Simple": EntradaCiclo(
+        "Ciclo Rankine básico para plantas de vapor",
+        parametros=esquema(
+            Parametro('p_alta', "Presión alta", defecto=80.0, obligatorio=True, **_P_AGUA),
+            Parametro('p_baja', "Presión baja", defecto=0.08, obligatorio=True, **_P_AGUA),
+            Parametro('t_max', "Temperatura máxima", defecto=500.0, obligatorio=True, **_T_AGUA),
+            Parametro('rendimiento_turbina', "Rendimiento turbina", defecto=1.0, **_RENDIMIENTO),
+            Parametro('rendimiento_bomba', "Rendimiento bomba", defecto=1.0, **_RENDIMIENTO),
+        ),
+        relaciones=(decreciente('p_alta', 'p_baja'),),
+        funcion="ciclos.rankine:calcular",
+        clase="ciclos.rankine:CicloRankine",
+        lote="ciclos.rankine:calcular_lote",
+    ),
+    "Rankine con Recalentamiento": EntradaCiclo(
+        "Rankine con recalentamiento intermedio",
+        parametros=esquema(
+            Parametro('p_alta', "Presión alta", defecto=80.0, obligatorio=True, **_P_AGUA),
+            Parametro('p_baja', "Presión baja", defecto=0.08, obligatorio=True, **_P_AGUA),
+            Parametro('t_max', "Temperatura máxima", defecto=500.0, obligatorio=True, **_T_AGUA),
+            Parametro('p_media', "Presión recalentamiento", defecto=20.0, obligatorio=True, **_P_AGUA),
+            Parametro('t_recal', "Temperatura recalentamiento", defecto=500.0, obligatorio=True, **_T_AGUA),
+            Parametro('rendimiento_turbina_HP', "Rendimiento turbina de alta", defecto=0.85, **_RENDIMIENTO),
+            Parametro('rendimiento_turbina_LP', "Rendimiento turbina de baja", defecto=0.85, **_RENDIMIENTO),
+            Parametro('rendimiento_bomba', "Rendimiento bomba", defecto=0.8, **_RENDIMIENTO),
+        ),
+        relaciones=(decreciente('p_alta', 'p_media', 'p_baja'),),
+        funcion="ciclos.rankine_recalentamiento:calcular",
+        clase="ciclos.rankine_recalentamiento:CicloRankineRecalentamiento",
+    ),
+    "Rankine Regenerativo": EntradaCiclo(
+        "Rankine con extracción de vapor para precalentamiento",
+        parametros=esquema(
+            Parametro('p_alta', "Presión alta", defecto=80.0, obligatorio=True, **_P_AGUA),
+            Parametro('p_baja', "Presión baja", defecto=0.08, obligatorio=True, **_P_AGUA),
+            Parametro('t_max', "Temperatura máxima", defecto=500.0, obligatorio=True, **_T_AGUA),
+            Parametro('p_extraccion', "Presiones extracción", defecto=10.0, obligatorio=True,
+                      lista=True, **_P_AGUA),
+            # Vacío: todos abiertos
+            Parametro('tipos_calentadores', "Tipos de calentador", tipo=str, lista=True,
+                      opciones=("abierto", "cerrado")),
+            Parametro('rendimiento_turbina', "Rendimiento turbina", defecto=0.85, **_RENDIMIENTO),
+            # Solo interviene con varios calentadores (o con tipos indicados)
+            Parametro('rendimiento_bomba', "Rendimiento bomba", defecto=1.0, **_RENDIMIENTO),
+        ),
+        relaciones=(decreciente('p_alta', 'p_extraccion', 'p_baja'),
+                    misma_longitud('tipos_calentadores', 'p_extraccion')),
+        funcion="ciclos.rankine_regenerativo:calcular",
+        clase="ciclos.rankine_regenerativo:CicloRankineRegenerativo",
+        lote="ciclos.rankine_regenerativo:calcular_lote",
+    ),
+    "Brayton Simple": EntradaCiclo(
+        "Ciclo Brayton para turbinas de gas",
+        parametros=esquema(
+            Parametro('relacion_compresion', "Relación de compresión", defecto=10.0, minimo=1.0,
+                      maximo=100.0),
+            Parametro('t_max', "Temperatura máxima", defecto=1000.0, obligatorio=True, **_T_AIRE),
+            Parametro('t1', "Temperatura de admisión", defecto=25.0, **_T_AIRE),
+            Parametro('p_baja', "Presión de admisión", defecto=1.01325, **_P_AIRE),
+            Parametro('p_alta', "Presión alta, sin relación de compresión", **_P_AIRE),
+            Parametro('rendimiento_compresor', "Rendimiento compresor", defecto=1.0, **_RENDIMIENTO),
+            Parametro('rendimiento_turbina', "Rendimiento turbina", defecto=1.0, **_RENDIMIENTO),
+        ),
+        # Alternativa a la relación de compresión: p_alta y p_baja
+        relaciones=(alguno('relacion_compresion', 'p_alta'), decreciente('p_alta', 'p_baja'),
+                    decreciente('t_max', 't1')),
+        funcion="ciclos.brayton:calcular",
+        clase="ciclos.brayton:CicloBrayton",
+    ),
+    "Brayton con Recalentamiento": EntradaCiclo(
+        "Brayton con recalentamiento intermedio",
+        parametros=esquema(
+            Parametro('relacion_compresion', "Relación de compresión", defecto=10.0, minimo=1.0,
+                      maximo=100.0, obligatorio=True),
+            Parametro('t_max', "Temperatura máxima", defecto=950.0, obligatorio=True, **_T_AIRE),
+            Parametro('t_recal', "Temperatura recalentamiento", defecto=950.0, obligatorio=True, **_T_AIRE),
+            Parametro('p_loss', "Pérdida de presión", '%', defecto=5.0, minimo=0.0, maximo=50.0),
+            Parametro('t1', "Temperatura de admisión", defecto=25.0, **_T_AIRE),
+            Parametro('p_baja', "Presión de admisión", defecto=1.01325, **_P_AIRE),
+            Parametro('rendimiento_compresor', "Rendimiento compresor", defecto=0.85, **_RENDIMIENTO),
+            Parametro('rendimiento_turbina_HP', "Rendimiento turbina de alta", defecto=0.9, **_RENDIMIENTO),
+            Parametro('rendimiento_turbina_LP', "Rendimiento turbina de baja", defecto=0.9, **_RENDIMIENTO),
+        ),
+        funcion="ciclos.brayton_recalentamiento:calcular",
+        clase="ciclos.brayton_recalentamiento:CicloBraytonRecalentamiento",
+    ),
+    "Ciclo Otto": EntradaCiclo(
+        "Motor de encendido por chispa",
+        parametros=esquema(
+            Parametro('relacion_compresion', "Relación de compresión", defecto=8.0, minimo=1.0,
+                      maximo=30.0, obligatorio=True),
+            Parametro('t1', "Temperatura inicial", defecto=25.0, obligatorio=True, **_T_AIRE),
+            Parametro('p1', "Presión inicial", defecto=1.013, obligatorio=True, **_P_AIRE),
+            Parametro('t3', "Temperatura máxima", defecto=1500.0, obligatorio=True, **_T_AIRE),
+        ),
+        relaciones=(decreciente('t3', 't1'),),
+        funcion="ciclos.otto:calcular",
+        clase="ciclos.otto:CicloOtto",
+    ),
+    "Ciclo Diesel": EntradaCiclo(
+        "Motor de encendido por compresión",
+        parametros=esquema(
+            Parametro('relacion_compresion', "Relación de compresión", defecto=18.0, minimo=1.0,
+                      maximo=30.0, obligatorio=True),
+            Parametro('relacion_corte', "Relación de corte", defecto=2.0, minimo=1.0, maximo=10.0,
+                      obligatorio=True),
+            Parametro('t1', "Temperatura inicial", defecto=25.0, obligatorio=True, **_T_AIRE),
+            Parametro('p1', "Presión inicial", defecto=1.013, obligatorio=True, **_P_AIRE),
+            Parametro('rendimiento_combustion', "Rendimiento combustión", defecto=0.95, **_RENDIMIENTO),
+        ),
+        funcion="ciclos.diesel:calcular",
+        clase="ciclos.diesel:CicloDiesel",
+    ),
+    "Ciclo Carnot": EntradaCiclo(
+        "Ciclo teórico de máxima eficiencia",
+        parametros=esquema(
+            Parametro('t_caliente', "Temperatura caliente", defecto=300.0, obligatorio=True, **_T_AGUA),
+            Parametro('t_fria', "Temperatura fría", defecto=50.0, obligatorio=True, **_T_AGUA),
+            Parametro('fuente_caliente', "Fuente de calor", defecto="vapor", tipo=str,
+                      opciones=("agua", "vapor")),
+        ),
+        relaciones=(decreciente('t_caliente', 't_fria'),),
+        funcion="ciclos.carnot:calcular",
+        clase="ciclos.carnot:CicloCarnot",
+    ),
+})
+
+def parametros_por_defecto(ciclo):
+    """Parámetros de un ciclo con los valores por defecto de su esquema (los del formulario)"""
+    return {p.nombre: p.defecto for p in CICLOS_DISPONIBLES[ciclo]["parametros"] if p.defecto is not None}
+
+# Validadores compilados, por nombre de ciclo
+_validadores = {}
+
+def obtener_validador(ciclo):
+    """Validador de los parámetros de un ciclo registrado, compilado la primera vez"""
+    validador = _validadores.get(ciclo)
+    if validador is None:
+        if ciclo not in CICLOS_DISPONIBLES:
+            raise ValueError(f"Ciclo '{ciclo}' no registrado. Opciones: {', '.join(CICLOS_DISPONIBLES)}")
+        entrada = CICLOS_DISPONIBLES[ciclo]
+        validador = _validadores[ciclo] = Validador(entrada["parametros"], entrada.get("relaciones", ()))
+    return validador
+
+def registrar_ciclo(nombre, entrada):
+    """
+    Añadir un ciclo al registro (lo usan los plugins; también puede llamarse directamente)
+    Args:
+        nombre: Nombre visible del ciclo
+        entrada: EntradaCiclo, o cualquier Mapping con "descripcion", "parametros", "funcion" y "clase"
+    """
+    if dict.__contains__(CICLOS_DISPONIBLES, nombre):
+        raise ValueError(f"Ya hay un ciclo registrado con el nombre '{nombre}'")
+    faltantes = [clave for clave in ("descripcion", "parametros", "funcion", "clase") if clave not in entrada]
+    if faltantes:
+        raise ValueError(f"La entrada del ciclo '{nombre}' no define: {', '.join(faltantes)}")
+    CICLOS_DISPONIBLES[nombre] = entrada
+
+# Grupos de entry points ya cargados
+_grupos_cargados = set()
+
+def cargar_plugins(grupo=GRUPO_PLUGINS):
+    """
+    Registrar los ciclos declarados como entry points por los paquetes instalados, una sola
+    vez por grupo. Un plugin que no se puede cargar se omite con un aviso, sin impedir el
+    arranque.
+    Returns:
+        True si el grupo se ha cargado ahora, False si ya estaba cargado
+    """
+    if grupo in _grupos_cargados:
+        return False
+    _grupos_cargados.add(grupo)
+    from importlib.metadata import entry_points
+
+    for punto in entry_points(group=grupo):
+        try:
+            registrar_ciclo(punto.name, punto.load())
+        except Exception as e:
+            warnings.warn(f"No se pudo cargar el ciclo '{punto.name}' ({punto.value}): {e}")
+    return True
+
+def obtener_funcion(ciclo):
+    """Devolver la función de cálculo de un ciclo dado por nombre o ya como función"""
+    if callable(ciclo):
+        return ciclo
+    if ciclo not in CICLOS_DISPONIBLES:
+        raise ValueError(f"Ciclo '{ciclo}' no registrado. Opciones: {', '.join(CICLOS_DISPONIBLES)}")
+    return CICLOS_DISPONIBLES[ciclo]["funcion"]
@@ -0,0 +1,50 @@
+# Resultado numérico común a todos los ciclos
+# ciclos/resultado.py
+from dataclasses import dataclass
+
+# Unidad de cada resultado según el comienzo de su nombre
+UNIDADES = (
+    ('Eficiencia', '%'),
+    ('Fracción', '%'),
+    ('Trabajo', 'kJ/kg'),
+    ('Calor', 'kJ/kg'),
+    ('Flujo', 'kg/s'),
+    ('Potencia', 'kW'),
+    ('Presión', 'bar'),
+    ('Temperatura', '°C'),
+    ('Relación', ''),
+)
+
+def unidad_de(clave):
+    """Unidad de un resultado a partir de su nombre ('' si es adimensional o desconocida)"""
+    return next((unidad for prefijo, unidad in UNIDADES if clave.startswith(prefijo)), '')
+
+@dataclass
+class ResultadoCiclo:
+    """
+    Resultados de un ciclo como números sin formatear
+    Atributos:
+        ciclo: Nombre del ciclo
+        valores: {nombre: float} en el orden en que se muestran (p. ej. 'Eficiencia térmica')
+        estados: {etiqueta del estado: {propiedad: float}} con p [bar], T [°C], h [kJ/kg], s [kJ/kg-K]
+    El formateo a texto se hace solo en la interfaz (interfaz/resultados.py).
+    """
+    __slots__ = ('ciclo', 'valores', 'estados')
+
+    ciclo: str
+    valores: dict
+    estados: dict
+
+    def __getitem__(self, clave):
+        return self.valores[clave]
+
+    def unidad(self, clave):
+        return unidad_de(clave)
+
+    def a_dict(self):
+        """Diccionario plano {nombre: float} con los valores y las propiedades de cada estado"""
+        plano = dict(self.valores)
+        for etiqueta, propiedades in self.estados.items():
+            for propiedad, valor in propiedades.items():
+                plano[f"Estado {etiqueta} {propiedad}"] = valor
+        return plano
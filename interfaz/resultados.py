@@ -1,20 +1,59 @@
-# Mostrar resultados en una ventana secundaria
+# Mostrar resultados en la ventana principal
 # interfaz/resultados.py
 
-from tkinter import ttk, messagebox
-import tkinter as tk
-
-def mostrar_resultados(ventana, ciclo, resultados):
-    top = tk.Toplevel(ventana)
-    top.title(f"Resultados - {ciclo}")
-    top.geometry("400x300")
-    
-    frame = ttk.Frame(top)
-    frame.pack(padx=10, pady=10, fill="both", expand=True)
-    
-    ttk.Label(frame, text=f"Resultados del ciclo {ciclo}", font=('Segoe UI', 12, 'bold')).pack(pady=10)
-    
-    for clave, valor in resultados.items():
-        ttk.Label(frame, text=f"{clave}: {valor}").pack(anchor="w", padx=20, pady=5)
-    
-    ttk.Button(frame, text="Cerrar", command=top.destroy).pack(pady=20)
\ No newline at end of file
+from tkinter import ttk
+
+def formatear_valor(valor, unidad, decimales=2):
+    """Texto de un resultado numérico con su unidad"""
+    if not isinstance(valor, (int, float)):
+        return str(valor)
+    if unidad == '%':
+        return f"{valor:.{decimales}f}%"
+    return f"{valor:.{decimales}f} {unidad}".rstrip()
+
+def formatear_resultados(resultado):
+    """Convertir un ResultadoCiclo en {nombre: texto} para mostrarlo"""
+    formateados = {clave: formatear_valor(valor, resultado.unidad(clave))
+                   for clave, valor in resultado.valores.items()}
+    for etiqueta, propiedades in resultado.estados.items():
+        formateados[f"Estado {etiqueta}"] = ", ".join(
+            f"{propiedad}={valor:.2f}" for propiedad, valor in propiedades.items())
+    return formateados
+
+class PanelResultados:
+    """
+    Resultados mostrados dentro de la ventana principal y actualizados en el sitio
+    (modo de recálculo al editar)
+    Args:
+        frame: Contenedor en el que se crea el panel
+    """
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.lbl_estado = ttk.Label(frame, text="", foreground="#555555")
+        self.lbl_estado.pack(anchor="w", padx=5)
+        self.contenido = ttk.Frame(frame)
+        self.contenido.pack(fill="both", expand=True)
+        self.etiquetas = {}
+
+    def actualizar(self, ciclo, resultados):
+        """Reescribir los valores; solo se crean etiquetas nuevas si cambian las claves"""
+        formateados = formatear_resultados(resultados)
+        if list(formateados) != list(self.etiquetas):
+            self.limpiar()
+            for clave in formateados:
+                self.etiquetas[clave] = ttk.Label(self.contenido)
+                self.etiquetas[clave].pack(anchor="w", padx=20, pady=2)
+        for clave, valor in formateados.items():
+            self.etiquetas[clave].config(text=f"{clave}: {valor}")
+        self.lbl_estado.config(text=f"Resultados del ciclo {ciclo}", foreground="#555555")
+
+    def mostrar_estado(self, texto, error=False):
+        """Mensaje de estado (p. ej. "Calculando..." o un error de entrada) sin borrar los últimos valores"""
+        self.lbl_estado.config(text=texto, foreground="#b00020" if error else "#555555")
+
+    def limpiar(self):
+        for etiqueta in self.etiquetas.values():
+            etiqueta.destroy()
+        self.etiquetas = {}
+        self.lbl_estado.config(text="")
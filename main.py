@@ -1,19 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from interfaz.controles import crear_controles_ciclo
-from interfaz.resultados import mostrar_resultados
-from ciclos import (
-    rankine,
-    rankine_recalentamiento,
-    rankine_regenerativo,
-    brayton,
-    brayton_recalentamiento,
-    otto,
-    diesel,
-    carnot
-)
+from concurrent.futures import ThreadPoolExecutor
+from interfaz.controles import FormulariosCiclo
+from interfaz.resultados import PanelResultados
+from ciclos.registro import CICLOS_DISPONIBLES, cargar_plugins, obtener_validador
 
 class SimuladorCiclosApp:
+    RETARDO_RECALCULO = 400
+
     def __init__(self, master):
         self.master = master
         master.title("Simulador de Ciclos Termodinámicos")
@@ -25,48 +19,37 @@ class SimuladorCiclosApp:
         self.configurar_estilos()
 
         # Diccionario de ciclos disponibles
-        self.ciclos_disponibles = {
-            "Rankine Simple": {
-                "funcion": rankine.calcular,
-                "descripcion": "Ciclo Rankine básico para plantas de vapor"
-            },
-            "Rankine con Recalentamiento": {
-                "funcion": rankine_recalentamiento.calcular,
-                "descripcion": "Rankine con recalentamiento intermedio"
-            },
-            "Rankine Regenerativo": {
-                "funcion": rankine_regenerativo.calcular,
-                "descripcion": "Rankine con extracción de vapor para precalentamiento"
-            },
-            "Brayton Simple": {
-                "funcion": brayton.calcular,
-                "descripcion": "Ciclo Brayton para turbinas de gas"
-            },
-            "Brayton con Recalentamiento": {
-                "funcion": brayton_recalentamiento.calcular,
-                "descripcion": "Brayton con recalentamiento intermedio"
-            },
-            "Ciclo Otto": {
-                "funcion": otto.calcular,
-                "descripcion": "Motor de encendido por chispa"
-            },
-            "Ciclo Diesel": {
-                "funcion": diesel.calcular,
-                "descripcion": "Motor de encendido por compresión"
-            },
-            "Ciclo Carnot": {
-                "funcion": carnot.calcular,
-                "descripcion": "Ciclo teórico de máxima eficiencia"
-            }
-        }
+        self.ciclos_disponibles = CICLOS_DISPONIBLES
 
         # Variables de control
         self.selected_ciclo = tk.StringVar(value=list(self.ciclos_disponibles.keys())[0])
         self.widgets_ciclo = {}
 
+        # Los cálculos se ejecutan en un hilo aparte para no bloquear la ventana;
+        # solo puede haber uno en curso y su resultado se recoge con master.after
+        self.ejecutor = ThreadPoolExecutor(max_workers=1)
+        self.tarea_actual = None
+
+        # Una instancia por ciclo que se reutiliza entre cálculos: los ciclos con grafo de
+        # estados solo recalculan los estados afectados por los parámetros modificados
+        self.instancias = {}
+
+        # Recalcular al editar: cada cambio reprograma el cálculo tras una pausa de
+        # RETARDO_RECALCULO ms; si llega con un cálculo en curso, se repite al terminar
+        self.recalcular_en_vivo = tk.BooleanVar(value=False)
+        self.id_recalculo = None
+        self.recalculo_pendiente = False
+        master.protocol("WM_DELETE_WINDOW", self.cerrar)
+
         # Crear interfaz
         self.crear_interfaz()
 
+        # El registro no importa los módulos de ciclos: el del ciclo seleccionado (y CoolProp)
+        # se importa en el hilo de cálculo cuando la ventana ya está dibujada. Los ciclos de
+        # plugins también se buscan entonces y se añaden a la lista
+        master.after_idle(self.precalentar)
+        master.after_idle(self.completar_ciclos)
+
     def configurar_estilos(self):
         """Configura los estilos visuales de la aplicación"""
         self.style = ttk.Style()
@@ -124,71 +107,212 @@ class SimuladorCiclosApp:
             padding=(10, 5)
         )
         self.frame_parametros.grid(row=3, column=0, columnspan=2, sticky='nsew', padx=5, pady=5)
-        self.frame_parametros.columnconfigure(1, weight=1)
+        self.frame_parametros.columnconfigure(0, weight=1)
+        self.formularios = FormulariosCiclo(self.frame_parametros, al_crear=self.asociar_eventos)
 
-        # Botón de cálculo
-        btn_calcular = ttk.Button(
-            main_frame, 
+        # Botón de cálculo y modo de recálculo al editar
+        frame_calculo = ttk.Frame(main_frame)
+        frame_calculo.grid(row=4, column=0, columnspan=2, pady=15)
+        self.btn_calcular = ttk.Button(
+            frame_calculo, 
             text="Calcular Ciclo", 
             command=self.ejecutar_ciclo,
             style='Calc.TButton'
         )
-        btn_calcular.grid(row=4, column=0, columnspan=2, pady=15)
+        self.btn_calcular.pack(side=tk.LEFT, padx=5)
+        ttk.Checkbutton(
+            frame_calculo,
+            text="Recalcular al editar",
+            variable=self.recalcular_en_vivo,
+            command=self.programar_recalculo
+        ).pack(side=tk.LEFT, padx=5)
+
+        # Progreso y descarte (visibles solo durante un cálculo). Un cálculo que ya ha
+        # empezado no se puede interrumpir: descartarlo solo libera la interfaz y el
+        # siguiente cálculo espera a que termine
+        self.frame_progreso = ttk.Frame(main_frame)
+        self.frame_progreso.grid(row=5, column=0, columnspan=2, pady=(0, 10))
+        self.barra_progreso = ttk.Progressbar(self.frame_progreso, mode='indeterminate', length=300)
+        self.barra_progreso.pack(side=tk.LEFT, padx=5)
+        ttk.Button(self.frame_progreso, text="Descartar resultado", command=self.descartar_ciclo).pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.frame_progreso, text="(el cálculo en curso no se interrumpe)").pack(side=tk.LEFT, padx=5)
+        self.frame_progreso.grid_remove()
+
+        # Resultados (se actualizan en el sitio)
+        frame_resultados = ttk.LabelFrame(main_frame, text="Resultados", padding=(10, 5))
+        frame_resultados.grid(row=6, column=0, columnspan=2, sticky='nsew', padx=5, pady=5)
+        self.panel_resultados = PanelResultados(frame_resultados)
 
         # Configurar pesos de filas/columnas
         main_frame.columnconfigure(1, weight=1)
         main_frame.rowconfigure(3, weight=1)
+        main_frame.rowconfigure(6, weight=1)
 
         # Inicializar controles
         self.actualizar_parametros()
 
     def actualizar_parametros(self, _=None):
         """Actualiza los controles de parámetros según el ciclo seleccionado"""
-        # Limpiar frame de parámetros
-        for widget in self.frame_parametros.winfo_children():
-            widget.destroy()
-
         # Actualizar descripción
         ciclo_actual = self.selected_ciclo.get()
         self.lbl_descripcion.config(
             text=self.ciclos_disponibles[ciclo_actual]["descripcion"]
         )
 
-        # Crear nuevos controles
-        self.widgets_ciclo = crear_controles_ciclo(
-            ciclo_actual, 
-            self.frame_parametros
+        # Mostrar el formulario del ciclo (generado desde su esquema la primera vez)
+        self.widgets_ciclo = self.formularios.mostrar(
+            ciclo_actual,
+            self.ciclos_disponibles[ciclo_actual]["parametros"]
         )
 
-    def ejecutar_ciclo(self):
-        """Ejecuta el cálculo del ciclo seleccionado y muestra los resultados"""
+        self.panel_resultados.limpiar()
+        self.programar_recalculo()
+
+    def asociar_eventos(self, widgets):
+        """Recalcular en vivo al editar los campos de un formulario nuevo"""
+        for widget in widgets.values():
+            widget.bind("<KeyRelease>", self.programar_recalculo, add="+")
+            widget.bind("<<ComboboxSelected>>", self.programar_recalculo, add="+")
+
+    def programar_recalculo(self, _=None):
+        """Reprograma el recálculo en vivo; solo se ejecuta el último de una ráfaga de cambios"""
+        if self.id_recalculo is not None:
+            self.master.after_cancel(self.id_recalculo)
+            self.id_recalculo = None
+        if self.recalcular_en_vivo.get():
+            self.id_recalculo = self.master.after(self.RETARDO_RECALCULO, self.recalcular)
+
+    def recalcular(self):
+        """Recálculo en vivo; si hay un cálculo en curso se repite cuando termine"""
+        self.id_recalculo = None
+        if self.tarea_actual is not None:
+            self.recalculo_pendiente = True
+            return
+        self.ejecutar_ciclo(en_vivo=True)
+
+    def leer_parametros(self, ciclo_nombre):
+        """
+        Recoge los parámetros del formulario (en el hilo de Tk) y los valida con el esquema
+        del ciclo antes de lanzar el cálculo
+        Raises:
+            ErrorParametros (ValueError) con todos los campos incorrectos
+        """
+        valores = {nombre: widget.get() for nombre, widget in self.widgets_ciclo.items()}
+        return obtener_validador(ciclo_nombre).validar(valores)
+
+    def precalentar(self):
+        """Crea en segundo plano la instancia del ciclo seleccionado para que el primer cálculo no espere"""
+        self.ejecutor.submit(self.obtener_instancia, self.selected_ciclo.get())
+
+    def completar_ciclos(self):
+        """Añade a la lista los ciclos de plugins (ver cargar_plugins), ya con la ventana visible"""
+        if cargar_plugins():
+            self.combo_ciclos.configure(values=list(self.ciclos_disponibles.keys()))
+
+    def obtener_instancia(self, ciclo_nombre):
+        """
+        Instancia persistente del ciclo (conserva los estados memorizados).
+        Se llama solo desde el hilo de cálculo: la primera vez importa el módulo del ciclo.
+        """
+        instancia = self.instancias.get(ciclo_nombre)
+        if instancia is None:
+            instancia = self.instancias[ciclo_nombre] = self.ciclos_disponibles[ciclo_nombre]["clase"]()
+        return instancia
+
+    def ejecutar_ciclo(self, en_vivo=False):
+        """
+        Lanza el cálculo del ciclo seleccionado en segundo plano
+        Args:
+            en_vivo: Cálculo lanzado al editar; los errores se muestran en el panel de
+                     resultados en lugar de en un cuadro de diálogo
+        """
+        # Ignorar clics repetidos mientras hay un cálculo en curso
+        if self.tarea_actual is not None:
+            return
+
         try:
             # Obtener ciclo seleccionado
             ciclo_nombre = self.selected_ciclo.get()
-            funcion_calculo = self.ciclos_disponibles[ciclo_nombre]["funcion"]
 
             # Recoger parámetros del formulario
-            parametros = {}
-            for nombre, widget in self.widgets_ciclo.items():
-                if isinstance(widget, ttk.Entry):
-                    valor = widget.get()
-                    if valor.replace('.', '', 1).isdigit():  # Verificar si es número
-                        parametros[nombre] = float(valor)
-                    elif valor:
-                        parametros[nombre] = valor
-                elif isinstance(widget, ttk.Combobox):
-                    parametros[nombre] = widget.get()
-
-            # Ejecutar cálculo
-            resultados = funcion_calculo(parametros)
+            parametros = self.leer_parametros(ciclo_nombre)
+
+        except ValueError as e:
+            self.mostrar_error("Error de Entrada", f"Datos inválidos:\n{str(e)}", en_vivo)
+            return
+
+        # Ejecutar cálculo
+        self.tarea_actual = (ciclo_nombre, self.ejecutor.submit(self.calcular_ciclo, ciclo_nombre, parametros),
+                             en_vivo)
+        if en_vivo:
+            self.panel_resultados.mostrar_estado("Calculando...")
+        else:
+            self.btn_calcular.state(['disabled'])
+            self.frame_progreso.grid()
+            self.barra_progreso.start(15)
+        self.master.after(50, self.comprobar_ciclo, self.tarea_actual)
+
+    def calcular_ciclo(self, ciclo_nombre, parametros):
+        """Cálculo en el hilo de trabajo"""
+        return self.obtener_instancia(ciclo_nombre).calcular(parametros)
+
+    def comprobar_ciclo(self, tarea):
+        """Consulta periódicamente el cálculo en curso y muestra su resultado al terminar"""
+        if tarea is not self.tarea_actual:
+            return  # Descartado: el resultado se ignora
+        ciclo_nombre, futuro, en_vivo = tarea
+        if not futuro.done():
+            self.master.after(50, self.comprobar_ciclo, tarea)
+            return
+
+        self.finalizar_ciclo()
+        try:
+            resultados = futuro.result()
 
             # Mostrar resultados
-            mostrar_resultados(self.master, ciclo_nombre, resultados)
+            self.panel_resultados.actualizar(ciclo_nombre, resultados)
 
         except ValueError as e:
-            messagebox.showerror("Error de Entrada", f"Datos inválidos:\n{str(e)}")
+            self.mostrar_error("Error de Entrada", f"Datos inválidos:\n{str(e)}", en_vivo)
         except Exception as e:
-            messagebox.showerror("Error de Cálculo", f"Ocurrió un error:\n{str(e)}")
+            self.mostrar_error("Error de Cálculo", f"Ocurrió un error:\n{str(e)}", en_vivo)
+
+        # Cambios llegados durante el cálculo
+        if self.recalculo_pendiente:
+            self.recalculo_pendiente = False
+            self.programar_recalculo()
+
+    def mostrar_error(self, titulo, mensaje, en_vivo):
+        """En vivo el error va al panel (no interrumpe la edición); si no, a un cuadro de diálogo"""
+        if en_vivo:
+            self.panel_resultados.mostrar_estado(mensaje.replace("\n", " "), error=True)
+        else:
+            messagebox.showerror(titulo, mensaje)
+
+    def descartar_ciclo(self):
+        """
+        Descarta el cálculo en curso. Si aún no había empezado no llega a ejecutarse; si ya
+        había empezado, el hilo de trabajo lo termina igualmente (CoolProp no se puede
+        interrumpir) y su resultado se ignora, de modo que el siguiente cálculo espera a que
+        acabe.
+        """
+        if self.tarea_actual is not None:
+            self.tarea_actual[1].cancel()
+            self.finalizar_ciclo()
+
+    def finalizar_ciclo(self):
+        """Restaura la interfaz al terminar o descartar un cálculo"""
+        self.tarea_actual = None
+        self.barra_progreso.stop()
+        self.frame_progreso.grid_remove()
+        self.btn_calcular.state(['!disabled'])
+
+    def cerrar(self):
+        """Cierra la ventana sin esperar a un cálculo en curso"""
+        if self.id_recalculo is not None:
+            self.master.after_cancel(self.id_recalculo)
+        self.ejecutor.shutdown(wait=False, cancel_futures=True)
+        self.master.destroy()
 
 if __name__ == "__main__":
     root = tk.Tk()
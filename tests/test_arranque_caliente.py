@@ -0,0 +1,45 @@
+# Pruebas de los flashes inversos con arranque en caliente (util/propiedades.py)
+import numpy as np
+import pytest
+
+from util.propiedades import PropiedadesTermodinamicas
+
+def instancias():
+    opciones = dict(cache=None, tabla_saturacion=False)
+    return (PropiedadesTermodinamicas("Water", arranque_caliente=True, **opciones),
+            PropiedadesTermodinamicas("Water", arranque_caliente=False, **opciones))
+
+def test_barrido_en_caliente_igual_que_en_frio():
+    caliente, frio = instancias()
+    for t_c in np.linspace(350.0, 550.0, 21):
+        h = frio.propiedades_estado(p_bar=80, t_c=t_c)['h']
+        for p_bar in (80.0, 79.0):
+            en_caliente = caliente.propiedades_estado(p_bar=p_bar, h_kjkg=h)
+            en_frio = frio.propiedades_estado(p_bar=p_bar, h_kjkg=h)
+            assert en_caliente['T'] == pytest.approx(en_frio['T'], abs=1e-6)
+            assert en_caliente['s'] == pytest.approx(en_frio['s'], rel=1e-9)
+
+def test_newton_converge_desde_una_estimacion_cercana():
+    caliente, _ = instancias()
+    s = caliente.propiedades_estado(p_bar=10, t_c=300)['s']
+    par, conversion = caliente.PARES_ENTRADA[(True, False, False, True, False)]
+    assert caliente._flash_caliente(par, conversion(10, None, None, s, None), 573.15 + 15)
+    assert caliente._estado.T() - 273.15 == pytest.approx(300, abs=1e-6)
+
+def test_estimacion_explicita_y_estados_en_la_campana():
+    caliente, frio = instancias()
+    vapor = caliente.propiedades_estado(p_bar=1, t_c=200)
+    # Una estimación monofásica para un estado bifásico no debe cambiar la solución
+    s_bifasico = frio.propiedades_estado(p_bar=0.08, x=0.9)['s']
+    resultado = caliente.propiedades_estado(p_bar=0.08, s_kjkgK=s_bifasico, estimacion=vapor)
+    assert resultado['x'] == pytest.approx(0.9, abs=1e-6)
+    # Y una estimación bifásica se ignora
+    resultado = caliente.propiedades_estado(p_bar=1, h_kjkg=vapor['h'], estimacion=resultado)
+    assert resultado['T'] == pytest.approx(200, abs=1e-6)
+
+def test_lote_en_caliente_igual_que_en_frio():
+    caliente, frio = instancias()
+    presiones = np.linspace(20.0, 100.0, 40)
+    h = frio.propiedades_estado_v(p_bar=presiones, t_c=480.0)['h']
+    np.testing.assert_allclose(caliente.propiedades_estado_v(p_bar=presiones, h_kjkg=h)['T'],
+                               frio.propiedades_estado_v(p_bar=presiones, h_kjkg=h)['T'], atol=1e-6)
@@ -0,0 +1,44 @@
+# Pruebas del barrido paramétrico (analisis/barrido.py)
+import pytest
+
+from analisis.barrido import barrer, evaluar_bloque, expandir_malla
+
+BASE = {'p_baja': 0.08, 'rendimiento_turbina': 0.85}
+
+def test_malla_cartesiana():
+    puntos = expandir_malla({'p_alta': [40, 80], 't_max': [450, 500, 550]})
+    assert len(puntos) == 6
+    assert puntos[0] == {'p_alta': 40, 't_max': 450}
+    assert puntos[-1] == {'p_alta': 80, 't_max': 550}
+
+def test_hipercubo_latino_un_punto_por_estrato():
+    puntos = expandir_malla({'p_alta': (40, 120), 't_max': (400, 600)}, "lhs", n_muestras=8, semilla=3)
+    assert len(puntos) == 8
+    for nombre, (minimo, maximo) in (('p_alta', (40, 120)), ('t_max', (400, 600))):
+        estratos = sorted(int((p[nombre] - minimo) / (maximo - minimo) * 8) for p in puntos)
+        assert estratos == list(range(8))
+    assert puntos == expandir_malla({'p_alta': (40, 120), 't_max': (400, 600)}, "lhs", n_muestras=8, semilla=3)
+
+def test_metodo_y_muestras_invalidos():
+    with pytest.raises(ValueError, match="no soportado"):
+        expandir_malla({'p_alta': [80]}, "sobol")
+    with pytest.raises(ValueError, match="n_muestras"):
+        expandir_malla({'p_alta': (40, 120)}, "lhs")
+
+def test_errores_por_punto():
+    filas = evaluar_bloque("Rankine Simple", BASE, [{'p_alta': 80, 't_max': 500}, {'p_alta': 80}])
+    assert filas[0][1] is None and filas[0][0]['Eficiencia térmica'] > 0
+    assert filas[1][0] == {} and 't_max' in filas[1][1]
+
+def test_barrido_en_este_proceso():
+    tabla = barrer("Rankine Simple", BASE, {'p_alta': [40, 80, 120], 't_max': [500]},
+                   procesos=1, tam_bloque=2)
+    assert tabla['p_alta'] == [40, 80, 120]
+    assert tabla['error'] == [None, None, None]
+    eficiencias = tabla['Eficiencia térmica']
+    assert eficiencias == sorted(eficiencias)
+    directo = evaluar_bloque("Rankine Simple", BASE, [{'p_alta': 80, 't_max': 500}])[0][0]
+    assert eficiencias[1] == pytest.approx(directo['Eficiencia térmica'], rel=1e-9)
+
+def test_barrido_vacio():
+    assert barrer("Rankine Simple", BASE, {'p_alta': []}, procesos=1) == {'p_alta': [], 'error': []}
@@ -0,0 +1,32 @@
+# Pruebas del benchmark (analisis/benchmark.py)
+import pytest
+
+from analisis.benchmark import CASOS_CICLOS, comparar, medir, medir_propiedades
+from ciclos.registro import CICLOS_DISPONIBLES, obtener_validador
+
+def _informe(**p50):
+    return {'metricas': {nombre: {'p50_us': valor} for nombre, valor in p50.items()}}
+
+def test_comparar_solo_informa_de_regresiones_sobre_el_umbral():
+    referencia = _informe(a=10.0, b=10.0, c=10.0)
+    informe = _informe(a=12.0, b=13.0, c=5.0, nueva=99.0)
+    (regresion,) = comparar(informe, referencia, umbral=0.25)
+    assert regresion[:3] == ('b', 10.0, 13.0)
+    assert regresion[3] == pytest.approx(0.3)
+
+def test_medir_devuelve_percentiles_ordenados():
+    metrica = medir(lambda: sum(range(100)), 20)
+    assert metrica['repeticiones'] == 20
+    assert 0 < metrica['p50_us'] <= metrica['p99_us']
+
+def test_casos_de_ciclos_son_validos_para_su_esquema():
+    assert set(CASOS_CICLOS) == set(CICLOS_DISPONIBLES)
+    for nombre, parametros in CASOS_CICLOS.items():
+        obtener_validador(nombre).validar(parametros)
+
+def test_metricas_de_propiedades_separan_frio_caliente_y_tabla():
+    metricas = medir_propiedades(repeticiones=2)
+    assert "propiedades/Water/ph/frio" in metricas
+    assert "propiedades/Water/ph/tabla_saturacion" in metricas
+    # Los estados en (p, t) no pasan por la tabla de saturación
+    assert "propiedades/Water/pt/tabla_saturacion" not in metricas
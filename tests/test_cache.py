@@ -0,0 +1,49 @@
+# Pruebas de la caché LRU de propiedades (util/propiedades.py)
+import pytest
+
+from util.propiedades import CachePropiedades, PropiedadesTermodinamicas
+
+def test_lru_descarta_la_entrada_menos_usada():
+    cache = CachePropiedades(max_entradas=2)
+    a, b, c = (cache.clave("HEOS", "Water", 1, (v, None)) for v in (1.0, 2.0, 3.0))
+    cache.guardar(a, {'h': 1})
+    cache.guardar(b, {'h': 2})
+    assert cache.obtener(a) == {'h': 1}  # a pasa a ser la más reciente
+    cache.guardar(c, {'h': 3})
+    assert cache.obtener(b) is None
+    assert cache.obtener(a) == {'h': 1} and cache.obtener(c) == {'h': 3}
+    assert (cache.aciertos, cache.fallos) == (3, 1)
+
+def test_clave_cuantiza_a_la_tolerancia():
+    cache = CachePropiedades(tolerancia=1e-6)
+    assert cache.clave("HEOS", "Water", 1, (80.0, None)) == cache.clave("HEOS", "Water", 1, (80.0 + 1e-9, None))
+    assert cache.clave("HEOS", "Water", 1, (80.0, None)) != cache.clave("HEOS", "Water", 1, (80.0 + 1e-5, None))
+
+def test_configurar():
+    cache = CachePropiedades(max_entradas=4)
+    for v in range(4):
+        cache.guardar(cache.clave("HEOS", "Water", 1, (float(v),)), {})
+    cache.configurar(max_entradas=2)
+    assert cache.estadisticas()['entradas'] == 2
+    cache.configurar(tolerancia=1e-3)
+    assert cache.estadisticas()['entradas'] == 0
+    with pytest.raises(ValueError):
+        cache.configurar(tolerancia=0)
+    with pytest.raises(ValueError):
+        cache.configurar(max_entradas=0)
+
+def test_opciones_de_la_instancia_no_comparten_entradas():
+    cache = CachePropiedades()
+    con_tabla = PropiedadesTermodinamicas("Water", cache=cache)
+    sin_tabla = PropiedadesTermodinamicas("Water", cache=cache, tabla_saturacion=False, arranque_caliente=False)
+    con_tabla.propiedades_estado(p_bar=0.08, x=0.0)
+    sin_tabla.propiedades_estado(p_bar=0.08, x=0.0)
+    assert (con_tabla.origen, sin_tabla.origen) == ("tabla_saturacion", "flash")
+    sin_tabla.propiedades_estado(p_bar=0.08, x=0.0)
+    assert sin_tabla.origen == "cache"
+
+def test_resultado_de_la_cache_es_una_copia():
+    pt = PropiedadesTermodinamicas("Water", cache=CachePropiedades())
+    props = pt.propiedades_estado(p_bar=80, t_c=500)
+    props['h'] = 0.0
+    assert pt.propiedades_estado(p_bar=80, t_c=500)['h'] > 3000
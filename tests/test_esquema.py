@@ -0,0 +1,80 @@
+# Pruebas del esquema y el validador de parámetros (ciclos/esquema.py)
+import pytest
+
+from ciclos.esquema import (ErrorParametros, Parametro, Validador, alguno, decreciente, esquema,
+                            misma_longitud)
+from ciclos.registro import obtener_validador
+
+VALIDADOR = Validador(
+    esquema(
+        Parametro('p_alta', "Presión alta", 'bar', minimo=0.01, maximo=1000.0, obligatorio=True),
+        Parametro('p_extraccion', "Presiones extracción", 'bar', minimo=0.01, lista=True),
+        Parametro('p_baja', "Presión baja", 'bar', minimo=0.01, maximo=1000.0),
+        Parametro('t_baja', "Temperatura baja", '°C'),
+        Parametro('tipos', "Tipos", tipo=str, lista=True, opciones=("abierto", "cerrado")),
+        Parametro('fuente', "Fuente", tipo=str, opciones=("vapor", "gas")),
+        Parametro('rendimiento', "Rendimiento", minimo=0.0, maximo=1.0, minimo_excluido=True),
+    ),
+    relaciones=(decreciente('p_alta', 'p_extraccion', 'p_baja'), alguno('p_baja', 't_baja'),
+                misma_longitud('tipos', 'p_extraccion')),
+)
+
+def errores(valores):
+    with pytest.raises(ErrorParametros) as info:
+        VALIDADOR.validar(valores)
+    return {e['parametro']: e['mensaje'] for e in info.value.errores}
+
+def test_conversion_de_texto_y_listas():
+    resultado = VALIDADOR.validar({'p_alta': ' 80 ', 'p_extraccion': '20, 3,', 'p_baja': '1e-1',
+                                   'tipos': 'Cerrado, abierto', 'fuente': 'GAS', 'rendimiento': 1,
+                                   'flujo_masico': ''})
+    assert resultado == {'p_alta': 80.0, 'p_extraccion': [20.0, 3.0], 'p_baja': 0.1,
+                         'tipos': ['cerrado', 'abierto'], 'fuente': 'gas', 'rendimiento': 1.0}
+    # Un solo valor de una lista se entrega como escalar
+    assert VALIDADOR.validar({'p_alta': 80, 'p_extraccion': [10], 'p_baja': 0.08})['p_extraccion'] == 10.0
+
+def test_numeros_limites_y_opciones():
+    encontrados = errores({'p_alta': 'ochenta', 'p_baja': 2000, 'rendimiento': 0,
+                           'fuente': 'carbón', 'flujo_masico': float('nan')})
+    assert encontrados['p_alta'] == "'ochenta' no es un número"
+    assert encontrados['p_baja'] == "debe estar entre 0.01 y 1000 bar"
+    assert encontrados['rendimiento'] == "debe ser mayor que 0 y menor o igual que 1"
+    assert "no es una opción válida" in encontrados['fuente']
+    assert encontrados['flujo_masico'] == "'nan' no es un número"
+    assert "no es un número" in errores({'p_alta': True, 'p_baja': 1})['p_alta']
+
+def test_obligatorios_y_parametros_desconocidos():
+    encontrados = errores({'p_baja': 1, 'presion_alta': 80})
+    assert encontrados == {'presion_alta': "no es un parámetro de este ciclo", 'p_alta': "es obligatorio"}
+    # Un obligatorio con un valor inválido se informa una sola vez
+    assert errores({'p_alta': 'x', 'p_baja': 1}) == {'p_alta': "'x' no es un número"}
+
+def test_relacion_decreciente():
+    assert "debe ser menor que p_alta" in errores({'p_alta': 10, 'p_extraccion': 20, 'p_baja': 1})['p_extraccion']
+    assert "de mayor a menor" in errores({'p_alta': 80, 'p_extraccion': '3, 20', 'p_baja': 1})['p_extraccion']
+    assert "debe ser menor que p_extraccion" in errores({'p_alta': 80, 'p_extraccion': 10, 'p_baja': 10})['p_baja']
+    # Los parámetros que faltan no intervienen
+    assert VALIDADOR.validar({'p_alta': 80, 't_baja': 30}) == {'p_alta': 80.0, 't_baja': 30.0}
+
+def test_relaciones_alguno_y_misma_longitud():
+    assert errores({'p_alta': 80})['p_baja'] == "es obligatorio (o bien t_baja)"
+    mensaje = errores({'p_alta': 80, 'p_baja': 1, 'p_extraccion': '20,3', 'tipos': 'abierto'})['tipos']
+    assert mensaje == "debe tener un valor por cada valor de p_extraccion (2)"
+
+def test_relaciones_solo_con_valores_validos():
+    # Con errores de conversión no se evalúan las relaciones (evita mensajes en cascada)
+    assert errores({'p_alta': 10, 'p_extraccion': 'x', 'p_baja': 20}) == {'p_extraccion': "'x' no es un número"}
+
+def test_texto_de_etiqueta():
+    assert Parametro('p_alta', "Presión alta", 'bar').texto_etiqueta == "Presión alta (bar):"
+    assert Parametro('n', "Número").texto_etiqueta == "Número:"
+    lista = Parametro('tipos', "Tipos", tipo=str, lista=True, opciones=("abierto", "cerrado"))
+    assert lista.texto_etiqueta == "Tipos (abierto/cerrado):"
+
+def test_validador_del_registro():
+    validador = obtener_validador("Rankine Regenerativo")
+    assert validador is obtener_validador("Rankine Regenerativo")
+    with pytest.raises(ErrorParametros, match="p_extraccion"):
+        validador.validar({'p_alta': 80, 'p_baja': 0.08, 't_max': 500, 'p_extraccion': 100})
+    with pytest.raises(ValueError, match="no registrado"):
+        obtener_validador("Ciclo inexistente")
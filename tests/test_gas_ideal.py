@@ -0,0 +1,48 @@
+# Pruebas del modelo de gas ideal (util/gas_ideal.py)
+import CoolProp
+import numpy as np
+import pytest
+
+from util.gas_ideal import obtener_modelo
+from util.propiedades import CachePropiedades, PropiedadesTermodinamicas
+
+@pytest.fixture(scope="module")
+def modelo():
+    return obtener_modelo("Air")
+
+@pytest.mark.parametrize("p_bar, t_c", [(1.0, -20.0), (10.0, 300.0), (30.0, 1400.0)])
+def test_flashes_inversos_recuperan_la_temperatura(modelo, p_bar, t_c):
+    directo = modelo.propiedades(CoolProp.PT_INPUTS, p_bar, t_c)
+    por_h = modelo.propiedades(CoolProp.HmassP_INPUTS, p_bar, directo['h'])
+    por_s = modelo.propiedades(CoolProp.PSmass_INPUTS, p_bar, directo['s'])
+    assert por_h['T'] == pytest.approx(t_c, abs=1e-6)
+    assert por_s['T'] == pytest.approx(t_c, abs=1e-6)
+    assert por_s['h'] == pytest.approx(directo['h'], rel=1e-9)
+
+def test_coincide_con_heos_a_baja_presion(modelo):
+    heos = PropiedadesTermodinamicas("Air", cache=CachePropiedades()).propiedades_estado(p_bar=1.0, t_c=500.0)
+    propio = modelo.propiedades(CoolProp.PT_INPUTS, 1.0, 500.0)
+    for clave in ('h', 's', 'rho'):
+        assert propio[clave] == pytest.approx(heos[clave], rel=1e-3)
+
+def test_escalar_y_vectorizado_coinciden(modelo):
+    t_c = np.linspace(-100.0, 2000.0, 57)
+    p_bar = np.full_like(t_c, 7.5)
+    lote = modelo.propiedades_v(CoolProp.PT_INPUTS, p_bar, t_c)
+    for k in range(0, len(t_c), 7):
+        escalar = modelo.propiedades(CoolProp.PT_INPUTS, 7.5, float(t_c[k]))
+        for clave in ('h', 's', 'rho', 'T'):
+            assert lote[clave][k] == pytest.approx(escalar[clave], rel=1e-12, abs=1e-12)
+
+def test_fuera_del_dominio(modelo):
+    with pytest.raises(ValueError, match="fuera del dominio"):
+        modelo.propiedades(CoolProp.PT_INPUTS, 1.0, 5000.0)
+    with pytest.raises(ValueError):
+        modelo.propiedades(CoolProp.PT_INPUTS, 0.0, 25.0)
+    assert np.isnan(modelo.propiedades_v(CoolProp.PT_INPUTS, 1.0, np.array([5000.0]))['h'][0])
+
+def test_backend_gas_ideal_no_usa_la_cache():
+    cache = CachePropiedades()
+    pt = PropiedadesTermodinamicas("Air", "gas_ideal", cache=cache)
+    pt.propiedades_estado(p_bar=10, s_kjkgK=3.88)
+    assert pt.origen == "gas_ideal" and cache.estadisticas()['entradas'] == 0
@@ -0,0 +1,66 @@
+# Pruebas del grafo de estados con recálculo incremental (ciclos/grafo.py)
+import pytest
+
+from ciclos.grafo import GrafoCiclo, Nodo
+from ciclos.rankine import CicloRankine
+
+def grafo_de_prueba(llamadas):
+    def nodo(nombre, entradas, funcion):
+        def contar(*valores):
+            llamadas.append(nombre)
+            return funcion(*valores)
+        return Nodo(nombre, entradas, contar)
+
+    # Declarados fuera de orden a propósito
+    return GrafoCiclo([
+        nodo('c', ('b', 'y'), lambda b, y: b * y),
+        nodo('a', ('x',), lambda x: x + 1),
+        nodo('b', ('a',), lambda a: 2 * a),
+        nodo('d', ('y',), lambda y: -y),
+    ])
+
+def test_orden_topologico_y_parametros():
+    grafo = grafo_de_prueba([])
+    assert grafo.orden.index('a') < grafo.orden.index('b') < grafo.orden.index('c')
+    assert grafo.parametros() == {'x', 'y'}
+    assert grafo.dependientes('x') == {'a', 'b', 'c'}
+    assert grafo.dependientes('y') == {'c', 'd'}
+
+def test_solo_se_recalculan_los_nodos_afectados():
+    llamadas = []
+    grafo = grafo_de_prueba(llamadas)
+    assert grafo.evaluar({'x': 1, 'y': 3}) == {'a': 2, 'b': 4, 'c': 12, 'd': -3}
+    assert sorted(llamadas) == ['a', 'b', 'c', 'd']
+
+    llamadas.clear()
+    assert grafo.evaluar({'x': 1, 'y': 5})['c'] == 20
+    assert sorted(llamadas) == ['c', 'd']
+    assert sorted(grafo.recalculados) == ['c', 'd']
+
+    llamadas.clear()
+    grafo.evaluar({'x': 1, 'y': 5})
+    assert llamadas == [] and grafo.recalculados == []
+
+    grafo.olvidar()
+    grafo.evaluar({'x': 1, 'y': 5})
+    assert sorted(llamadas) == ['a', 'b', 'c', 'd']
+
+def test_errores_de_definicion_y_de_parametros():
+    with pytest.raises(ValueError, match="duplicados"):
+        GrafoCiclo([Nodo('a', ('x',), abs), Nodo('a', ('y',), abs)])
+    with pytest.raises(ValueError, match="circular"):
+        GrafoCiclo([Nodo('a', ('b',), abs), Nodo('b', ('a',), abs)])
+    with pytest.raises(ValueError, match="Falta el parámetro 'y'"):
+        grafo_de_prueba([]).evaluar({'x': 1})
+
+def test_rankine_reutiliza_los_estados_no_afectados():
+    ciclo = CicloRankine()
+    parametros = {'p_alta': 80, 'p_baja': 0.08, 't_max': 500, 'rendimiento_turbina': 0.85}
+    primero = ciclo.calcular(parametros)
+    # La presión del condensador no afecta a la caldera (estado 2)
+    segundo = ciclo.calcular({**parametros, 'p_baja': 0.1})
+    assert '2' not in ciclo.grafo.recalculados
+    assert {'3', '4'} <= set(ciclo.grafo.recalculados)
+    assert segundo.estados['2'] == primero.estados['2']
+    otro = CicloRankine().calcular({**parametros, 'p_baja': 0.1})
+    assert segundo.valores == pytest.approx(otro.valores, rel=1e-12)
@@ -0,0 +1,69 @@
+# Pruebas de la propagación de incertidumbre (analisis/incertidumbre.py)
+import warnings
+
+import numpy as np
+import pytest
+
+from analisis.incertidumbre import (CuantilP2, Distribucion, Momentos, funcion_lote_ciclo,
+                                    propagar)
+
+def test_momentos_por_lotes_coinciden_con_numpy():
+    generador = np.random.default_rng(1)
+    valores = generador.normal(5.0, 2.0, 10007)
+    momentos = Momentos()
+    for inicio in range(0, len(valores), 997):
+        momentos.agregar(valores[inicio:inicio + 997])
+    assert momentos.n == len(valores)
+    assert momentos.media == pytest.approx(valores.mean(), rel=1e-12)
+    assert momentos.varianza == pytest.approx(valores.var(ddof=1), rel=1e-10)
+
+@pytest.mark.parametrize("p", [0.05, 0.5, 0.95])
+def test_cuantil_p2_aproxima_el_percentil(p):
+    valores = np.random.default_rng(2).normal(0.0, 1.0, 20000)
+    cuantil = CuantilP2(p)
+    for valor in valores.tolist():
+        cuantil.agregar(valor)
+    assert cuantil.valor == pytest.approx(np.quantile(valores, p), abs=0.03)
+
+def test_cuantil_p2_exacto_con_pocas_muestras():
+    cuantil = CuantilP2(0.5)
+    for valor in (3.0, 1.0, 2.0):
+        cuantil.agregar(valor)
+    assert cuantil.valor == 2.0
+
+def _medias(funcion_lote, base, semilla=7):
+    estado = propagar("Rankine Simple", base, {'t_max': Distribucion('normal', 500.0, 10.0)},
+                      tam_lote=200, min_muestras=400, max_muestras=400, semilla=semilla,
+                      procesos=1, funcion_lote=funcion_lote)
+    return {salida: fila['media'] for salida, fila in estado['salidas'].items()}
+
+def test_vectorizado_coincide_con_punto_a_punto():
+    base = {'p_alta': 80.0, 'p_baja': 0.08, 'flujo_masico': 2.0}
+    funcion = funcion_lote_ciclo("Rankine Simple", list(base) + ['t_max'])
+    assert funcion is not None
+    vectorizado, punto_a_punto = _medias(funcion, base), _medias(None, base)
+    for salida, media in punto_a_punto.items():
+        assert vectorizado[salida] == pytest.approx(media, rel=1e-6)
+
+def test_parametro_no_admitido_por_lotes_evalua_punto_a_punto():
+    base = {'p_alta': 80.0, 'p_baja': 0.08, 'potencia': 50000.0}
+    with pytest.warns(UserWarning, match="potencia"):
+        assert funcion_lote_ciclo("Rankine Simple", list(base) + ['t_max']) is None
+
+    # Sin la lista de parámetros, la función por lotes rechaza la columna y el evaluador
+    # recurre al cálculo punto a punto en lugar de ignorarla
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        funcion = funcion_lote_ciclo("Rankine Simple")
+    assert _medias(funcion, base)['Potencia neta'] == pytest.approx(50000.0, rel=1e-9)
+
+def test_regenerativo_por_lotes_traduce_nombres_y_listas():
+    from analisis.barrido import evaluar_bloque
+
+    base = {'p_alta': 80.0, 'p_baja': 0.08, 'p_extraccion': "20,5", 'tipos_calentadores': "cerrado,abierto"}
+    t_max = np.array([490.0, 500.0, 510.0])
+    funcion = funcion_lote_ciclo("Rankine Regenerativo", list(base) + ['t_max'])
+    vectorizado = funcion({**base, 't_max': t_max})['Eficiencia térmica']
+    punto_a_punto = [resultados['Eficiencia térmica']
+                     for resultados, _ in evaluar_bloque("Rankine Regenerativo", base, [{'t_max': t} for t in t_max])]
+    assert vectorizado == pytest.approx(punto_a_punto, rel=1e-6)
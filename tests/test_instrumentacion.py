@@ -0,0 +1,49 @@
+# Pruebas de la instrumentación de llamadas a propiedades (util/instrumentacion.py)
+import util.saturacion as saturacion
+from util.instrumentacion import instrumentacion
+from util.propiedades import CachePropiedades, PropiedadesTermodinamicas
+
+def _filas(**filtro):
+    return [fila for fila in instrumentacion.resumen()
+            if all(fila[clave] == valor for clave, valor in filtro.items())]
+
+def test_origen_y_updates_por_llamada():
+    pt = PropiedadesTermodinamicas("Water", cache=CachePropiedades(), arranque_caliente=False)
+    with instrumentacion.registrar():
+        pt.propiedades_estado(p_bar=80, t_c=500)
+        pt.propiedades_estado(p_bar=80, t_c=500)
+        pt.propiedades_estado(p_bar=0.08, x=0.0)
+    (flash,) = _filas(origen="flash")
+    assert (flash['par'], flash['llamadas'], flash['updates']) == ("p,t", 1, 1)
+    (cache,) = _filas(origen="cache")
+    assert (cache['llamadas'], cache['updates']) == (1, 0)
+    (tabla,) = _filas(origen="tabla_saturacion")
+    assert (tabla['par'], tabla['updates']) == ("p,x", 0)
+    # Sin ciclo en la pila, la llamada se atribuye al primer marco fuera de util/
+    assert flash['ciclo'] == __name__ and flash['etapa'] == "test_origen_y_updates_por_llamada"
+
+def test_construccion_de_la_tabla_es_una_entrada_propia(monkeypatch):
+    monkeypatch.setattr(saturacion, "_tablas", {})
+    pt = PropiedadesTermodinamicas("Water", cache=None)
+    with instrumentacion.registrar():
+        pt.propiedades_estado(p_bar=1.0, x=1.0)
+    (construccion,) = _filas(origen="construccion")
+    (llamada,) = _filas(origen="tabla_saturacion")
+    assert construccion['etapa'] == "Construcción tabla de saturación"
+    assert llamada['tiempo_us'] < construccion['tiempo_us']
+
+def test_desactivar_restaura_los_metodos():
+    escalar = PropiedadesTermodinamicas.propiedades_estado
+    obtener_tabla = saturacion.obtener_tabla
+    with instrumentacion.registrar():
+        assert PropiedadesTermodinamicas.propiedades_estado is not escalar
+    assert PropiedadesTermodinamicas.propiedades_estado is escalar
+    assert saturacion.obtener_tabla is obtener_tabla
+
+def test_ciclo_y_etapa_del_grafo():
+    from ciclos import rankine
+
+    with instrumentacion.registrar():
+        rankine.calcular({'p_alta': 80, 'p_baja': 0.08, 't_max': 500})
+    etapas = {fila['etapa'] for fila in _filas(ciclo="CicloRankine")}
+    assert "Caldera 2" in etapas
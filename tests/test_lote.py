@@ -0,0 +1,63 @@
+# Pruebas de la ejecución por lotes (analisis/lote.py)
+import io
+import json
+
+from analisis.lote import ejecutar, leer_casos, main
+
+def _ejecutar(texto, formato):
+    salida = io.StringIO()
+    totales = ejecutar(leer_casos(io.StringIO(texto), formato), salida)
+    return totales, [json.loads(linea) for linea in salida.getvalue().splitlines()]
+
+def test_csv_fila_valida_se_calcula():
+    totales, (registro,) = _ejecutar("id,ciclo,p_alta,p_baja,t_max\n"
+                                     "a,Rankine Simple,80,0.08,500\n", "csv")
+    assert totales == (1, 0)
+    assert registro['id'] == 'a' and registro['error'] is None
+    assert registro['resultados']['Eficiencia térmica'] > 0
+
+def test_csv_fila_larga_es_un_error_del_caso():
+    totales, registros = _ejecutar("id,ciclo,p_alta,p_baja,t_max\n"
+                                   "a,Rankine Simple,80,0.08,500,sobra\n"
+                                   "b,Rankine Simple,80,0.08,500\n", "csv")
+    assert totales == (2, 1)
+    errores = {r['id']: r['error'] for r in registros}
+    assert errores == {'a': "fila con más campos que la cabecera", 'b': None}
+
+def test_csv_fila_corta_informa_del_parametro_que_falta():
+    totales, (registro,) = _ejecutar("id,ciclo,p_alta,p_baja,t_max\n"
+                                     "a,Rankine Simple,80,0.08\n", "csv")
+    assert totales == (1, 1)
+    assert [e['parametro'] for e in registro['errores']] == ['t_max']
+
+def test_csv_valores_no_finitos_y_fuera_de_limites():
+    _, registros = _ejecutar("id,ciclo,p_alta,p_baja,t_max,rendimiento_turbina\n"
+                             "a,Rankine Simple,nan,0.08,500,\n"
+                             "b,Rankine Simple,80,0.08,500,0\n", "csv")
+    errores = {r['id']: [(e['parametro'], e['valor']) for e in r['errores']] for r in registros}
+    assert errores == {'a': [('p_alta', 'nan')], 'b': [('rendimiento_turbina', 0.0)]}
+
+def test_jsonl_errores_por_linea():
+    texto = "\n".join([
+        '{"id": 1, "ciclo": "Rankine Simple", "parametros": {"p_alta": 80, "p_baja": 0.08, "t_max": 500}}',
+        '{no es json',
+        '[1, 2]',
+        '{"id": 4, "ciclo": "Rankine Simple", "parametros": [80]}',
+        '{"id": 5, "ciclo": "Ciclo Inventado"}',
+        '{"id": 6, "ciclo": "Rankine Simple", "p_alta": 80, "p_baja": 0.08, "t_max": 500, "presion": 3}',
+    ]) + "\n"
+    totales, registros = _ejecutar(texto, "jsonl")
+    assert totales == (6, 5)
+    por_linea = {r['linea']: r for r in registros}
+    assert por_linea[1]['error'] is None
+    assert por_linea[2]['error'].startswith("JSON inválido")
+    assert por_linea[3]['error'] == "El caso debe ser un objeto JSON"
+    assert por_linea[4]['error'] == "'parametros' debe ser un objeto JSON"
+    assert por_linea[5]['errores'][0]['parametro'] == 'ciclo'
+    assert por_linea[6]['errores'][0]['mensaje'] == "no es un parámetro de este ciclo"
+
+def test_main_devuelve_1_con_errores(tmp_path, capsys):
+    entrada = tmp_path / "casos.csv"
+    entrada.write_text("ciclo,p_alta\nRankine Simple,80,1\n", encoding="utf-8")
+    assert main([str(entrada), "--salida", str(tmp_path / "salida.jsonl")]) == 1
+    assert "1 con error" in capsys.readouterr().err
@@ -0,0 +1,51 @@
+# Pruebas del optimizador de parámetros de diseño (analisis/optimizacion.py)
+import pytest
+
+from analisis import optimizacion
+from analisis.optimizacion import Evaluador, optimizar
+
+def _parabola(columnas):
+    """Objetivo vectorizado con máximo en x = 3, y = -1"""
+    x = columnas['x']
+    y = columnas.get('y', 0 * x - 1)
+    return 10 - (x - 3) ** 2 - 2 * (y + 1) ** 2
+
+@pytest.mark.parametrize("metodo, limites", [
+    ("aurea", {'x': (0.0, 10.0)}),
+    ("nelder-mead", {'x': (0.0, 10.0), 'y': (-5.0, 5.0)}),
+    ("evolucion", {'x': (0.0, 10.0), 'y': (-5.0, 5.0)}),
+])
+def test_metodos_encuentran_el_maximo(metodo, limites):
+    opciones = {'semilla': 3, 'generaciones': 200} if metodo == "evolucion" else {}
+    resultado = optimizar("sin ciclo", {}, limites, metodo, funcion_lote=_parabola, **opciones)
+    assert resultado['optimo']['x'] == pytest.approx(3.0, abs=1e-2)
+    assert resultado['valor'] == pytest.approx(10.0, abs=1e-3)
+
+def test_evaluador_no_repite_puntos():
+    llamadas = []
+
+    def objetivo(columnas):
+        llamadas.append(len(columnas['x']))
+        return columnas['x']
+
+    evaluador = Evaluador("sin ciclo", {}, ['x'], funcion_lote=objetivo)
+    assert evaluador.evaluar([[1.0], [2.0], [1.0]]) == [-1.0, -2.0, -1.0]
+    evaluador.evaluar([[2.0], [3.0]])
+    assert llamadas == [2, 1]
+    assert (evaluador.evaluaciones, evaluador.aciertos) == (3, 2)
+
+def test_aurea_no_crea_procesos(monkeypatch):
+    def prohibido(*_, **__):
+        raise AssertionError("la sección áurea no debe crear procesos")
+
+    monkeypatch.setattr(optimizacion, "ProcessPoolExecutor", prohibido)
+    resultado = optimizar("Rankine Simple", {'p_alta': 80, 'p_baja': 0.08}, {'t_max': (400.0, 600.0)},
+                          "aurea", procesos=4, tolerancia=1e-2)
+    # La eficiencia crece con la temperatura máxima: el óptimo está en el límite superior
+    assert resultado['optimo']['t_max'] == pytest.approx(600.0, abs=3.0)
+
+def test_limites_invalidos():
+    with pytest.raises(ValueError, match="Límites inválidos"):
+        optimizar("sin ciclo", {}, {'x': (1.0, 1.0)}, funcion_lote=_parabola)
+    with pytest.raises(ValueError, match="no soportado"):
+        optimizar("sin ciclo", {}, {'x': (0.0, 1.0)}, "gradiente", funcion_lote=_parabola)
@@ -0,0 +1,47 @@
+# Pruebas de los pares de entrada de propiedades_estado (util/propiedades.py)
+import CoolProp
+import CoolProp.CoolProp as CP
+import pytest
+
+from util.propiedades import CachePropiedades, PropiedadesTermodinamicas, _clave_par
+
+@pytest.fixture
+def pt():
+    return PropiedadesTermodinamicas("Water", cache=CachePropiedades(), tabla_saturacion=False,
+                                     arranque_caliente=False)
+
+def test_un_flash_devuelve_todas_las_propiedades(pt):
+    props = pt.propiedades_estado(p_bar=80, t_c=500)
+    assert set(props) == {'h', 's', 'rho', 'T', 'x', 'phase'}
+    assert props['h'] == pytest.approx(CP.PropsSI('H', 'P', 80e5, 'T', 773.15, 'Water') / 1000, rel=1e-9)
+    assert props['phase'] in ("gas", "supercritical_gas")
+
+@pytest.mark.parametrize("p_bar, t_c", [(80, 500), (0.08, 30), (200, 600)])
+def test_pares_inversos_recuperan_el_estado(pt, p_bar, t_c):
+    directo = pt.propiedades_estado(p_bar=p_bar, t_c=t_c)
+    por_h = pt.propiedades_estado(p_bar=p_bar, h_kjkg=directo['h'])
+    por_s = pt.propiedades_estado(p_bar=p_bar, s_kjkgK=directo['s'])
+    assert por_h['T'] == pytest.approx(t_c, abs=1e-6)
+    assert por_s['T'] == pytest.approx(t_c, abs=1e-6)
+
+def test_saturacion_por_presion_y_por_temperatura(pt):
+    por_p = pt.propiedades_estado(p_bar=1.01325, x=1.0)
+    assert por_p['T'] == pytest.approx(99.97, abs=0.01)
+    por_t = pt.propiedades_estado(t_c=por_p['T'], x=1.0)
+    assert por_t['h'] == pytest.approx(por_p['h'], rel=1e-9)
+    assert pt.liquido_saturado(1.01325)['x'] == 0.0
+
+def test_combinacion_no_soportada(pt):
+    with pytest.raises(ValueError, match="combinación de entradas no soportada"):
+        pt.propiedades_estado(t_c=25, h_kjkg=100)
+    with pytest.raises(ValueError, match="Error al calcular propiedades"):
+        pt.propiedades_estado(p_bar=-1, t_c=25)
+
+def test_registrar_par_entrada(monkeypatch, pt):
+    monkeypatch.setattr(PropiedadesTermodinamicas, "PARES_ENTRADA", dict(PropiedadesTermodinamicas.PARES_ENTRADA))
+    PropiedadesTermodinamicas.registrar_par_entrada(
+        ('h', 's'), CoolProp.HmassSmass_INPUTS, lambda p, t, h, s, x: (h * 1000, s * 1000))
+    directo = pt.propiedades_estado(p_bar=80, t_c=500)
+    por_hs = pt.propiedades_estado(h_kjkg=directo['h'], s_kjkgK=directo['s'])
+    assert por_hs['T'] == pytest.approx(500, abs=1e-5)
+    assert _clave_par('h', 's') in PropiedadesTermodinamicas.PARES_ENTRADA
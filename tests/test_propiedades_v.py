@@ -0,0 +1,54 @@
+# Pruebas de la API vectorizada propiedades_estado_v (util/propiedades.py)
+import numpy as np
+import pytest
+
+from util.propiedades import CachePropiedades, PropiedadesTermodinamicas
+
+@pytest.fixture
+def pt():
+    return PropiedadesTermodinamicas("Water", cache=CachePropiedades(), tabla_saturacion=False,
+                                     arranque_caliente=False)
+
+def test_coincide_con_la_version_escalar(pt):
+    presiones = np.array([0.08, 1.0, 80.0, 200.0])
+    temperaturas = np.array([30.0, 150.0, 500.0, 600.0])
+    lote = pt.propiedades_estado_v(p_bar=presiones, t_c=temperaturas)
+    for k, (p, t) in enumerate(zip(presiones, temperaturas)):
+        props = pt.propiedades_estado(p_bar=p, t_c=t)
+        for nombre in ('h', 's', 'rho', 'T'):
+            assert lote[nombre][k] == pytest.approx(props[nombre], rel=1e-9)
+
+def test_broadcasting_de_escalares_y_columnas(pt):
+    presiones = np.array([10.0, 50.0, 100.0])[:, None]
+    temperaturas = np.array([400.0, 500.0])[None, :]
+    lote = pt.propiedades_estado_v(p_bar=presiones, t_c=temperaturas)
+    assert set(lote) == {'h', 's', 'rho', 'T', 'x'}
+    assert lote['h'].shape == (3, 2)
+    assert lote['h'][2, 1] == pytest.approx(pt.propiedades_estado(p_bar=100, t_c=500)['h'], rel=1e-9)
+    assert pt.propiedades_estado_v(p_bar=80.0, t_c=[300.0, 400.0])['T'].shape == (2,)
+
+def test_pares_inversos_y_titulo(pt):
+    h = pt.propiedades_estado_v(p_bar=[0.08, 80.0], t_c=[30.0, 500.0])['h']
+    lote = pt.propiedades_estado_v(p_bar=[0.08, 80.0], h_kjkg=h)
+    np.testing.assert_allclose(lote['T'], [30.0, 500.0], atol=1e-6)
+    saturado = pt.propiedades_estado_v(p_bar=[0.08, 1.01325], x=1.0)
+    assert saturado['T'][1] == pytest.approx(99.97, abs=0.01)
+    np.testing.assert_array_equal(saturado['x'], [1.0, 1.0])
+
+def test_estados_sin_solucion_quedan_como_nan(pt):
+    lote = pt.propiedades_estado_v(p_bar=[80.0, -1.0, 0.08], t_c=25.0)
+    assert np.isnan(lote['h'][1])
+    assert np.isfinite(lote['h'][[0, 2]]).all()
+
+def test_tabla_de_saturacion_coincide_con_el_flash(pt):
+    con_tabla = PropiedadesTermodinamicas("Water", cache=None, tabla_saturacion=True)
+    presiones = np.array([0.08, 1.0, 10.0, 80.0])
+    s = pt.propiedades_estado_v(p_bar=presiones, x=0.9)['s']
+    por_tabla = con_tabla.propiedades_estado_v(p_bar=presiones, s_kjkgK=s)
+    por_flash = pt.propiedades_estado_v(p_bar=presiones, s_kjkgK=s)
+    np.testing.assert_allclose(por_tabla['x'], 0.9, atol=1e-6)
+    np.testing.assert_allclose(por_tabla['h'], por_flash['h'], rtol=1e-6)
+
+def test_combinacion_no_soportada(pt):
+    with pytest.raises(ValueError, match="combinación de entradas no soportada"):
+        pt.propiedades_estado_v(t_c=[25.0], h_kjkg=[100.0])
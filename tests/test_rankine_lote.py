@@ -0,0 +1,32 @@
+# Pruebas del cálculo por lotes del ciclo Rankine simple (ciclos/rankine.py)
+import numpy as np
+import pytest
+
+from ciclos import rankine
+
+def test_malla_coincide_con_el_calculo_escalar():
+    presiones = np.array([40.0, 80.0, 150.0])
+    temperaturas = np.array([450.0, 550.0])
+    lote = rankine.calcular_lote(presiones[:, None], 0.08, temperaturas[None, :],
+                                 rendimiento_turbina=0.85, rendimiento_bomba=0.8)
+    assert lote['Eficiencia térmica'].shape == (3, 2)
+    for i, p_alta in enumerate(presiones):
+        for j, t_max in enumerate(temperaturas):
+            escalar = rankine.calcular({'p_alta': p_alta, 'p_baja': 0.08, 't_max': t_max,
+                                        'rendimiento_turbina': 0.85, 'rendimiento_bomba': 0.8}).valores
+            for nombre, valor in escalar.items():
+                assert lote[nombre][i, j] == pytest.approx(valor, rel=1e-6), nombre
+
+def test_mismas_claves_que_el_calculo_escalar():
+    escalar = rankine.calcular({'p_alta': 80, 'p_baja': 0.08, 't_max': 500}).valores
+    assert set(rankine.calcular_lote(80, 0.08, 500)) == set(escalar)
+
+def test_flujo_masico_escala_la_potencia():
+    lote = rankine.calcular_lote(80, 0.08, 500, flujo_masico=np.array([1.0, 2.5]))
+    assert lote['Potencia neta'][1] == pytest.approx(2.5 * lote['Potencia neta'][0])
+    np.testing.assert_array_equal(lote['Flujo másico'], [1.0, 2.5])
+
+def test_puntos_sin_solucion_quedan_como_nan():
+    lote = rankine.calcular_lote(np.array([80.0, -5.0]), 0.08, 500)
+    assert np.isfinite(lote['Eficiencia térmica'][0])
+    assert np.isnan(lote['Eficiencia térmica'][1])
@@ -0,0 +1,46 @@
+# Pruebas del ciclo Rankine regenerativo con N calentadores (ciclos/rankine_regenerativo.py)
+import numpy as np
+import pytest
+
+from ciclos import rankine, rankine_regenerativo
+
+BASE = {'p_alta': 80, 'p_baja': 0.08, 't_max': 500, 'rendimiento_turbina': 0.85}
+
+def test_sistema_lineal_coincide_con_el_grafo_de_un_calentador():
+    grafo = rankine_regenerativo.calcular({**BASE, 'p_extraccion': 10})
+    sistema = rankine_regenerativo.calcular({**BASE, 'p_extraccion': 10, 'tipos_calentadores': 'abierto'})
+    assert sistema.valores == pytest.approx(grafo.valores, rel=1e-9)
+
+def test_balance_del_condensador_con_calentadores_abiertos():
+    resultado = rankine_regenerativo.calcular({**BASE, 'p_extraccion': '20, 3',
+                                               'tipos_calentadores': 'abierto, abierto'})
+    valores, estados = resultado.valores, resultado.estados
+    # Solo el vapor no extraído llega al condensador
+    fraccion = 1 - (valores['Fracción extracción 1'] + valores['Fracción extracción 2']) / 100
+    assert valores['Calor rechazado'] == pytest.approx(fraccion * (estados['5']['h'] - estados['4']['h']), rel=1e-9)
+    assert valores['Potencia neta'] == pytest.approx(valores['Calor añadido'] - valores['Calor rechazado'])
+
+@pytest.mark.parametrize("tipos", ["abierto,abierto", "cerrado,abierto", "cerrado,cerrado"])
+def test_mas_calentadores_mejoran_la_eficiencia(tipos):
+    simple = rankine.calcular(BASE).valores['Eficiencia térmica']
+    uno = rankine_regenerativo.calcular({**BASE, 'p_extraccion': 10}).valores
+    dos = rankine_regenerativo.calcular({**BASE, 'p_extraccion': '20,3', 'tipos_calentadores': tipos}).valores
+    assert simple < dos['Eficiencia térmica']
+    assert 0 < dos['Fracción extracción 1'] < 100 and 0 < dos['Fracción extracción 2'] < 100
+    if tipos == "abierto,abierto":
+        assert uno['Eficiencia térmica'] < dos['Eficiencia térmica']
+
+def test_lote_coincide_con_el_calculo_punto_a_punto():
+    presiones = np.array([60.0, 80.0, 100.0])
+    lote = rankine_regenerativo.calcular_lote(presiones, 0.08, 500, np.array([[20.0, 3.0]]),
+                                              ['cerrado', 'abierto'])
+    for k, p_alta in enumerate(presiones):
+        punto = rankine_regenerativo.calcular({**BASE, 'p_alta': p_alta, 'p_extraccion': [20.0, 3.0],
+                                               'tipos_calentadores': ['cerrado', 'abierto']}).valores
+        for nombre, valor in punto.items():
+            assert lote[nombre][k] == pytest.approx(valor, rel=1e-9), nombre
+
+def test_potencia_objetivo_con_varios_calentadores():
+    resultado = rankine_regenerativo.calcular({**BASE, 'p_extraccion': '20,3', 'potencia': 5000.0})
+    assert resultado['Potencia neta'] == pytest.approx(5000.0)
+    assert resultado['Flujo másico'] > 1
@@ -0,0 +1,69 @@
+# Pruebas del registro de ciclos y de la carga diferida de plugins (ciclos/registro.py)
+import importlib.metadata
+import subprocess
+import sys
+
+import pytest
+
+from ciclos import registro
+from ciclos.esquema import Parametro, esquema
+from ciclos.registro import CICLOS_DISPONIBLES, EntradaCiclo
+
+def test_importar_el_registro_no_importa_ciclos_ni_plugins():
+    codigo = ("import sys, ciclos.registro as r; "
+              "print(sorted(m for m in sys.modules if m == 'CoolProp' or m.startswith('ciclos.')), "
+              "'importlib.metadata' in sys.modules, bool(r._grupos_cargados))")
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True,
+                            cwd=registro.__file__.rsplit("ciclos", 1)[0]).stdout.strip()
+    assert salida == "['ciclos.esquema', 'ciclos.registro'] False False"
+
+def test_entrada_resuelve_referencias_al_primer_acceso():
+    entrada = EntradaCiclo("Prueba", esquema(), funcion="math:sqrt", clase="math:floor")
+    assert "funcion" in entrada and not entrada.cargada
+    assert entrada["funcion"](4.0) == 2.0
+    assert entrada.cargada
+    assert "lote" not in entrada
+
+class _PuntoEntrada:
+    def __init__(self, name, objeto):
+        self.name = name
+        self.value = f"prueba:{name}"
+        self._objeto = objeto
+
+    def load(self):
+        if isinstance(self._objeto, Exception):
+            raise self._objeto
+        return self._objeto
+
+@pytest.fixture
+def plugins(monkeypatch):
+    """Entry points simulados: un ciclo válido y uno que falla al cargarse"""
+    entrada = EntradaCiclo("Ciclo de prueba", esquema(Parametro('t', "T", obligatorio=True)),
+                           funcion="math:sqrt", clase="math:floor")
+    puntos = [_PuntoEntrada("Ciclo Prueba", entrada), _PuntoEntrada("Ciclo Roto", ImportError("falta"))]
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: puntos if group == registro.GRUPO_PLUGINS else [])
+    monkeypatch.setattr(registro, "_grupos_cargados", set())
+    yield entrada
+    for nombre in ("Ciclo Prueba", "Ciclo Roto"):
+        dict.pop(CICLOS_DISPONIBLES, nombre, None)
+        registro._validadores.pop(nombre, None)
+
+def test_plugins_se_cargan_al_consultar_un_nombre_desconocido(plugins):
+    assert "Ciclo Prueba" not in list(CICLOS_DISPONIBLES)
+    with pytest.warns(UserWarning, match="Ciclo Roto"):
+        assert CICLOS_DISPONIBLES["Ciclo Prueba"] is plugins
+    assert "Ciclo Roto" not in CICLOS_DISPONIBLES
+    assert registro.cargar_plugins() is False  # Una sola vez por grupo
+    assert registro.obtener_validador("Ciclo Prueba").validar({'t': "3"}) == {'t': 3.0}
+
+def test_nombre_desconocido_sin_plugins(plugins):
+    with pytest.warns(UserWarning):
+        assert CICLOS_DISPONIBLES.get("No existe") is None
+    with pytest.raises(KeyError):
+        CICLOS_DISPONIBLES["No existe"]
+
+def test_registrar_ciclo_rechaza_duplicados_y_entradas_incompletas():
+    with pytest.raises(ValueError, match="Ya hay"):
+        registro.registrar_ciclo("Rankine Simple", CICLOS_DISPONIBLES["Rankine Simple"])
+    with pytest.raises(ValueError, match="funcion, clase"):
+        registro.registrar_ciclo("Incompleto", {'descripcion': "", 'parametros': ()})
@@ -0,0 +1,37 @@
+# Pruebas de los resultados numéricos de los ciclos (ciclos/resultado.py)
+import math
+
+import pytest
+
+from ciclos.registro import CICLOS_DISPONIBLES, obtener_funcion, parametros_por_defecto
+from ciclos.resultado import ResultadoCiclo, unidad_de
+
+@pytest.mark.parametrize("ciclo", list(CICLOS_DISPONIBLES))
+def test_todos_los_ciclos_devuelven_numeros(ciclo):
+    resultado = obtener_funcion(ciclo)(parametros_por_defecto(ciclo))
+    assert isinstance(resultado, ResultadoCiclo)
+    for nombre, valor in resultado.valores.items():
+        assert isinstance(valor, float) and math.isfinite(valor), nombre
+    eficiencia = next(v for k, v in resultado.valores.items() if k.startswith('Eficiencia'))
+    assert 0 < eficiencia < 100
+    for propiedades in resultado.estados.values():
+        assert all(math.isfinite(v) for v in propiedades.values())
+
+def test_a_dict_aplana_valores_y_estados():
+    resultado = ResultadoCiclo("Prueba", {'Eficiencia térmica': 40.0},
+                               {'1': {'p': 80.0, 'h': 3399.0}})
+    assert resultado.a_dict() == {'Eficiencia térmica': 40.0, 'Estado 1 p': 80.0, 'Estado 1 h': 3399.0}
+    assert resultado['Eficiencia térmica'] == 40.0
+
+def test_potencia_objetivo_fija_el_flujo_masico():
+    parametros = {**parametros_por_defecto("Rankine Simple"), 'potencia': 1000.0}
+    resultado = obtener_funcion("Rankine Simple")(parametros)
+    assert resultado['Potencia neta'] == pytest.approx(1000.0)
+    assert resultado['Flujo másico'] == pytest.approx(1000.0 / (resultado['Trabajo turbina'] - resultado['Trabajo bomba']))
+
+@pytest.mark.parametrize("clave, unidad", [
+    ('Eficiencia térmica', '%'), ('Trabajo turbina HP', 'kJ/kg'), ('Potencia neta', 'kW'),
+    ('Relación de trabajos', ''), ('Otra cosa', ''),
+])
+def test_unidades_por_prefijo(clave, unidad):
+    assert unidad_de(clave) == unidad
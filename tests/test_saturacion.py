@@ -0,0 +1,51 @@
+# Pruebas de la tabla de saturación (util/saturacion.py)
+import CoolProp.CoolProp as CP
+import numpy as np
+import pytest
+
+from util.saturacion import obtener_tabla
+
+@pytest.fixture(scope="module")
+def tabla():
+    return obtener_tabla("Water")
+
+def referencia(p_bar, x, salida):
+    return CP.PropsSI(salida, 'P', p_bar * 1e5, 'Q', x, 'Water')
+
+@pytest.mark.parametrize("p_bar", [0.01, 0.08, 1.01325, 10.0, 80.0, 150.0, 215.0])
+def test_saturacion_frente_a_heos(tabla, p_bar):
+    sat = tabla.saturacion(p_bar)
+    assert sat['T'] == pytest.approx(referencia(p_bar, 0, 'T') - 273.15, abs=1e-5)
+    for columna, x, salida, factor in (('hf', 0, 'H', 1e-3), ('hg', 1, 'H', 1e-3),
+                                       ('sf', 0, 'S', 1e-3), ('sg', 1, 'S', 1e-3)):
+        assert sat[columna] == pytest.approx(referencia(p_bar, x, salida) * factor, rel=1e-6), columna
+    assert sat['vg'] == pytest.approx(1 / referencia(p_bar, 1, 'D'), rel=1e-6)
+
+def test_estado_bifasico_por_entropia_y_entalpia(tabla):
+    s = referencia(0.08, 0.85, 'S') / 1000
+    por_s = tabla.estado(0.08, s_kjkgK=s)
+    assert por_s['x'] == pytest.approx(0.85, abs=1e-7)
+    assert por_s['h'] == pytest.approx(referencia(0.08, 0.85, 'H') / 1000, rel=1e-7)
+    assert por_s['rho'] == pytest.approx(referencia(0.08, 0.85, 'D'), rel=1e-6)
+    assert tabla.estado(0.08, h_kjkg=por_s['h'])['x'] == pytest.approx(0.85, abs=1e-7)
+    assert tabla.estado(0.08, x=1.0)['phase'] == 'twophase'
+
+def test_fuera_de_la_campana_o_de_la_tabla(tabla):
+    sobrecalentado = CP.PropsSI('S', 'P', 80e5, 'T', 773.15, 'Water') / 1000
+    assert tabla.estado(80, s_kjkgK=sobrecalentado) is None
+    assert tabla.estado(80, x=1.5) is None
+    assert tabla.saturacion(221.0) is None  # Demasiado cerca del punto crítico
+    assert tabla.saturacion(1e-4) is None   # Por debajo del punto triple
+
+def test_version_vectorizada_coincide_con_la_escalar(tabla):
+    presiones = np.array([0.08, 5.0, 80.0, 221.0])
+    s = np.array([7.0, 6.0, 9.5, 4.4])
+    resultado, validos = tabla.estado_v(presiones, s_kjkgK=s)
+    assert validos.tolist() == [tabla.estado(p, s_kjkgK=v) is not None for p, v in zip(presiones, s)]
+    for k in np.flatnonzero(validos):
+        escalar = tabla.estado(presiones[k], s_kjkgK=s[k])
+        np.testing.assert_allclose(resultado[:, k], [escalar[n] for n in ('h', 's', 'rho', 'T', 'x')], rtol=1e-12)
+
+def test_una_sola_tabla_por_fluido(tabla):
+    assert obtener_tabla("Water") is tabla
+    assert obtener_tabla("Air") is None
@@ -0,0 +1,39 @@
+# Pruebas de la simulación sobre una serie temporal (analisis/serie.py)
+import csv
+import io
+
+import pytest
+
+from analisis.serie import escribir_csv, leer_perfil, simular
+
+BASE = {'p_alta': 80.0, 'p_baja': 0.08, 't_max': 500.0}
+
+def _simular(texto, ciclo, base):
+    salida = io.StringIO()
+    totales = escribir_csv(simular(ciclo, leer_perfil(io.StringIO(texto)), base), salida)
+    return totales, list(csv.DictReader(io.StringIO(salida.getvalue())))
+
+def test_columnas_del_perfil_se_copian_y_no_se_calculan():
+    totales, filas = _simular("fecha,t_max\n2024-01-01,480\n2024-01-02,520\n", "Rankine Simple", BASE)
+    assert totales == (2, 0)
+    assert [f['fecha'] for f in filas] == ['2024-01-01', '2024-01-02']
+    assert float(filas[0]['Eficiencia térmica']) < float(filas[1]['Eficiencia térmica'])
+
+def test_columnas_de_texto_del_esquema_se_aplican():
+    base = {**BASE, 'tipos_calentadores': 'cerrado'}
+    _, filas = _simular('p_extraccion\n10\n20\n', "Rankine Regenerativo", base)
+    assert filas[0]['Fracción extracción 1'] != filas[1]['Fracción extracción 1']
+
+def test_pasos_rechazados_por_el_esquema_llevan_el_error():
+    totales, filas = _simular("t_max,rendimiento_turbina\n500,0.9\n500,1.5\n500,nan\n", "Rankine Simple", BASE)
+    assert totales == (3, 2)
+    assert filas[0]['error'] == ''
+    assert filas[1]['error'].startswith("rendimiento_turbina:")
+    assert filas[2]['error'].startswith("rendimiento_turbina:")
+
+def test_columnas_nuevas_tras_la_cabecera_avisan():
+    base = {**BASE, 'tipos_calentadores': 'cerrado'}
+    with pytest.warns(UserWarning, match="Fracción extracción 2"):
+        _, filas = _simular('p_extraccion,tipos_calentadores\n10,cerrado\n"20,5","cerrado,cerrado"\n',
+                            "Rankine Regenerativo", base)
+    assert filas[1]['error'] == ''
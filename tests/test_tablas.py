@@ -0,0 +1,93 @@
+# Pruebas de las tablas de propiedades y de su formato binario (util/tablas.py)
+import os
+import struct
+
+import CoolProp.CoolProp as CP
+import numpy as np
+import pytest
+
+from util import tablas as modulo
+from util.tablas import TablasFluido, abrir_tablas, guardar_tablas, obtener_tablas
+
+RESOLUCION = (40, 80)
+
+@pytest.fixture(scope="module")
+def tablas_aire():
+    return TablasFluido.construir("Air", RESOLUCION)
+
+def test_interpolacion_cerca_de_heos(tablas_aire):
+    informe = tablas_aire.validar(n_muestras=100)
+    assert all(v['muestras'] > 0 for v in informe.values())
+    assert TablasFluido.error_maximo(informe) < 1e-2
+
+def test_interpolar_escalar_y_vectorizado_coinciden(tablas_aire):
+    tabla = tablas_aire.tablas['t']
+    p = np.array([1.0, 5.0, 20.0, 150.0])
+    t = np.array([25.0, 300.0, 800.0, 1200.0])
+    lote, validos = tabla.interpolar_v(p, t)
+    assert validos.all()
+    for k in range(len(p)):
+        escalar = tabla.interpolar((p[k], t[k], None, None, None))
+        assert lote[0, k] == pytest.approx(escalar['h'], rel=1e-12)
+        assert lote[2, k] == pytest.approx(escalar['rho'], rel=1e-12)
+    h_ref = CP.PropsSI('H', 'P', 20e5, 'T', 1073.15, 'Air') / 1000
+    assert lote[0, 2] == pytest.approx(h_ref, rel=1e-3)
+
+def test_fuera_del_dominio_no_se_interpola(tablas_aire):
+    tabla = tablas_aire.tablas['t']
+    assert tabla.interpolar((1000.0, 25.0, None, None, None)) is None
+    assert tabla.interpolar((-1.0, 25.0, None, None, None)) is None
+    _, validos = tabla.interpolar_v(np.array([1000.0, 1.0]), np.array([25.0, 25.0]))
+    assert validos.tolist() == [False, True]
+
+def test_formato_binario_ida_y_vuelta(tablas_aire, tmp_path):
+    ruta = str(tmp_path / "aire.bin")
+    guardar_tablas(tablas_aire, ruta, RESOLUCION)
+    abiertas = abrir_tablas(ruta, "Air", RESOLUCION)
+    assert abiertas is not None
+    for variable, tabla in tablas_aire.tablas.items():
+        copia = abiertas.tablas[variable]
+        assert np.array_equal(copia.datos, tabla.datos, equal_nan=True)
+        assert np.array_equal(copia.fases, tabla.fases)
+        assert copia.y_lim == tuple(tabla.y_lim)
+        assert isinstance(copia.datos, np.ndarray) and not copia.datos.flags.writeable
+    # Alineación de los bloques
+    with open(ruta, "rb") as f:
+        assert f.read(len(modulo.MAGIA)) == modulo.MAGIA
+    assert os.path.getsize(ruta) % modulo.ALINEACION == 0
+
+@pytest.mark.parametrize("dano", ["magia", "version", "truncado", "cabecera"])
+def test_ficheros_danados_se_rechazan(tablas_aire, tmp_path, dano):
+    ruta = str(tmp_path / "aire.bin")
+    guardar_tablas(tablas_aire, ruta, RESOLUCION)
+    with open(ruta, "r+b") as f:
+        if dano == "magia":
+            f.write(b"XXXXXXXX")
+        elif dano == "version":
+            f.seek(len(modulo.MAGIA))
+            f.write(struct.pack("<I", modulo.VERSION_FORMATO + 1))
+        elif dano == "truncado":
+            f.truncate(os.path.getsize(ruta) // 2)
+        else:
+            f.seek(len(modulo.MAGIA) + 8)
+            f.write(b"{no es json")
+    assert abrir_tablas(ruta, "Air", RESOLUCION) is None
+
+def test_otra_malla_o_fichero_inexistente(tablas_aire, tmp_path):
+    ruta = str(tmp_path / "aire.bin")
+    guardar_tablas(tablas_aire, ruta, RESOLUCION)
+    assert abrir_tablas(ruta, "Air", (41, 80)) is None
+    assert abrir_tablas(ruta, "Water", RESOLUCION) is None
+    assert abrir_tablas(str(tmp_path / "no_existe.bin"), "Air", RESOLUCION) is None
+
+def test_obtener_tablas_persiste_y_reutiliza(monkeypatch, tmp_path):
+    monkeypatch.setenv("SIMULADOR_CICLOS_CACHE", str(tmp_path))
+    monkeypatch.setattr(modulo, "_tablas", {})
+    primeras = obtener_tablas("Air", (16, 16))
+    assert len(os.listdir(tmp_path)) == 1
+    monkeypatch.setattr(modulo, "_tablas", {})
+    monkeypatch.setattr(TablasFluido, "construir", classmethod(lambda cls, *a: pytest.fail("reconstruidas")))
+    segundas = obtener_tablas("Air", (16, 16))
+    assert np.array_equal(segundas.tablas['h'].datos, primeras.tablas['h'].datos, equal_nan=True)
+    with pytest.raises(ValueError, match="No hay tablas"):
+        obtener_tablas("Helium", (16, 16))
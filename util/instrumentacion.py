@@ -0,0 +1,271 @@
+# Instrumentación opcional de las llamadas a propiedades
+# util/instrumentacion.py
+#
+# Uso:
+#   from util.instrumentacion import instrumentacion
+#   with instrumentacion.registrar():
+#       rankine.calcular(parametros)
+#   instrumentacion.imprimir_resumen()
+#
+# Mientras está activa, sustituye PropiedadesTermodinamicas.propiedades_estado y
+# propiedades_estado_v por envoltorios que cuentan y cronometran cada llamada por fluido,
+# par de entrada y origen (caché, tabla de saturación, tablas, gas ideal o flash de
+# CoolProp), con las llamadas a AbstractState.update que hizo, atribuyéndola al ciclo y a
+# la etapa que la hizo. La etapa es el componente del grafo que hizo la llamada (p. ej.
+# "Turbina 4") o, en código de ciclo escrito a mano, el último comentario (p. ej. "# 1-2:
+# Compresión isentrópica") que precede a la línea llamante. La construcción (o carga) de
+# tablas la primera vez que se usan se registra aparte, con origen "construccion", y no
+# se suma al tiempo de la etapa que la provocó. Desactivada no añade ningún coste.
+import importlib
+import json
+import linecache
+import sys
+import time
+from contextlib import contextmanager
+
+from util.propiedades import PropiedadesTermodinamicas, _VARIABLES
+
+_PROFUNDIDAD_MAXIMA = 30
+
+# Funciones que construyen tablas al primer uso: (módulo, función, diccionario en que las
+# guarda el módulo, etapa con que se registran)
+_CONSTRUCCIONES = (
+    ("util.saturacion", "obtener_tabla", "_tablas", "Construcción tabla de saturación"),
+    ("util.tablas", "obtener_tablas", "_tablas", "Construcción tablas de propiedades"),
+    ("util.gas_ideal", "obtener_modelo", "_modelos", "Construcción modelo de gas ideal"),
+)
+
+class _ContadorUpdate:
+    """
+    AbstractState que cuenta sus llamadas a update (los métodos de CoolProp no se pueden
+    sustituir en la clase); el resto de atributos se delegan en el estado original
+    """
+    __slots__ = ('estado', 'updates')
+
+    def __init__(self, estado):
+        self.estado = estado
+        self.updates = 0
+
+    def update(self, *argumentos):
+        self.updates += 1
+        return self.estado.update(*argumentos)
+
+    def __getattr__(self, nombre):
+        return getattr(self.estado, nombre)
+
+def _nombre_par(p_bar, t_c, h_kjkg, s_kjkgK, x):
+    return ",".join(nombre for nombre, valor in zip(_VARIABLES, (p_bar, t_c, h_kjkg, s_kjkgK, x))
+                    if valor is not None)
+
+class Instrumentacion:
+    def __init__(self):
+        self.activa = False
+        self._originales = None
+        self._construcciones = []
+        self._etiquetas = {}
+        # Tiempo acumulado en construcciones de tablas, descontado de la llamada que las provoca
+        self._tiempo_construccion = 0
+        self.limpiar()
+
+    def limpiar(self):
+        """Borrar los registros acumulados"""
+        # (ciclo, etapa, fluido, par, origen) -> [llamadas, estados, tiempo_ns, updates]
+        self.registros = {}
+
+    def _etapa(self, nombre_fichero, linea):
+        """Último comentario antes de la línea llamante dentro de la misma función"""
+        clave = (nombre_fichero, linea)
+        etiqueta = self._etiquetas.get(clave)
+        if etiqueta is None:
+            etiqueta = f"línea {linea}"
+            for numero in range(linea - 1, 0, -1):
+                texto = linecache.getline(nombre_fichero, numero).strip()
+                if texto.startswith("#"):
+                    etiqueta = texto.lstrip("#").strip()
+                    break
+                if texto.startswith("def ") or texto.startswith("class "):
+                    break
+            self._etiquetas[clave] = etiqueta
+        return etiqueta
+
+    def _llamante(self):
+        """
+        (ciclo, etapa) del primer marco de la pila que pertenece a un módulo de ciclos.
+        Si la llamada la hace un componente del grafo, la etapa es el componente y su
+        estado de salida (p. ej. "Turbina 4") y el ciclo se busca más arriba en la pila.
+        Sin módulo de ciclos, (módulo, función) del primer marco fuera de util/.
+        """
+        marco = sys._getframe(1)
+        primero = None
+        etapa = None
+        for _ in range(_PROFUNDIDAD_MAXIMA):
+            if marco is None:
+                break
+            modulo = marco.f_globals.get("__name__", "")
+            if primero is None and not modulo.startswith("util."):
+                primero = marco
+            if modulo == "ciclos.componentes":
+                instancia = marco.f_locals.get("self")
+                if etapa is None and instancia is not None:
+                    etapa = f"{type(instancia).__name__} {instancia.nombre}"
+            elif modulo.startswith("ciclos.") and modulo != "ciclos.grafo":
+                instancia = marco.f_locals.get("self")
+                ciclo = type(instancia).__name__ if instancia is not None else modulo
+                return ciclo, etapa or self._etapa(marco.f_code.co_filename, marco.f_lineno)
+            marco = marco.f_back
+        if primero is None:
+            return "(desconocido)", ""
+        return primero.f_globals.get("__name__", "?"), primero.f_code.co_name
+
+    def _anotar(self, fluido, par, origen, estados, duracion, updates):
+        ciclo, etapa = self._llamante()
+        clave = (ciclo, etapa, fluido, par, origen)
+        registro = self.registros.get(clave)
+        if registro is None:
+            registro = self.registros[clave] = [0, 0, 0, 0]
+        registro[0] += 1
+        registro[1] += estados
+        registro[2] += duracion
+        registro[3] += updates
+
+    def _medir(self, pt, funcion, argumentos):
+        """
+        Ejecutar funcion(pt, *argumentos) contando los update del AbstractState de pt
+        Returns:
+            (resultado, tiempo en ns sin las construcciones de tablas, updates)
+        """
+        estado = pt._estado
+        contador = None if isinstance(estado, _ContadorUpdate) else _ContadorUpdate(estado)
+        if contador is not None:
+            pt._estado = contador
+        construccion = self._tiempo_construccion
+        inicio = time.perf_counter_ns()
+        try:
+            resultado = funcion(pt, *argumentos)
+        finally:
+            duracion = time.perf_counter_ns() - inicio - (self._tiempo_construccion - construccion)
+            if contador is not None:
+                pt._estado = estado
+        return resultado, duracion, contador.updates if contador is not None else 0
+
+    def _envolver_construccion(self, modulo, funcion, nombre_cache, etapa):
+        """Versión de funcion que registra aparte las llamadas que construyen algo nuevo"""
+        instrumentacion = self
+
+        def construir(fluido, *argumentos, **opciones):
+            construidas = len(getattr(modulo, nombre_cache))
+            inicio = time.perf_counter_ns()
+            resultado = funcion(fluido, *argumentos, **opciones)
+            if len(getattr(modulo, nombre_cache)) != construidas:
+                duracion = time.perf_counter_ns() - inicio
+                instrumentacion._tiempo_construccion += duracion
+                ciclo, _ = instrumentacion._llamante()
+                clave = (ciclo, etapa, fluido, "-", "construccion")
+                registro = instrumentacion.registros.setdefault(clave, [0, 0, 0, 0])
+                registro[0] += 1
+                registro[2] += duracion
+            return resultado
+        return construir
+
+    def activar(self):
+        """Empezar a registrar llamadas"""
+        if self.activa:
+            return
+        escalar = PropiedadesTermodinamicas.propiedades_estado
+        vectorial = PropiedadesTermodinamicas.propiedades_estado_v
+        instrumentacion = self
+
+        def propiedades_estado(pt, p_bar=None, t_c=None, h_kjkg=None, s_kjkgK=None, x=None, estimacion=None):
+            pt.origen = None
+            try:
+                resultado, duracion, updates = instrumentacion._medir(
+                    pt, escalar, (p_bar, t_c, h_kjkg, s_kjkgK, x, estimacion))
+            except Exception:
+                instrumentacion._anotar(pt.fluido, _nombre_par(p_bar, t_c, h_kjkg, s_kjkgK, x), "error", 1, 0, 0)
+                raise
+            instrumentacion._anotar(pt.fluido, _nombre_par(p_bar, t_c, h_kjkg, s_kjkgK, x),
+                                    pt.origen or "calculo", 1, duracion, updates)
+            return resultado
+
+        def propiedades_estado_v(pt, p_bar=None, t_c=None, h_kjkg=None, s_kjkgK=None, x=None):
+            resultado, duracion, updates = instrumentacion._medir(pt, vectorial, (p_bar, t_c, h_kjkg, s_kjkgK, x))
+            estados = next(iter(resultado.values())).size
+            instrumentacion._anotar(pt.fluido, _nombre_par(p_bar, t_c, h_kjkg, s_kjkgK, x),
+                                    "lote", estados, duracion, updates)
+            return resultado
+
+        self._construcciones = []
+        for nombre_modulo, nombre_funcion, nombre_cache, etapa in _CONSTRUCCIONES:
+            try:
+                modulo = importlib.import_module(nombre_modulo)
+            except ImportError:
+                continue  # Sin numpy no hay tablas que construir
+            original = getattr(modulo, nombre_funcion)
+            self._construcciones.append((modulo, nombre_funcion, original))
+            setattr(modulo, nombre_funcion, self._envolver_construccion(modulo, original, nombre_cache, etapa))
+
+        self._originales = (escalar, vectorial)
+        PropiedadesTermodinamicas.propiedades_estado = propiedades_estado
+        PropiedadesTermodinamicas.propiedades_estado_v = propiedades_estado_v
+        self.activa = True
+
+    def desactivar(self):
+        """Dejar de registrar y restaurar los métodos originales"""
+        if not self.activa:
+            return
+        PropiedadesTermodinamicas.propiedades_estado, PropiedadesTermodinamicas.propiedades_estado_v = self._originales
+        for modulo, nombre_funcion, original in self._construcciones:
+            setattr(modulo, nombre_funcion, original)
+        self._construcciones = []
+        self._originales = None
+        self.activa = False
+
+    @contextmanager
+    def registrar(self, limpiar=True):
+        """Contexto durante el que se registran las llamadas"""
+        if limpiar:
+            self.limpiar()
+        self.activar()
+        try:
+            yield self
+        finally:
+            self.desactivar()
+
+    def resumen(self):
+        """
+        Filas {ciclo, etapa, fluido, par, origen, llamadas, estados, updates, tiempo_us}, de más
+        a menos tiempo. updates son las llamadas a AbstractState.update hechas por la etapa.
+        """
+        filas = [
+            {'ciclo': ciclo, 'etapa': etapa, 'fluido': fluido, 'par': par, 'origen': origen,
+             'llamadas': llamadas, 'estados': estados, 'updates': updates, 'tiempo_us': tiempo / 1000}
+            for (ciclo, etapa, fluido, par, origen), (llamadas, estados, tiempo, updates) in self.registros.items()
+        ]
+        filas.sort(key=lambda fila: fila['tiempo_us'], reverse=True)
+        return filas
+
+    def imprimir_resumen(self, salida=None):
+        """Tabla de texto con el resumen"""
+        salida = salida or sys.stdout
+        print(f"{'ciclo':<28} {'etapa':<36} {'fluido':<7} {'par':<5} {'origen':<16} "
+              f"{'llamadas':>8} {'estados':>8} {'updates':>8} {'tiempo µs':>11}", file=salida)
+        for fila in self.resumen():
+            print(f"{fila['ciclo']:<28} {fila['etapa'][:36]:<36} {fila['fluido']:<7} {fila['par']:<5} "
+                  f"{fila['origen']:<16} {fila['llamadas']:>8} {fila['estados']:>8} {fila['updates']:>8} "
+                  f"{fila['tiempo_us']:>11.1f}", file=salida)
+
+    def a_json(self):
+        """Resumen como texto JSON"""
+        return json.dumps(self.resumen(), ensure_ascii=False, indent=2)
+
+    def a_flamegraph(self):
+        """Pilas colapsadas ("ciclo;etapa;fluido par;origen microsegundos") para flamegraph.pl/speedscope"""
+        lineas = []
+        for fila in self.resumen():
+            pila = ";".join(parte.replace(";", ",") for parte in
+                            (fila['ciclo'], fila['etapa'], f"{fila['fluido']} {fila['par']}", fila['origen']))
+            lineas.append(f"{pila} {max(1, round(fila['tiempo_us']))}")
+        return "\n".join(lineas)
+
+# Instancia global
+instrumentacion = Instrumentacion()
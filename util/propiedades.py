@@ -1,5 +1,95 @@
 # Funciones para manejo de propiedades con CoolProp
-import CoolProp.CoolProp as CP  # Ensure CoolProp is installed: pip install CoolProp
+from collections import OrderedDict, deque
+import math
+import CoolProp  # Ensure CoolProp is installed: pip install CoolProp
+import CoolProp.CoolProp as CP
+
+# Nombres de fase tal como los devuelve CP.PhaseSI, indexados por el código de AbstractState.phase()
+_NOMBRES_FASE = {
+    CP.get_phase_index(f"phase_{nombre}"): nombre
+    for nombre in ("liquid", "gas", "twophase", "supercritical", "supercritical_gas",
+                   "supercritical_liquid", "critical_point", "unknown", "not_imposed")
+}
+
+# Orden de las variables de entrada de propiedades_estado (p, t, h, s, x)
+_VARIABLES = ('p', 't', 'h', 's', 'x')
+
+def _clave_par(*nombres):
+    """Clave de despacho: qué variables de _VARIABLES vienen informadas"""
+    return tuple(nombre in nombres for nombre in _VARIABLES)
+
+class CachePropiedades:
+    """
+    Caché LRU de estados termodinámicos compartida por todo el proceso.
+    La clave es (backend, fluido, par de entrada, valores cuantizados a la tolerancia),
+    de modo que estados idénticos calculados desde ciclos distintos reutilizan el flash.
+    El backend incluye las opciones de la instancia que cambian cómo se resuelve el estado
+    (ver PropiedadesTermodinamicas.clave_backend).
+    """
+
+    def __init__(self, max_entradas=4096, tolerancia=1e-9):
+        self.max_entradas = max_entradas
+        self.tolerancia = tolerancia
+        self._entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def configurar(self, max_entradas=None, tolerancia=None):
+        """Cambiar el tamaño máximo y/o la tolerancia (vacía la caché si cambia la tolerancia)"""
+        if tolerancia is not None and tolerancia != self.tolerancia:
+            if tolerancia <= 0:
+                raise ValueError("La tolerancia de la caché debe ser positiva")
+            self.tolerancia = tolerancia
+            self._entradas.clear()
+        if max_entradas is not None:
+            if max_entradas < 1:
+                raise ValueError("La caché debe admitir al menos una entrada")
+            self.max_entradas = max_entradas
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+
+    def clave(self, backend, fluido, par, valores):
+        """Construir la clave cuantizando los valores informados a la tolerancia"""
+        tol = self.tolerancia
+        return (backend, fluido, par,
+                tuple(None if v is None else round(v / tol) for v in valores))
+
+    def obtener(self, clave):
+        """Devolver las propiedades guardadas (o None) y actualizar contadores y orden LRU"""
+        props = self._entradas.get(clave)
+        if props is None:
+            self.fallos += 1
+            return None
+        self._entradas.move_to_end(clave)
+        self.aciertos += 1
+        return props
+
+    def guardar(self, clave, props):
+        """Guardar un estado, descartando el menos usado si se supera el límite"""
+        self._entradas[clave] = props
+        self._entradas.move_to_end(clave)
+        if len(self._entradas) > self.max_entradas:
+            self._entradas.popitem(last=False)
+
+    def limpiar(self):
+        """Vaciar la caché y reiniciar los contadores"""
+        self._entradas.clear()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def estadisticas(self):
+        """Resumen de uso de la caché"""
+        consultas = self.aciertos + self.fallos
+        return {
+            'entradas': len(self._entradas),
+            'max_entradas': self.max_entradas,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0
+        }
+
+# Caché por defecto de todas las instancias de PropiedadesTermodinamicas
+cache_propiedades = CachePropiedades()
 
 class PropiedadesTermodinamicas:
     FLUIDOS_DISPONIBLES = [
@@ -8,8 +98,71 @@ class PropiedadesTermodinamicas:
         "Propane", "Ethanol"
     ]
 
-    def __init__(self, fluido="Water"):
-        """Inicializar con el fluido especificado (Water por defecto)"""
+    # Un AbstractState por (backend, fluido), compartido por todas las instancias
+    _estados = {}
+
+    # Con backend="tabular" se interpolan tablas precalculadas (util/tablas.py) y se recurre
+    # a HEOS fuera de su dominio; verificar=True compara una muestra con HEOS y descarta las
+    # tablas si el error relativo supera TOLERANCIA_TABLA
+    BACKEND_TABULAR = "tabular"
+    TOLERANCIA_TABLA = 1e-2
+
+    # Con backend="gas_ideal" los pares (p, t), (p, h) y (p, s) de los gases de
+    # util/gas_ideal.py se evalúan con cp(T) tabulado y la presión en forma cerrada, sin
+    # flash; apropiado para ciclos de aire a presiones moderadas
+    BACKEND_GAS_IDEAL = "gas_ideal"
+
+    # Tabla de despacho del flash: clave de _clave_par -> (par CoolProp, conversión a SI
+    # en el orden que espera CoolProp). Se amplía con registrar_par_entrada.
+    PARES_ENTRADA = {
+        _clave_par('p', 't'): (CoolProp.PT_INPUTS, lambda p, t, h, s, x: (p * 1e5, t + 273.15)),
+        _clave_par('p', 'h'): (CoolProp.HmassP_INPUTS, lambda p, t, h, s, x: (h * 1000, p * 1e5)),
+        _clave_par('p', 's'): (CoolProp.PSmass_INPUTS, lambda p, t, h, s, x: (p * 1e5, s * 1000)),
+        _clave_par('p', 'x'): (CoolProp.PQ_INPUTS, lambda p, t, h, s, x: (p * 1e5, x)),
+        _clave_par('t', 'x'): (CoolProp.QT_INPUTS, lambda p, t, h, s, x: (x, t + 273.15)),
+    }
+
+    # Flashes inversos que pueden arrancar en caliente: par -> (posición de p en la
+    # conversión, propiedad objetivo). HEOS no admite update_with_guesses para estos pares,
+    # así que se resuelven con Newton sobre T a p constante (flashes PT, mucho más baratos)
+    # partiendo de la T de una solución cercana; si no converge se hace el flash normal.
+    PARES_INVERSOS = {
+        CoolProp.HmassP_INPUTS: (1, 'h'),
+        CoolProp.PSmass_INPUTS: (0, 's'),
+    }
+    ITERACIONES_ARRANQUE = 6
+
+    # Soluciones recientes por par que se guardan como posibles estimaciones y distancia
+    # máxima (|Δ ln p| + |Δy| / (|y| + 1000)) para considerar una de ellas cercana
+    SOLUCIONES_RECIENTES = 16
+    DISTANCIA_ESTIMACION = 0.1
+
+    # Estados dentro de la campana que se resuelven con la tabla de saturación
+    # (util/saturacion.py) en lugar de con un flash, en los fluidos que la tienen
+    PARES_SATURACION = (CoolProp.PQ_INPUTS, CoolProp.HmassP_INPUTS, CoolProp.PSmass_INPUTS)
+
+    def __init__(self, fluido="Water", backend="HEOS", cache=cache_propiedades, verificar=False,
+                 arranque_caliente=True, tabla_saturacion=True):
+        """
+        Inicializar con el fluido especificado (Water por defecto)
+        Args:
+            fluido: Nombre del fluido en CoolProp
+            backend: Backend de CoolProp (HEOS por defecto), "tabular" o "gas_ideal"
+            cache: CachePropiedades a usar (la global por defecto, None para desactivarla)
+            verificar: Con backend tabular, validar las tablas contra HEOS al cargarlas
+            arranque_caliente: Resolver los flashes (p, h) y (p, s) partiendo de la solución
+                               más cercana ya calculada por esta instancia
+            tabla_saturacion: Resolver los estados saturados y bifásicos dados por presión
+                              con la tabla de saturación del fluido, si la tiene
+        """
+        self.backend = backend
+        self.cache = cache
+        self.verificar = verificar
+        self.arranque_caliente = arranque_caliente
+        self.tabla_saturacion = tabla_saturacion
+        # Qué resolvió la última llamada a propiedades_estado: "cache", "tabla_saturacion",
+        # "tabular", "gas_ideal" o "flash" (CoolProp)
+        self.origen = None
         self.set_fluido(fluido)
 
     def set_fluido(self, fluido):
@@ -17,8 +170,132 @@ class PropiedadesTermodinamicas:
         if fluido not in self.FLUIDOS_DISPONIBLES:
             raise ValueError(f"Fluido '{fluido}' no soportado. Opciones: {', '.join(self.FLUIDOS_DISPONIBLES)}")
         self.fluido = fluido
+        # Backend en las claves de la caché: instancias con distinta tabla de saturación o
+        # arranque en caliente no comparten entradas (sus resultados difieren en la tolerancia)
+        self.clave_backend = (self.backend, self.tabla_saturacion, self.arranque_caliente)
+        self._tablas = None
+        self._gas_ideal = None
+        self._saturacion = None
+        self._soluciones = {par: deque(maxlen=self.SOLUCIONES_RECIENTES) for par in self.PARES_INVERSOS}
+        self.verificacion = None
+        if self.backend == self.BACKEND_TABULAR:
+            self._cargar_tablas(fluido)
+            self._estado = self._obtener_estado("HEOS", fluido)
+        elif self.backend == self.BACKEND_GAS_IDEAL:
+            from util.gas_ideal import obtener_modelo
+
+            self._gas_ideal = obtener_modelo(fluido)
+            self._estado = self._obtener_estado("HEOS", fluido)
+        else:
+            self._estado = self._obtener_estado(self.backend, fluido)
+        if self.tabla_saturacion and self._gas_ideal is None:
+            from util.saturacion import FLUIDOS
+
+            # La tabla se construye al primer uso (_tabla_saturacion)
+            self._saturacion = False if fluido in FLUIDOS else None
+
+    def _tabla_saturacion(self):
+        """Tabla de saturación del fluido, o None si no se usa"""
+        if self._saturacion is False:
+            from util.saturacion import obtener_tabla
+
+            self._saturacion = obtener_tabla(self.fluido)
+        return self._saturacion
+
+    def _cargar_tablas(self, fluido):
+        """Cargar (o construir) las tablas del fluido y, si se pide, verificarlas contra HEOS"""
+        from util.tablas import obtener_tablas  # numpy solo es necesario con backend tabular
+
+        tablas = obtener_tablas(fluido)
+        if self.verificar:
+            self.verificacion = tablas.validar()
+            if tablas.error_maximo(self.verificacion) > self.TOLERANCIA_TABLA:
+                return  # Tablas demasiado imprecisas: todo se resuelve con HEOS
+        self._tablas = tablas.por_par()
+
+    @classmethod
+    def registrar_par_entrada(cls, nombres, par, conversion):
+        """
+        Registrar una combinación de entradas adicional para propiedades_estado
+        Args:
+            nombres: Variables informadas, subconjunto de ('p', 't', 'h', 's', 'x')
+            par: Constante de par de entrada de CoolProp (p. ej. CoolProp.HmassSmass_INPUTS)
+            conversion: Función (p, t, h, s, x) -> (valor1, valor2) en SI y en el orden de CoolProp
+        """
+        cls.PARES_ENTRADA[_clave_par(*nombres)] = (par, conversion)
+
+    @classmethod
+    def _obtener_estado(cls, backend, fluido):
+        """Devuelve el AbstractState reutilizable para (backend, fluido), creándolo la primera vez"""
+        clave = (backend, fluido)
+        estado = cls._estados.get(clave)
+        if estado is None:
+            estado = CP.AbstractState(backend, fluido)
+            cls._estados[clave] = estado
+        return estado
+
+    def _leer_estado(self):
+        """Leer todas las propiedades del último flash en unidades de la aplicación"""
+        estado = self._estado
+        return {
+            'h': estado.hmass() / 1000,         # kJ/kg
+            's': estado.smass() / 1000,         # kJ/kg-K
+            'rho': estado.rhomass(),            # kg/m³
+            'T': estado.T() - 273.15,           # °C
+            'x': estado.Q(),                    # Título (-1 fuera de la campana)
+            'phase': _NOMBRES_FASE.get(estado.phase(), 'unknown')
+        }
+
+    def _flash_caliente(self, par, valores, t_k):
+        """
+        Flash inverso por Newton sobre T a p constante desde la estimación t_k [K]
+        Returns:
+            True si convergió (el AbstractState queda en la solución)
+        """
+        posicion_p, objetivo = self.PARES_INVERSOS[par]
+        p = valores[posicion_p]
+        y = valores[1 - posicion_p]
+        estado = self._estado
+        try:
+            for _ in range(self.ITERACIONES_ARRANQUE):
+                estado.update(CoolProp.PT_INPUTS, p, t_k)
+                if objetivo == 'h':
+                    paso = (estado.hmass() - y) / estado.cpmass()
+                else:
+                    paso = (estado.smass() - y) * t_k / estado.cpmass()
+                if abs(paso) < 1e-10 * t_k:
+                    return True
+                t_k -= paso
+        except ValueError:
+            pass
+        return False
+
+    def _estimacion(self, par, valores):
+        """T [K] de la solución reciente más cercana a valores, o None si ninguna lo está"""
+        posicion_p, _ = self.PARES_INVERSOS[par]
+        p = valores[posicion_p]
+        y = valores[1 - posicion_p]
+        mejor, distancia_mejor = None, self.DISTANCIA_ESTIMACION
+        for p_sol, y_sol, t_sol in self._soluciones[par]:
+            distancia = abs(math.log(p / p_sol)) + abs(y - y_sol) / (abs(y) + 1000)
+            if distancia < distancia_mejor:
+                mejor, distancia_mejor = t_sol, distancia
+        return mejor
 
-    def propiedades_estado(self, p_bar=None, t_c=None, h_kjkg=None, s_kjkgK=None):
+    def _flash(self, par, valores, t_estimada=None):
+        """Flash de CoolProp, en caliente cuando el par lo permite y hay una estimación"""
+        estado = self._estado
+        inverso = self.arranque_caliente and par in self.PARES_INVERSOS
+        if inverso and t_estimada is None:
+            t_estimada = self._estimacion(par, valores)
+        if t_estimada is None or not self._flash_caliente(par, valores, t_estimada):
+            estado.update(par, *valores)
+        if inverso and not 0.0 <= estado.Q() <= 1.0:
+            # Solo las soluciones monofásicas sirven de estimación para Newton en T
+            posicion_p, _ = self.PARES_INVERSOS[par]
+            self._soluciones[par].append((valores[posicion_p], valores[1 - posicion_p], estado.T()))
+
+    def propiedades_estado(self, p_bar=None, t_c=None, h_kjkg=None, s_kjkgK=None, x=None, estimacion=None):
         """
         Obtener múltiples propiedades en un estado termodinámico
         Args:
@@ -26,39 +303,172 @@ class PropiedadesTermodinamicas:
             t_c: Temperatura en °C
             h_kjkg: Entalpía en kJ/kg
             s_kjkgK: Entropía en kJ/kg-K
-            
+            x: Título de vapor (0 = líquido saturado, 1 = vapor saturado)
+            estimacion: Estado cercano (diccionario con 'T' en °C, p. ej. un resultado
+                        anterior) desde el que arrancar los flashes (p, h) y (p, s); si no se
+                        da, se usa la solución más cercana calculada por esta instancia
+
+        Combinaciones soportadas: (p, t), (p, h), (p, s), (p, x), (t, x) y las
+        añadidas con registrar_par_entrada.
+
         Returns:
-            Diccionario con todas las propiedades calculadas
+            Diccionario con todas las propiedades calculadas (h, s, rho, T, x, phase),
+            obtenidas de un único flash
         """
-        p_pa = p_bar * 1e5 if p_bar is not None else None
-        t_k = t_c + 273.15 if t_c is not None else None
-        h_jkg = h_kjkg * 1000 if h_kjkg is not None else None
-        # s_jkgK = s_kjkgK * 1000 if s_kjkgK is not None else None  # Removed unused variable
+        clave = (p_bar is not None, t_c is not None, h_kjkg is not None,
+                 s_kjkgK is not None, x is not None)
+
+        try:
+            par, conversion = self.PARES_ENTRADA[clave]
+        except KeyError:
+            raise ValueError("Error al calcular propiedades: combinación de entradas no soportada")
+
+        if self._gas_ideal is not None:
+            # Más barato que consultar la caché: no se guarda
+            self.origen = "gas_ideal"
+            try:
+                return self._gas_ideal.propiedades(par, p_bar, t_c if t_c is not None else
+                                                   h_kjkg if h_kjkg is not None else s_kjkgK)
+            except Exception as e:
+                raise ValueError(f"Error al calcular propiedades: {str(e)}")
+
+        cache = self.cache
+        if cache is not None:
+            clave_cache = cache.clave(self.clave_backend, self.fluido, par, (p_bar, t_c, h_kjkg, s_kjkgK, x))
+            props = cache.obtener(clave_cache)
+            if props is not None:
+                self.origen = "cache"
+                return dict(props)
 
-        props = {}
-        
         try:
-            if p_bar is not None and t_c is not None:
-                props.update({
-                    'h': CP.PropsSI('H', 'P', p_pa, 'T', t_k, self.fluido) / 1000,  # kJ/kg
-                    's': CP.PropsSI('S', 'P', p_pa, 'T', t_k, self.fluido) / 1000,  # kJ/kg-K
-                    'rho': CP.PropsSI('D', 'P', p_pa, 'T', t_k, self.fluido),  # kg/m³
-                    'phase': CP.PhaseSI('P', p_pa, 'T', t_k, self.fluido)
-                })
-            elif p_bar is not None and h_kjkg is not None:
-                props.update({
-                    'T': CP.PropsSI('T', 'P', p_pa, 'H', h_jkg, self.fluido) - 273.15,  # °C
-                    's': CP.PropsSI('S', 'P', p_pa, 'H', h_jkg, self.fluido) / 1000,    # kJ/kg-K
-                    'rho': CP.PropsSI('D', 'P', p_pa, 'H', h_jkg, self.fluido),         # kg/m³
-                    'phase': CP.PhaseSI('P', p_pa, 'H', h_jkg, self.fluido)
-                })
-            # Puedes añadir más combinaciones según necesites
-            
-            return props
-            
+            props = None
+            if self._saturacion is not None and par in self.PARES_SATURACION:
+                props = self._tabla_saturacion().estado(p_bar, h_kjkg, s_kjkgK, x)
+                self.origen = "tabla_saturacion"
+            if props is None and self._tablas is not None:
+                tabla = self._tablas.get(par)
+                if tabla is not None:
+                    props = tabla.interpolar((p_bar, t_c, h_kjkg, s_kjkgK, x))
+                    self.origen = "tabular"
+            if props is None:
+                self.origen = "flash"
+                t_estimada = None
+                if estimacion is not None and 0.0 <= estimacion.get('x', -1.0) <= 1.0:
+                    estimacion = None  # Una estimación bifásica no sirve para Newton en T
+                if estimacion is not None:
+                    t_estimada = estimacion['T'] + 273.15
+                self._flash(par, conversion(p_bar, t_c, h_kjkg, s_kjkgK, x), t_estimada)
+                props = self._leer_estado()
+
         except Exception as e:
             raise ValueError(f"Error al calcular propiedades: {str(e)}")
 
+        if cache is not None:
+            cache.guardar(clave_cache, props)
+            return dict(props)
+        return props
+
+    def propiedades_estado_v(self, p_bar=None, t_c=None, h_kjkg=None, s_kjkgK=None, x=None):
+        """
+        Versión vectorizada de propiedades_estado para lotes de estados
+        Args:
+            Los mismos que propiedades_estado, como escalares o arrays de NumPy
+            que se combinan por broadcasting
+
+        Los puntos dentro de la campana se resuelven con la tabla de saturación. Con backend
+        tabular el resto del lote se interpola de una vez y solo los puntos fuera de las
+        celdas válidas se resuelven con HEOS; con gas_ideal todo el lote se evalúa con
+        operaciones de arrays; en otro caso se recorre el lote reutilizando
+        el AbstractState. No usa la caché de estados. Los flashes (p, h) y (p, s) arrancan
+        en caliente desde la solución del elemento anterior del lote, de modo que los
+        barridos en pasos pequeños resuelven cada punto con pocas iteraciones.
+
+        Returns:
+            Diccionario de arrays (h, s, rho, T, x) con la forma del broadcasting;
+            los estados que CoolProp no puede resolver quedan como NaN
+        """
+        import numpy as np  # numpy solo es necesario para la API vectorizada
+
+        clave = (p_bar is not None, t_c is not None, h_kjkg is not None,
+                 s_kjkgK is not None, x is not None)
+        try:
+            par, conversion = self.PARES_ENTRADA[clave]
+        except KeyError:
+            raise ValueError("Error al calcular propiedades: combinación de entradas no soportada")
+
+        entradas = [None if v is None else np.asarray(v, dtype=float) for v in (p_bar, t_c, h_kjkg, s_kjkgK, x)]
+        informadas = [v for v in entradas if v is not None]
+        forma = np.broadcast_shapes(*(v.shape for v in informadas))
+        entradas = [None if v is None else np.broadcast_to(v, forma).ravel() for v in entradas]
+        n = int(np.prod(forma))
+
+        if self._gas_ideal is not None:
+            valor = next((v for v in entradas[1:4] if v is not None), None)
+            try:
+                resultado = self._gas_ideal.propiedades_v(par, entradas[0], valor)
+            except ValueError as e:
+                raise ValueError(f"Error al calcular propiedades: {str(e)}")
+            return {nombre: fila.reshape(forma) for nombre, fila in resultado.items()}
+
+        salidas = ('h', 's', 'rho', 'T', 'x')
+        resultado = np.full((len(salidas), n), np.nan)
+        pendientes = np.ones(n, dtype=bool)
+
+        if self._saturacion is not None and par in self.PARES_SATURACION:
+            saturados, validos = self._tabla_saturacion().estado_v(entradas[0], *entradas[2:])
+            resultado[:, validos] = saturados[:, validos]
+            pendientes = ~validos
+
+        tabla = self._tablas.get(par) if self._tablas is not None else None
+        if tabla is not None and pendientes.any():
+            interpolado, validos = tabla.interpolar_v(entradas[0], entradas[tabla.indice])
+            validos &= pendientes
+            resultado[:, validos] = interpolado[:, validos]
+            pendientes &= ~validos
+
+        if pendientes.any():
+            valor1, valor2 = conversion(*entradas)
+            valor1 = np.broadcast_to(valor1, (n,))
+            valor2 = np.broadcast_to(valor2, (n,))
+            estado = self._estado
+            update = estado.update
+            inverso = self.arranque_caliente and par in self.PARES_INVERSOS
+            t_anterior = None
+            for k in np.flatnonzero(pendientes).tolist():
+                valores = (float(valor1[k]), float(valor2[k]))
+                try:
+                    if t_anterior is None or not self._flash_caliente(par, valores, t_anterior):
+                        update(par, *valores)
+                except ValueError:
+                    t_anterior = None
+                    continue
+                resultado[:, k] = (estado.hmass() / 1000, estado.smass() / 1000,
+                                   estado.rhomass(), estado.T() - 273.15, estado.Q())
+                if inverso:
+                    t_anterior = estado.T() if not 0.0 <= resultado[4, k] <= 1.0 else None
+
+        return {nombre: fila.reshape(forma) for nombre, fila in zip(salidas, resultado)}
+
+    def entalpia_v(self, p_bar, t_c):
+        """Entalpía [kJ/kg] para arrays de presión [bar] y temperatura [°C]"""
+        return self.propiedades_estado_v(p_bar=p_bar, t_c=t_c)['h']
+
+    def entropia_v(self, p_bar, t_c):
+        """Entropía [kJ/kg-K] para arrays de presión [bar] y temperatura [°C]"""
+        return self.propiedades_estado_v(p_bar=p_bar, t_c=t_c)['s']
+
+    def temperatura_v(self, p_bar, h_kjkg):
+        """Temperatura [°C] para arrays de presión [bar] y entalpía [kJ/kg]"""
+        return self.propiedades_estado_v(p_bar=p_bar, h_kjkg=h_kjkg)['T']
+
+    def liquido_saturado(self, p_bar):
+        """Propiedades del líquido saturado a la presión dada"""
+        return self.propiedades_estado(p_bar=p_bar, x=0.0)
+
+    def vapor_saturado(self, p_bar):
+        """Propiedades del vapor saturado a la presión dada"""
+        return self.propiedades_estado(p_bar=p_bar, x=1.0)
+
     # Métodos específicos (pueden usarse como atajos)
     def entalpia(self, p_bar, t_c):
         """Obtener entalpía en kJ/kg"""
@@ -70,4 +480,4 @@ class PropiedadesTermodinamicas:
 
     def temperatura(self, p_bar, h_kjkg):
         """Obtener temperatura en °C"""
-        return self.propiedades_estado(p_bar=p_bar, h_kjkg=h_kjkg)['T']
\ No newline at end of file
+        return self.propiedades_estado(p_bar=p_bar, h_kjkg=h_kjkg)['T']
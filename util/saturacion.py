@@ -0,0 +1,192 @@
+# Tabla de la curva de saturación por presión
+# util/saturacion.py
+#
+# Tsat, hf, hg, sf, sg, vf y vg se calculan una vez por proceso con CoolProp (flashes PQ y
+# sus derivadas a lo largo de la curva) en una malla de presiones, uniforme en ln p y más
+# densa cerca del punto crítico. Entre nodos se interpola con Hermite cúbico en ln p usando
+# las derivadas exactas; el intervalo se localiza por bisección (O(log n)). Con la tabla,
+# un estado saturado o un estado dentro de la campana dado por (p, h) o (p, s) se obtiene
+# sin flash: x = (s - sf) / (sg - sf) y el resto de propiedades por la regla de la palanca.
+import bisect
+import math
+
+import CoolProp
+import CoolProp.CoolProp as CP
+
+# Fluidos con tabla de saturación
+FLUIDOS = ("Water",)
+
+# Nodos uniformes en ln p desde el punto triple, nodos que se acercan geométricamente al
+# punto crítico y fracción de p_crítica por encima de la cual se recurre al flash
+NODOS_LOG = 1200
+NODOS_CRITICO = 200
+FRACCION_CRITICA = 0.995
+
+# Columnas de la tabla, en unidades de la aplicación (T en °C, v en m³/kg)
+COLUMNAS = ('T', 'hf', 'hg', 'sf', 'sg', 'vf', 'vg')
+
+# (parámetro de CoolProp, título del estado en que se evalúa, factor de unidades) por columna
+_ORIGEN = {
+    'T': (CoolProp.iT, 0, 1.0),
+    'hf': (CoolProp.iHmass, 0, 1e-3),
+    'hg': (CoolProp.iHmass, 1, 1e-3),
+    'sf': (CoolProp.iSmass, 0, 1e-3),
+    'sg': (CoolProp.iSmass, 1, 1e-3),
+    'vf': (CoolProp.iDmass, 0, None),
+    'vg': (CoolProp.iDmass, 1, None),
+}
+
+class TablaSaturacion:
+    """
+    Propiedades de saturación de un fluido interpoladas por presión
+    Args:
+        fluido: Nombre del fluido en CoolProp
+        nodos_log, nodos_critico: Nodos de la malla (ver arriba)
+    """
+
+    def __init__(self, fluido, nodos_log=NODOS_LOG, nodos_critico=NODOS_CRITICO):
+        estado = CP.AbstractState("HEOS", fluido)
+        self.fluido = fluido
+        self._coeficientes_v = None
+        p_triple = estado.p_triple() * 1.0001
+        p_critica = estado.p_critical()
+        p_max = FRACCION_CRITICA * p_critica
+
+        # Presiones [Pa]: uniformes en ln p y, desde la mitad de p_crítica, con p_crítica - p
+        # en progresión geométrica hasta (1 - FRACCION_CRITICA) p_crítica
+        presiones = {p_triple * (p_max / p_triple) ** (k / (nodos_log - 1)) for k in range(nodos_log)}
+        d_inicio, d_fin = 0.5 * p_critica, p_critica - p_max
+        presiones.update(p_critica - d_inicio * (d_fin / d_inicio) ** (k / (nodos_critico - 1))
+                         for k in range(nodos_critico))
+        presiones = sorted(presiones)
+
+        self.ln_p = [math.log(p / 1e5) for p in presiones]
+        self.p_limites = (presiones[0] / 1e5, presiones[-1] / 1e5)
+        valores = {columna: [] for columna in COLUMNAS}
+        derivadas = {columna: [] for columna in COLUMNAS}  # d/d(ln p)
+        for p in presiones:
+            for titulo in (0, 1):
+                estado.update(CoolProp.PQ_INPUTS, p, titulo)
+                for columna, (parametro, titulo_columna, factor) in _ORIGEN.items():
+                    if titulo_columna != titulo:
+                        continue
+                    valor = estado.keyed_output(parametro)
+                    derivada = estado.first_saturation_deriv(parametro, CoolProp.iP) * p
+                    if factor is None:
+                        # v = 1 / rho
+                        valor, derivada = 1 / valor, -derivada / valor ** 2
+                    elif columna == 'T':
+                        valor -= 273.15
+                    else:
+                        valor, derivada = valor * factor, derivada * factor
+                    valores[columna].append(valor)
+                    derivadas[columna].append(derivada)
+
+        # Hermite de cada intervalo como polinomio en t = (ln p - ln p_i) / ancho:
+        # por intervalo, (c0, c1, c2, c3) de cada columna seguidos en una sola tupla
+        self._coeficientes = []
+        for i in range(len(presiones) - 1):
+            ancho = self.ln_p[i + 1] - self.ln_p[i]
+            fila = []
+            for columna in COLUMNAS:
+                y0, y1 = valores[columna][i], valores[columna][i + 1]
+                m0, m1 = ancho * derivadas[columna][i], ancho * derivadas[columna][i + 1]
+                fila.extend((y0, m0, 3 * (y1 - y0) - 2 * m0 - m1, 2 * (y0 - y1) + m0 + m1))
+            self._coeficientes.append(tuple(fila))
+
+    def saturacion(self, p_bar):
+        """
+        Propiedades de saturación a p_bar
+        Returns:
+            {columna: valor}, o None si p_bar está fuera de la tabla
+        """
+        if not self.p_limites[0] <= p_bar <= self.p_limites[1]:
+            return None
+        x = math.log(p_bar)
+        ln_p = self.ln_p
+        i = min(max(bisect.bisect_right(ln_p, x) - 1, 0), len(ln_p) - 2)
+        t = (x - ln_p[i]) / (ln_p[i + 1] - ln_p[i])
+        c = self._coeficientes[i]
+        return dict(zip(COLUMNAS, [((c[k + 3] * t + c[k + 2]) * t + c[k + 1]) * t + c[k]
+                                   for k in range(0, 4 * len(COLUMNAS), 4)]))
+
+    def estado(self, p_bar, h_kjkg=None, s_kjkgK=None, x=None):
+        """
+        Estado a p_bar dentro de la campana (0 <= x <= 1) dado por h, s o el título
+        Returns:
+            Diccionario como propiedades_estado, o None si el estado no es bifásico o p_bar
+            está fuera de la tabla (entonces hay que hacer el flash)
+        """
+        sat = self.saturacion(p_bar)
+        if sat is None:
+            return None
+        hf, hg, sf, sg = sat['hf'], sat['hg'], sat['sf'], sat['sg']
+        if x is None:
+            if s_kjkgK is not None:
+                if not sf <= s_kjkgK <= sg:
+                    return None
+                x = (s_kjkgK - sf) / (sg - sf)
+            else:
+                if not hf <= h_kjkg <= hg:
+                    return None
+                x = (h_kjkg - hf) / (hg - hf)
+        elif not 0.0 <= x <= 1.0:
+            return None
+        return {
+            'h': hf + x * (hg - hf) if h_kjkg is None else h_kjkg,
+            's': sf + x * (sg - sf) if s_kjkgK is None else s_kjkgK,
+            'rho': 1 / (sat['vf'] + x * (sat['vg'] - sat['vf'])),
+            'T': sat['T'],
+            'x': x,
+            'phase': 'twophase',
+        }
+
+    def estado_v(self, p_bar, h_kjkg=None, s_kjkgK=None, x=None):
+        """
+        Versión vectorizada de estado para arrays de NumPy de la misma forma (1-D)
+        Returns:
+            (resultado, validos): array (h, s, rho, T, x) x n y máscara de los puntos
+            bifásicos resueltos por la tabla
+        """
+        import numpy as np
+
+        if self._coeficientes_v is None:
+            self._coeficientes_v = np.array(self._coeficientes).reshape(-1, len(COLUMNAS), 4)
+        p_bar = np.asarray(p_bar, dtype=float)
+        ln_p = np.asarray(self.ln_p)
+        validos = (p_bar >= self.p_limites[0]) & (p_bar <= self.p_limites[1])
+        x_p = np.log(np.where(validos, p_bar, self.p_limites[0]))
+        i = np.clip(np.searchsorted(ln_p, x_p, side='right') - 1, 0, len(ln_p) - 2)
+        t = ((x_p - ln_p[i]) / (ln_p[i + 1] - ln_p[i]))[:, None]
+        c = self._coeficientes_v[i]
+        sat = dict(zip(COLUMNAS, (((c[..., 3] * t + c[..., 2]) * t + c[..., 1]) * t + c[..., 0]).T))
+
+        hf, hg, sf, sg, vf, vg = (sat[n] for n in ('hf', 'hg', 'sf', 'sg', 'vf', 'vg'))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if x is not None:
+                titulo = np.broadcast_to(np.asarray(x, dtype=float), p_bar.shape)
+            elif s_kjkgK is not None:
+                titulo = (np.asarray(s_kjkgK, dtype=float) - sf) / (sg - sf)
+            else:
+                titulo = (np.asarray(h_kjkg, dtype=float) - hf) / (hg - hf)
+        validos &= (titulo >= 0.0) & (titulo <= 1.0)
+        resultado = np.array([
+            hf + titulo * (hg - hf) if h_kjkg is None else np.broadcast_to(h_kjkg, p_bar.shape),
+            sf + titulo * (sg - sf) if s_kjkgK is None else np.broadcast_to(s_kjkgK, p_bar.shape),
+            1 / (vf + titulo * (vg - vf)),
+            sat['T'],
+            titulo,
+        ], dtype=float)
+        return resultado, validos
+
+# Tablas construidas en este proceso, por fluido
+_tablas = {}
+
+def obtener_tabla(fluido):
+    """Tabla de saturación de un fluido de FLUIDOS (None para otros), construida una sola vez"""
+    if fluido not in FLUIDOS:
+        return None
+    tabla = _tablas.get(fluido)
+    if tabla is None:
+        tabla = _tablas[fluido] = TablaSaturacion(fluido)
+    return tabla
@@ -0,0 +1,415 @@
+# Tablas de propiedades precalculadas con interpolación bicúbica
+# util/tablas.py
+import hashlib
+import json
+import math
+import os
+import struct
+import tempfile
+import numpy as np
+import CoolProp
+import CoolProp.CoolProp as CP
+
+# Dominio de las tablas por fluido: presión [bar] y temperatura [°C]
+DOMINIOS = {
+    "Water": {'p': (0.01, 250.0), 't': (1.0, 800.0)},
+    "Air": {'p': (0.1, 300.0), 't': (-100.0, 1700.0)},
+}
+
+# Nodos por defecto en (log p, variable de entrada)
+RESOLUCION = (120, 240)
+
+# Propiedades guardadas en cada tabla, en unidades de la aplicación
+SALIDAS = ('h', 's', 'rho', 'T', 'x')
+
+# Par de entrada de CoolProp para construir cada tabla según su segunda variable
+_PAR_CONSTRUCCION = {
+    't': (CoolProp.PT_INPUTS, lambda p, y: (p * 1e5, y + 273.15)),
+    'h': (CoolProp.HmassP_INPUTS, lambda p, y: (y * 1000, p * 1e5)),
+    's': (CoolProp.PSmass_INPUTS, lambda p, y: (p * 1e5, y * 1000)),
+}
+
+# Posición de cada variable en los argumentos (p, t, h, s, x) de propiedades_estado
+_INDICE_VARIABLE = {'t': 1, 'h': 2, 's': 3}
+
+_NOMBRES_FASE = {
+    int(CP.get_phase_index(f"phase_{nombre}")): nombre
+    for nombre in ("liquid", "gas", "twophase", "supercritical", "supercritical_gas",
+                   "supercritical_liquid", "critical_point", "unknown", "not_imposed")
+}
+
+_CODIGO_BIFASICO = int(CP.get_phase_index("phase_twophase"))
+
+def _pesos_catmull_rom(u):
+    """Pesos de la interpolación cúbica (Catmull-Rom) de los 4 nodos vecinos para u en [0, 1)"""
+    u2 = u * u
+    u3 = u2 * u
+    return np.array([
+        0.5 * (-u3 + 2 * u2 - u),
+        0.5 * (3 * u3 - 5 * u2 + 2),
+        0.5 * (-3 * u3 + 4 * u2 + u),
+        0.5 * (u3 - u2)
+    ])
+
+class TablaPropiedades:
+    """
+    Tabla de propiedades sobre una malla uniforme en (log p, y), donde y es t, h o s.
+    Las celdas cuyo entorno bicúbico (4x4 nodos) contiene nodos no calculables o
+    de distinta fase se marcan como no válidas y se resuelven con el flash de referencia.
+    """
+
+    def __init__(self, variable, p_lim, y_lim, datos, fases):
+        """
+        Args:
+            variable: Segunda variable de entrada ('t', 'h' o 's')
+            p_lim: (p_min, p_max) en bar
+            y_lim: (y_min, y_max) en unidades de la aplicación
+            datos: Array (len(SALIDAS), n_p, n_y); rho se guarda como log(rho)
+            fases: Array entero (n_p, n_y) con el código de fase de CoolProp (-1 si falló)
+        """
+        self.variable = variable
+        self.indice = _INDICE_VARIABLE[variable]
+        self.p_lim = p_lim
+        self.y_lim = y_lim
+        self.datos = datos
+        self.fases = fases
+
+        n_p, n_y = fases.shape
+        self._x0 = np.log(p_lim[0])
+        self._dx = (np.log(p_lim[1]) - self._x0) / (n_p - 1)
+        self._y0 = y_lim[0]
+        self._dy = (y_lim[1] - y_lim[0]) / (n_y - 1)
+        self.celdas_validas = self._calcular_celdas_validas()
+
+    def _calcular_celdas_validas(self):
+        """Celda (i, j) válida si sus 16 nodos de interpolación son finitos y de la misma fase"""
+        n_p, n_y = self.fases.shape
+        finitos = np.all(np.isfinite(self.datos[[0, 1, 2, 3]]), axis=0) & (self.fases >= 0)
+        validas = np.zeros((n_p, n_y), dtype=bool)
+        centro = self.fases[1:n_p - 2, 1:n_y - 2]
+        ok = np.ones_like(centro, dtype=bool)
+        for di in range(-1, 3):
+            for dj in range(-1, 3):
+                vecinos = (slice(1 + di, n_p - 2 + di), slice(1 + dj, n_y - 2 + dj))
+                ok &= finitos[vecinos] & (self.fases[vecinos] == centro)
+        validas[1:n_p - 2, 1:n_y - 2] = ok
+        return validas
+
+    @classmethod
+    def construir(cls, fluido, variable, p_lim, y_lim, resolucion=RESOLUCION):
+        """Calcular la tabla con el backend HEOS de CoolProp"""
+        par, conversion = _PAR_CONSTRUCCION[variable]
+        estado = CP.AbstractState("HEOS", fluido)
+        n_p, n_y = resolucion
+        presiones = np.exp(np.linspace(np.log(p_lim[0]), np.log(p_lim[1]), n_p))
+        valores_y = np.linspace(y_lim[0], y_lim[1], n_y)
+
+        datos = np.full((len(SALIDAS), n_p, n_y), np.nan)
+        fases = np.full((n_p, n_y), -1, dtype=np.int8)
+        for i, p in enumerate(presiones):
+            for j, y in enumerate(valores_y):
+                try:
+                    estado.update(par, *conversion(p, y))
+                    datos[:, i, j] = (estado.hmass() / 1000, estado.smass() / 1000,
+                                      np.log(estado.rhomass()), estado.T() - 273.15, estado.Q())
+                    fases[i, j] = int(estado.phase())
+                except ValueError:
+                    pass
+        return cls(variable, p_lim, y_lim, datos, fases)
+
+    def interpolar(self, valores):
+        """
+        Interpolar un estado
+        Args:
+            valores: Tupla (p, t, h, s, x) de propiedades_estado
+        Returns:
+            Diccionario de propiedades o None si el punto cae fuera de las celdas válidas
+        """
+        p_bar = valores[0]
+        y = valores[self.indice]
+        if p_bar <= 0:
+            return None
+        fx = (math.log(p_bar) - self._x0) / self._dx
+        fy = (y - self._y0) / self._dy
+        i = math.floor(fx)
+        j = math.floor(fy)
+        if not (0 <= i < self.celdas_validas.shape[0] and 0 <= j < self.celdas_validas.shape[1]):
+            return None
+        if not self.celdas_validas[i, j]:
+            return None
+
+        bloque = self.datos[:, i - 1:i + 3, j - 1:j + 3]
+        resultado = _pesos_catmull_rom(fx - i) @ bloque @ _pesos_catmull_rom(fy - j)
+        props = dict(zip(SALIDAS, resultado.tolist()))
+        props['rho'] = math.exp(props['rho'])
+        props[self.variable if self.variable != 't' else 'T'] = y
+        props['phase'] = _NOMBRES_FASE.get(int(self.fases[i, j]), 'unknown')
+        if props['phase'] != 'twophase':
+            props['x'] = -1.0
+        return props
+
+    def interpolar_v(self, p_bar, y):
+        """
+        Interpolar un lote de estados
+        Args:
+            p_bar: Array de presiones [bar]
+            y: Array (misma forma) de la segunda variable de la tabla
+        Returns:
+            (resultado, validos): array (len(SALIDAS), n) con rho ya destransformada y x = -1
+            fuera de la campana, y máscara de los puntos resueltos por la tabla
+        """
+        p_bar = np.asarray(p_bar, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        n_p, n_y = self.fases.shape
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fx = (np.log(p_bar) - self._x0) / self._dx
+        fy = (y - self._y0) / self._dy
+        validos = np.isfinite(fx) & np.isfinite(fy)
+        i = np.zeros(p_bar.shape, dtype=np.intp)
+        j = np.zeros(p_bar.shape, dtype=np.intp)
+        i[validos] = np.floor(fx[validos])
+        j[validos] = np.floor(fy[validos])
+        validos &= (i >= 0) & (i < n_p) & (j >= 0) & (j < n_y)
+        validos[validos] = self.celdas_validas[i[validos], j[validos]]
+
+        resultado = np.full((len(SALIDAS), p_bar.size), np.nan)
+        if validos.any():
+            iv, jv = i[validos], j[validos]
+            wx = _pesos_catmull_rom(fx[validos] - iv)
+            wy = _pesos_catmull_rom(fy[validos] - jv)
+            acumulado = np.zeros((len(SALIDAS), iv.size))
+            for a in range(4):
+                for b in range(4):
+                    acumulado += wx[a] * wy[b] * self.datos[:, iv - 1 + a, jv - 1 + b]
+            acumulado[SALIDAS.index('rho')] = np.exp(acumulado[SALIDAS.index('rho')])
+            bifasico = self.fases[iv, jv] == _CODIGO_BIFASICO
+            acumulado[SALIDAS.index('x'), ~bifasico] = -1.0
+            resultado[:, validos] = acumulado
+        resultado[SALIDAS.index(self.variable if self.variable != 't' else 'T')] = y
+        return resultado, validos
+
+class TablasFluido:
+    """Conjunto de tablas (p,t), (p,h) y (p,s) de un fluido"""
+
+    def __init__(self, fluido, tablas):
+        self.fluido = fluido
+        self.tablas = tablas
+
+    @classmethod
+    def construir(cls, fluido, resolucion=RESOLUCION):
+        """Construir las tres tablas; los rangos de h y s se toman de la tabla (p,t)"""
+        if fluido not in DOMINIOS:
+            raise ValueError(f"No hay tablas para '{fluido}'. Opciones: {', '.join(DOMINIOS)}")
+        dominio = DOMINIOS[fluido]
+        tabla_t = TablaPropiedades.construir(fluido, 't', dominio['p'], dominio['t'], resolucion)
+        tablas = {'t': tabla_t}
+        for variable, indice in (('h', 0), ('s', 1)):
+            y_lim = (float(np.nanmin(tabla_t.datos[indice])), float(np.nanmax(tabla_t.datos[indice])))
+            tablas[variable] = TablaPropiedades.construir(fluido, variable, dominio['p'], y_lim, resolucion)
+        return cls(fluido, tablas)
+
+    def por_par(self):
+        """Tablas indexadas por el par de entrada de CoolProp que sustituyen"""
+        return {
+            CoolProp.PT_INPUTS: self.tablas['t'],
+            CoolProp.HmassP_INPUTS: self.tablas['h'],
+            CoolProp.PSmass_INPUTS: self.tablas['s'],
+        }
+
+    def validar(self, n_muestras=500, semilla=0):
+        """
+        Comparar una muestra aleatoria de cada tabla con el flash HEOS de referencia
+        Returns:
+            Diccionario {variable: {'muestras': n, 'error_max': {propiedad: error relativo}}}
+        """
+        generador = np.random.default_rng(semilla)
+        estado = CP.AbstractState("HEOS", self.fluido)
+        informe = {}
+        for variable, tabla in self.tablas.items():
+            par, conversion = _PAR_CONSTRUCCION[variable]
+            errores = {nombre: 0.0 for nombre in ('h', 's', 'rho', 'T')}
+            comprobadas = 0
+            for _ in range(n_muestras):
+                p = float(np.exp(generador.uniform(np.log(tabla.p_lim[0]), np.log(tabla.p_lim[1]))))
+                y = float(generador.uniform(*tabla.y_lim))
+                valores = [p, None, None, None, None]
+                valores[tabla.indice] = y
+                props = tabla.interpolar(valores)
+                if props is None:
+                    continue
+                try:
+                    estado.update(par, *conversion(p, y))
+                except ValueError:
+                    continue
+                referencia = {'h': estado.hmass() / 1000, 's': estado.smass() / 1000,
+                              'rho': estado.rhomass(), 'T': estado.T()}
+                props_k = dict(props, T=props['T'] + 273.15)
+                for nombre, ref in referencia.items():
+                    if ref != 0:
+                        errores[nombre] = max(errores[nombre], abs(props_k[nombre] - ref) / abs(ref))
+                comprobadas += 1
+            informe[variable] = {'muestras': comprobadas, 'error_max': errores}
+        return informe
+
+    @staticmethod
+    def error_maximo(informe):
+        """Mayor error relativo de un informe de validar()"""
+        return max(max(v['error_max'].values()) for v in informe.values())
+
+# --- Almacén persistente en disco -------------------------------------------------
+# Formato binario versionado (little-endian):
+#   MAGIA (8 bytes) | versión uint32 | longitud de cabecera uint32 | cabecera JSON
+#   | relleno hasta ALINEACION | por cada tabla: datos float64 (SALIDAS, n_p, n_y)
+#     seguidos de fases int8 (n_p, n_y), cada bloque alineado a ALINEACION
+# Los bloques se abren con numpy.memmap en solo lectura, de modo que todos los procesos
+# que usan el mismo fichero comparten las páginas en la caché del sistema operativo.
+MAGIA = b"CICLOSTB"
+VERSION_FORMATO = 1
+ALINEACION = 64
+_VARIABLES_TABLA = ('t', 'h', 's')
+
+def directorio_cache():
+    """Directorio de tablas persistentes (SIMULADOR_CICLOS_CACHE o la caché de usuario)"""
+    ruta = os.environ.get("SIMULADOR_CICLOS_CACHE")
+    if not ruta:
+        if os.name == "nt":
+            base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+        else:
+            base = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+        ruta = os.path.join(base, "simulador_ciclos", "tablas")
+    return ruta
+
+def _especificacion(fluido, resolucion):
+    """Descripción de la malla que identifica un fichero de tablas"""
+    return {
+        'fluido': fluido,
+        'coolprop': CP.get_global_param_string("version"),
+        'resolucion': list(resolucion),
+        'dominio': {k: list(v) for k, v in DOMINIOS[fluido].items()},
+        'salidas': list(SALIDAS),
+    }
+
+def ruta_tablas(fluido, resolucion=RESOLUCION):
+    """Fichero de tablas para fluido, versión de CoolProp y malla"""
+    especificacion = _especificacion(fluido, resolucion)
+    huella = hashlib.sha1(json.dumps(especificacion, sort_keys=True).encode()).hexdigest()[:12]
+    nombre = f"{fluido}_cp{especificacion['coolprop']}_{resolucion[0]}x{resolucion[1]}_{huella}.v{VERSION_FORMATO}.bin"
+    return os.path.join(directorio_cache(), nombre)
+
+def _alinear(n):
+    return -(-n // ALINEACION) * ALINEACION
+
+def guardar_tablas(tablas_fluido, ruta, resolucion):
+    """Escribir las tablas en el formato binario (escritura atómica con os.replace)"""
+    n_p, n_y = resolucion
+    bytes_datos = len(SALIDAS) * n_p * n_y * 8
+    bytes_fases = n_p * n_y
+
+    cabecera = dict(_especificacion(tablas_fluido.fluido, resolucion), tablas={})
+    # La cabecera depende de los desplazamientos y estos de su longitud: se reserva espacio fijo
+    inicio = ALINEACION * 64
+    desplazamiento = inicio
+    for variable in _VARIABLES_TABLA:
+        tabla = tablas_fluido.tablas[variable]
+        desplazamiento_fases = _alinear(desplazamiento + bytes_datos)
+        cabecera['tablas'][variable] = {
+            'p_lim': list(tabla.p_lim), 'y_lim': list(tabla.y_lim),
+            'datos': desplazamiento, 'fases': desplazamiento_fases,
+        }
+        desplazamiento = _alinear(desplazamiento_fases + bytes_fases)
+
+    texto = json.dumps(cabecera).encode()
+    preambulo = MAGIA + struct.pack("<II", VERSION_FORMATO, len(texto)) + texto
+    if len(preambulo) > inicio:
+        raise ValueError("Cabecera de tablas demasiado grande")
+
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(preambulo.ljust(inicio, b"\0"))
+            for variable in _VARIABLES_TABLA:
+                tabla = tablas_fluido.tablas[variable]
+                info = cabecera['tablas'][variable]
+                f.seek(info['datos'])
+                f.write(np.ascontiguousarray(tabla.datos, dtype="<f8").tobytes())
+                f.seek(info['fases'])
+                f.write(np.ascontiguousarray(tabla.fases, dtype="i1").tobytes())
+            f.truncate(desplazamiento)
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+def abrir_tablas(ruta, fluido, resolucion):
+    """
+    Abrir un fichero de tablas con numpy.memmap
+    Returns:
+        TablasFluido, o None si el fichero no existe, es de otra versión, no coincide la malla
+        o está incompleto o dañado (entonces se reconstruye)
+    """
+    n_p, n_y = resolucion
+    bytes_datos = len(SALIDAS) * n_p * n_y * 8
+    bytes_fases = n_p * n_y
+    try:
+        with open(ruta, "rb") as f:
+            if f.read(len(MAGIA)) != MAGIA:
+                return None
+            version, longitud = struct.unpack("<II", f.read(8))
+            if version != VERSION_FORMATO:
+                return None
+            cabecera = json.loads(f.read(longitud))
+            tamano = os.fstat(f.fileno()).st_size
+
+        especificacion = _especificacion(fluido, resolucion)
+        if not isinstance(cabecera, dict) or any(cabecera.get(k) != v for k, v in especificacion.items()):
+            return None
+
+        tablas = {}
+        for variable in _VARIABLES_TABLA:
+            info = cabecera['tablas'][variable]
+            # Un fichero truncado no cubre los datos que anuncia la cabecera
+            if info['datos'] + bytes_datos > tamano or info['fases'] + bytes_fases > tamano:
+                return None
+            datos = np.memmap(ruta, dtype="<f8", mode="r", offset=info['datos'],
+                              shape=(len(SALIDAS), n_p, n_y))
+            fases = np.memmap(ruta, dtype="i1", mode="r", offset=info['fases'], shape=(n_p, n_y))
+            tablas[variable] = TablaPropiedades(variable, tuple(info['p_lim']), tuple(info['y_lim']),
+                                                datos.view(np.ndarray), fases.view(np.ndarray))
+    except (OSError, ValueError, TypeError, KeyError, struct.error):
+        return None
+    return TablasFluido(fluido, tablas)
+
+# Tablas cargadas en este proceso, por fluido y malla
+_tablas = {}
+
+def obtener_tablas(fluido, resolucion=RESOLUCION, persistir=True):
+    """
+    Devolver las tablas de un fluido. Se buscan en este orden: en memoria del proceso,
+    en el almacén de disco (memmap) y, si no existen, se construyen y se guardan.
+    """
+    clave = (fluido, tuple(resolucion))
+    if clave in _tablas:
+        return _tablas[clave]
+    if fluido not in DOMINIOS:
+        raise ValueError(f"No hay tablas para '{fluido}'. Opciones: {', '.join(DOMINIOS)}")
+
+    tablas = None
+    if persistir:
+        ruta = ruta_tablas(fluido, resolucion)
+        tablas = abrir_tablas(ruta, fluido, resolucion)
+        if tablas is None:
+            construidas = TablasFluido.construir(fluido, resolucion)
+            try:
+                guardar_tablas(construidas, ruta, resolucion)
+                tablas = abrir_tablas(ruta, fluido, resolucion)
+            except OSError:
+                pass  # Directorio de caché no escribible: se usan las tablas en memoria
+            if tablas is None:
+                tablas = construidas
+    else:
+        tablas = TablasFluido.construir(fluido, resolucion)
+
+    _tablas[clave] = tablas
+    return tablas